@@ -1,10 +1,104 @@
+from dataclasses import dataclass, replace
+
 # Thresholds for pass/fail logic
 LINEARITY_R2_THRESHOLD = 0.7
 HOMOSCEDASTICITY_PVAL_THRESHOLD = 0.05
 NORMALITY_PVAL_THRESHOLD = 0.05
 VIF_THRESHOLD = 5
+INDEPENDENCE_PVAL_THRESHOLD = 0.05
+DURBIN_WATSON_BOUNDS = (1.5, 2.5)  # Rule-of-thumb range for uncorrelated residuals
 
 # Thresholds for diagnostic severity (optional, used for display or flagging)
 R2_SEVERITY_THRESHOLDS = {"high": 0.9, "moderate": 0.7, "low": 0.5}
 PVAL_SEVERITY_THRESHOLDS = {"high": 0.01, "moderate": 0.05, "low": 0.1}
 VIF_SEVERITY_THRESHOLDS = {"high": 10, "moderate": 5, "low": 0}
+
+# Independence check: Ljung-Box over min(INDEPENDENCE_MAX_LAGS, n // 5) lags,
+# with autocorrelations for every lag from one FFT of the residuals
+INDEPENDENCE_MAX_LAGS = 40
+
+# Backend for LinearModelWrapper: "numpy" (one least-squares solve) or
+# "statsmodels" (full results object for inference)
+LINEAR_ENGINE = "numpy"
+
+# Large-sample normality testing: above NORMALITY_LARGE_N residuals, Shapiro-Wilk
+# and Anderson-Darling run on repeated random subsamples, D'Agostino-Pearson is
+# computed from the moments of the full residual vector
+NORMALITY_LARGE_N = 5000
+NORMALITY_SUBSAMPLE_SIZE = 5000
+NORMALITY_SUBSAMPLE_DRAWS = 20
+NORMALITY_SUBSAMPLE_SEED = 0
+
+# Plot rendering: above PLOT_DENSITY_THRESHOLD points, residual scatters become
+# hexbin densities with binned-quantile smoothers and Q-Q plots show
+# PLOT_QQ_POINTS quantiles, so render time and image size stay flat in n
+PLOT_DENSITY_THRESHOLD = 10000
+PLOT_HEXBIN_GRIDSIZE = 60
+PLOT_SMOOTHER_BINS = 30
+PLOT_QQ_POINTS = 1000
+
+# Default image encoding for rendered plots (see app.core.rendering)
+PLOT_FORMAT = "png"
+PLOT_DPI = 100
+
+
+@dataclass(frozen=True)
+class ThresholdProfile:
+    """Pass/fail and severity thresholds used to turn statistics into verdicts."""
+
+    linearity_r2: float
+    homoscedasticity_pval: float
+    normality_pval: float
+    vif: float
+    independence_pval: float
+    durbin_watson_bounds: tuple
+    r2_severity: dict
+    pval_severity: dict
+    vif_severity: dict
+
+
+def get_thresholds(**overrides) -> ThresholdProfile:
+    """
+    Snapshot the module-level thresholds above into a ThresholdProfile.
+
+    Args:
+        **overrides: ThresholdProfile fields to replace, e.g. ``vif=10``.
+
+    Returns:
+        ThresholdProfile: Profile that can be passed to a single run without
+            touching the module-level defaults.
+    """
+    profile = ThresholdProfile(
+        linearity_r2=LINEARITY_R2_THRESHOLD,
+        homoscedasticity_pval=HOMOSCEDASTICITY_PVAL_THRESHOLD,
+        normality_pval=NORMALITY_PVAL_THRESHOLD,
+        vif=VIF_THRESHOLD,
+        independence_pval=INDEPENDENCE_PVAL_THRESHOLD,
+        durbin_watson_bounds=tuple(DURBIN_WATSON_BOUNDS),
+        r2_severity=dict(R2_SEVERITY_THRESHOLDS),
+        pval_severity=dict(PVAL_SEVERITY_THRESHOLDS),
+        vif_severity=dict(VIF_SEVERITY_THRESHOLDS),
+    )
+    return replace(profile, **overrides)
+
+
+# Module-level settings (besides thresholds) that change the raw statistics;
+# every cache key includes their current values (see app.core.cache)
+STATISTICS_SETTINGS = (
+    "INDEPENDENCE_MAX_LAGS",
+    "LINEAR_ENGINE",
+    "NORMALITY_LARGE_N",
+    "NORMALITY_SUBSAMPLE_SIZE",
+    "NORMALITY_SUBSAMPLE_DRAWS",
+    "NORMALITY_SUBSAMPLE_SEED",
+)
+
+
+def get_statistics_settings() -> tuple:
+    """
+    Snapshot the current values of the STATISTICS_SETTINGS.
+
+    Returns:
+        tuple: (name, value) pairs in STATISTICS_SETTINGS order.
+    """
+    return tuple((name, globals()[name]) for name in STATISTICS_SETTINGS)
@@ -0,0 +1,204 @@
+# app/core/batch.py
+"""
+Batch assumption checks for many responses at once.
+
+Responses that share a predictor matrix are fitted together: the design is
+factorized once (thin SVD) and every column of a 2-D y is projected onto it
+with matrix products, so k regressions cost roughly one. The batched
+kernels in homoscedasticity, normality and independence then test all k
+residual columns at once (the Breusch-Pagan auxiliary regressions reuse the
+fit's basis; one FFT along the row axis gives every column's
+autocorrelations).
+Verdicts come from the registered evaluators, so each target passes or
+fails exactly as run_all_checks would judge it.
+"""
+
+from typing import Hashable, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.config import ThresholdProfile, get_thresholds
+from app.core.evaluation import evaluate
+from app.core.homoscedasticity import breusch_pagan_batch
+from app.core.independence import (
+    acf_fft,
+    default_lags,
+    durbin_watson_from_acf,
+    ljung_box,
+)
+from app.core.multicollinearity import compute_vif, max_vif
+from app.core.normality import normality_statistics
+from app.core.registry import ASSUMPTION_CHECKS
+from app.models.linear_model_wrapper import add_constant, column_basis
+
+__all__ = ["run_batch_checks"]
+
+Pair = Tuple[pd.DataFrame, pd.Series]
+
+
+def run_batch_checks(
+    X: Union[pd.DataFrame, pd.Series, Iterable[Pair], Mapping[Hashable, Pair]],
+    Y: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+    thresholds: Optional[ThresholdProfile] = None,
+) -> pd.DataFrame:
+    """
+    Run the linear-model assumption checks for many targets in one call.
+
+    Either pass a shared predictor matrix X with a 2-D Y (one target per
+    column), or pass X alone as a list of (X, y) pairs (or a mapping of
+    labels to pairs). Pairs holding the same X object are fitted together.
+
+    Args:
+        X (pd.DataFrame, pd.Series, list or dict): Shared predictors, or the
+            (X, y) pairs to check.
+        Y (Optional[Union[pd.DataFrame, np.ndarray]], optional): Responses,
+            one per column, with rows aligned to X. Defaults to None (X
+            holds pairs).
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for the
+            pass/fail columns. Defaults to None (the module-level values in
+            app.config).
+
+    Raises:
+        ValueError: If the inputs contain missing values or the rows of X
+            and Y do not line up.
+
+    Returns:
+        pd.DataFrame: One row per target (indexed by Y's column labels, the
+            mapping's keys or the pairs' positions) with r_squared,
+            breusch_pagan_pval, shapiro_pval, dagostino_pval, anderson_stat,
+            durbin_watson, ljung_box_pval, max_variance_inflation_factor (two
+            or more predictors) and a '<check>_passed' column per applicable
+            check (linearity only with one predictor, multicollinearity only
+            with two or more).
+    """
+    thresholds = thresholds or get_thresholds()
+    if Y is not None:
+        if isinstance(Y, pd.Series):
+            Y = Y.to_frame()
+        labels = list(Y.columns) if isinstance(Y, pd.DataFrame) else None
+        return _shared_design_rows(X, Y, labels, thresholds)
+
+    pairs = dict(X) if isinstance(X, Mapping) else dict(enumerate(X))
+
+    # Fit every group of pairs that shares one X object together
+    groups = {}
+    for label, (X_i, y_i) in pairs.items():
+        groups.setdefault(id(X_i), (X_i, []))[1].append((label, y_i))
+
+    frames = []
+    for X_i, members in groups.values():
+        Y_i = np.column_stack([np.asarray(y_i, dtype=float) for _, y_i in members])
+        frames.append(
+            _shared_design_rows(X_i, Y_i, [label for label, _ in members], thresholds)
+        )
+    return pd.concat(frames).loc[list(pairs)]
+
+
+def _shared_design_rows(
+    X: Union[pd.DataFrame, pd.Series],
+    Y: Union[pd.DataFrame, np.ndarray],
+    labels: Optional[List[Hashable]],
+    thresholds: ThresholdProfile,
+) -> pd.DataFrame:
+    """Statistics and verdicts for every column of Y regressed on X."""
+    if isinstance(X, pd.Series):
+        X = X.to_frame()
+    design = add_constant(X)
+    A = np.ascontiguousarray(design.to_numpy(dtype=float))
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    if Y.shape[0] != A.shape[0]:
+        raise ValueError(f"X has {A.shape[0]} rows but the responses have {Y.shape[0]}")
+    if np.isnan(A).any() or np.isnan(Y).any():
+        raise ValueError("Batch checks need complete data; drop or impute NaNs")
+
+    residuals, r_squared, basis = _fit(A, Y)
+    _, bp_pvals = breusch_pagan_batch(residuals, A, basis=basis)
+    normality = _normality(residuals)
+
+    # Residuals keep the row order, so every column's ACF comes from one FFT
+    n = residuals.shape[0]
+    acf = acf_fft(residuals, default_lags(n))
+    lb_stats, lb_pvals = ljung_box(acf, n)
+    dw = durbin_watson_from_acf(residuals, acf)
+
+    p = X.shape[1]
+    shared = {}
+    if p >= 2:
+        # VIFs depend on X only: computed once for every target
+        corr = np.corrcoef(X.to_numpy(dtype=float), rowvar=False)
+        shared["multicollinearity"] = {
+            "vif": dict(zip(X.columns, compute_vif(corr).tolist()))
+        }
+
+    rows = []
+    for j in range(Y.shape[1]):
+        statistics = {"homoscedasticity": {"breusch_pagan_pval": bp_pvals[j]}}
+        if p == 1:
+            statistics["linearity"] = {"r_squared": float(r_squared[j])}
+        statistics["normality"] = normality[j]
+        statistics["independence"] = {
+            "durbin_watson": float(dw[j]),
+            "ljung_box_stat": float(lb_stats[j]),
+            "ljung_box_pval": float(lb_pvals[j]),
+            "ljung_box_lags": acf.shape[0] - 1,
+            "acf_lag1": float(acf[1, j]),
+        }
+        statistics.update(shared)
+
+        row = {"r_squared": float(r_squared[j])}
+        row.update(statistics["homoscedasticity"])
+        row.update(
+            {
+                key: normality[j][key]
+                for key in ("shapiro_pval", "dagostino_pval", "anderson_stat")
+            }
+        )
+        row["durbin_watson"] = statistics["independence"]["durbin_watson"]
+        row["ljung_box_pval"] = statistics["independence"]["ljung_box_pval"]
+        if "multicollinearity" in statistics:
+            row["max_variance_inflation_factor"] = max_vif(
+                statistics["multicollinearity"]["vif"]
+            )
+        for name in ASSUMPTION_CHECKS:
+            if name in statistics:
+                verdict = evaluate(name, statistics[name], thresholds)
+                row[f"{name}_passed"] = verdict["passed"]
+        rows.append(row)
+
+    index = pd.Index(labels if labels is not None else range(Y.shape[1]), name="target")
+    return pd.DataFrame(rows, index=index)
+
+
+def _fit(A: np.ndarray, Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least squares for every column of Y from one thin SVD of A.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (n, k) residuals, R² per
+            column, and the orthonormal basis of A's column space.
+    """
+    basis = column_basis(A)
+
+    # Fitted values are the projection of Y onto the column space
+    residuals = Y - basis @ (basis.T @ Y)
+    centered = Y - Y.mean(axis=0)
+    tss = np.einsum("ij,ij->j", centered, centered)
+    rss = np.einsum("ij,ij->j", residuals, residuals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(tss > 0, 1.0 - rss / tss, np.nan)
+    return residuals, r_squared, basis
+
+
+def _normality(residuals: np.ndarray) -> List[dict]:
+    """Per-column normality statistics from one batched computation."""
+    statistics = normality_statistics(residuals)
+    return [
+        {
+            key: value[j] if isinstance(value, np.ndarray) else value
+            for key, value in statistics.items()
+        }
+        for j in range(residuals.shape[1])
+    ]
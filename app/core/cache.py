@@ -0,0 +1,242 @@
+# app/core/cache.py
+"""
+Opt-in, content-addressed cache for assumption check results.
+
+Keys are derived from a fast hash of the X/y buffers, the model type, the
+selected checks and their versions, the app.config settings that change the
+statistics (app.config.STATISTICS_SETTINGS), the plot flag and the render
+options, so any change to the inputs or to a check's statistics misses. Thresholds are
+deliberately not part of the key: the dispatcher re-derives verdicts from the
+cached raw statistics on every hit (see app.core.evaluation). Values live in
+an in-memory LRU tier backed by an optional on-disk tier with size-based
+eviction.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import get_statistics_settings
+
+__all__ = ["CacheStats", "ResultCache", "make_cache_key"]
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a ResultCache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Two-tier (memory LRU + disk) cache of assumption check results."""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024**2,
+    ):
+        """
+        Args:
+            maxsize (int, optional): Entries kept in the in-memory LRU tier.
+                Defaults to 128.
+            directory (Optional[str], optional): Directory for the on-disk
+                tier. Defaults to None (memory only).
+            max_disk_bytes (int, optional): Size budget for the disk tier;
+                least recently used files are evicted beyond it.
+                Defaults to 512 MiB.
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, checking memory then disk."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return self._memory[key]
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is _MISSING:
+                self.stats.misses += 1
+                return default
+            self.stats.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key in both tiers."""
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers (counters are kept)."""
+        with self._lock:
+            self._memory.clear()
+        for path in self._disk_entries():
+            os.remove(path)
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def _disk_entries(self) -> list:
+        if self.directory is None:
+            return []
+        return [
+            os.path.join(self.directory, f)
+            for f in os.listdir(self.directory)
+            if f.endswith(".pkl")
+        ]
+
+    def _read_disk(self, key: str) -> Any:
+        if self.directory is None:
+            return _MISSING
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+        # Refresh mtime so disk eviction approximates LRU
+        os.utime(path)
+        return value
+
+    def _write_disk(self, key: str, value: Any) -> None:
+        if self.directory is None:
+            return
+        # Write atomically so concurrent readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = []
+        for path in self._disk_entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.stats.evictions += 1
+
+
+def _hash_pandas(h, obj) -> None:
+    """Feed a Series/DataFrame's labels, dtypes, index and buffers into h."""
+    if isinstance(obj, pd.Series):
+        obj = obj.to_frame()
+    h.update(repr((obj.shape, list(obj.columns), list(map(str, obj.dtypes)))).encode())
+
+    index = obj.index
+    if isinstance(index, pd.RangeIndex):
+        h.update(repr((index.start, index.stop, index.step)).encode())
+    else:
+        h.update(pd.util.hash_pandas_object(index, index=False).to_numpy().data)
+
+    for col in obj.columns:
+        values = obj[col].to_numpy()
+        if values.dtype.kind in "biufc":
+            h.update(np.ascontiguousarray(values).data)
+        else:
+            h.update(pd.util.hash_pandas_object(obj[col], index=False).to_numpy().data)
+
+
+def make_cache_key(
+    X: pd.DataFrame,
+    y: pd.Series,
+    model_type: Optional[str],
+    check_versions: Dict[str, int],
+    return_plot: bool = False,
+    scope: str = "run_all_checks",
+    render_options=None,
+) -> str:
+    """
+    Build a content-addressed key for one set of assumption check inputs.
+
+    The current values of app.config.STATISTICS_SETTINGS are always part of
+    the key, so changing one of them misses instead of returning statistics
+    computed under the old value.
+
+    Args:
+        X (pd.DataFrame): Predictor values.
+        y (pd.Series): Response values.
+        model_type (Optional[str]): Model type used for the run.
+        check_versions (Dict[str, int]): Selected check names mapped to the
+            version they were registered with.
+        return_plot (bool, optional): Whether plots are included.
+            Defaults to False.
+        scope (str, optional): Entry point the value belongs to, so cached
+            single results and full runs never collide.
+            Defaults to "run_all_checks".
+        render_options (Optional[RenderOptions], optional): Plot format, DPI
+            and target, when plots are included. Defaults to None.
+
+    Returns:
+        str: Hex digest identifying the inputs.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _hash_pandas(h, X)
+    _hash_pandas(h, y)
+    h.update(
+        repr(
+            (
+                scope,
+                model_type,
+                sorted(check_versions.items()),
+                get_statistics_settings(),
+                bool(return_plot),
+                render_options,
+            )
+        ).encode()
+    )
+    return h.hexdigest()
@@ -0,0 +1,318 @@
+# app/core/calibration.py
+"""
+Monte Carlo calibration of the assumption checks.
+
+Simulates thousands of datasets per (generator, n, p) cell with the
+app.data.simulated_data generators, runs the checks on each and tallies how
+often every check passes. On a generator whose data satisfy an assumption,
+the fail rate is the check's false-positive rate; on one that violates it,
+the fail rate is its power.
+
+Replicates are split into fixed-size chunks that run on a process pool.
+Every chunk draws from its own SeedSequence stream, derived from the root
+seed and the cell's contents (not its position in the sweep), so results do
+not depend on scheduling or on which other cells a sweep includes. Each
+finished chunk is appended as one NDJSON line; re-running with the same
+output file skips the chunks already recorded, so a long sweep can be
+stopped and resumed:
+
+    python -m app.core.calibration --generators linear skewed \\
+        --n 1000 50000 --replicates 5000 --out calibration.ndjson --jobs 8
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.config import ThresholdProfile, get_thresholds
+from app.data.simulated_data import list_simulations
+
+__all__ = [
+    "CalibrationCell",
+    "calibration_grid",
+    "run_calibration",
+    "summarize_calibration",
+]
+
+
+@dataclass(frozen=True)
+class CalibrationCell:
+    """One simulation setting: a generator, a sample size and a feature count."""
+
+    generator: str
+    n_samples: int
+    n_features: Optional[int] = None  # Only for generators taking n_features
+
+
+def _accepts_features(generator: str) -> bool:
+    return "n_features" in inspect.signature(list_simulations()[generator]).parameters
+
+
+def calibration_grid(
+    generators: Iterable[str],
+    n_values: Iterable[int],
+    p_values: Iterable[int] = (),
+) -> List[CalibrationCell]:
+    """
+    Cross generators with sample sizes (and feature counts, where supported).
+
+    Args:
+        generators (Iterable[str]): Names from list_simulations().
+        n_values (Iterable[int]): Sample sizes.
+        p_values (Iterable[int], optional): Feature counts, applied to the
+            generators that accept n_features. Defaults to () (their default).
+
+    Raises:
+        ValueError: If a generator name is unknown.
+
+    Returns:
+        List[CalibrationCell]: Cells in a deterministic order.
+    """
+    simulations = list_simulations()
+    cells = []
+    for generator in generators:
+        if generator not in simulations:
+            raise ValueError(
+                f"Unknown generator: '{generator}'. "
+                f"Choose from {', '.join(simulations)}."
+            )
+        features = list(p_values) if _accepts_features(generator) else []
+        for n in n_values:
+            for p in features or [None]:
+                cells.append(CalibrationCell(generator, n, p))
+    return cells
+
+
+def run_calibration(
+    cells: Iterable[CalibrationCell],
+    path: str,
+    replicates: int = 1000,
+    chunk_size: int = 100,
+    seed: int = 0,
+    n_jobs: Optional[int] = None,
+    checks: Optional[Iterable[str]] = None,
+    thresholds: Optional[ThresholdProfile] = None,
+) -> pd.DataFrame:
+    """
+    Run (or resume) a calibration sweep and summarize it.
+
+    Args:
+        cells (Iterable[CalibrationCell]): Settings to simulate.
+        path (str): NDJSON file that chunk results are appended to; chunks
+            already recorded there are skipped.
+        replicates (int, optional): Simulated datasets per cell.
+            Defaults to 1000.
+        chunk_size (int, optional): Replicates per task (and per output
+            line). Defaults to 100.
+        seed (int, optional): Root seed of every stream. Defaults to 0.
+        n_jobs (Optional[int], optional): Worker processes; 1 runs in this
+            process. Defaults to None (the pool's own default).
+        checks (Optional[Iterable[str]], optional): Subset of checks to run.
+            Defaults to None (all linear-model checks).
+        thresholds (Optional[ThresholdProfile], optional): Thresholds to
+            judge against; recorded in the file, like the other settings.
+            Defaults to None (app.config).
+
+    Raises:
+        ValueError: If path holds a sweep run with different settings, or a
+            cell asks for features its generator does not take.
+
+    Returns:
+        pd.DataFrame: summarize_calibration(path).
+    """
+    cells = list(cells)
+    for cell in cells:
+        if cell.n_features is not None and not _accepts_features(cell.generator):
+            raise ValueError(f"Generator '{cell.generator}' has a fixed feature count")
+    checks = sorted(checks) if checks is not None else None
+    thresholds = thresholds or get_thresholds()
+    meta = {
+        "seed": seed,
+        "replicates": replicates,
+        "chunk_size": chunk_size,
+        "checks": checks,
+        "thresholds": asdict(thresholds),
+    }
+    done = _prepare_output(path, meta)
+
+    # One stream per cell, split into one per chunk in a fixed order
+    n_chunks = -(-replicates // chunk_size)
+    tasks = []
+    for cell in cells:
+        for chunk, chunk_stream in enumerate(_cell_stream(seed, cell).spawn(n_chunks)):
+            if (_cell_key(asdict(cell)), chunk) in done:
+                continue
+            size = min(chunk_size, replicates - chunk * chunk_size)
+            tasks.append((cell, chunk, chunk_stream, size, checks, thresholds))
+
+    with open(path, "a", encoding="utf-8") as out:
+        if n_jobs == 1:
+            for task in tasks:
+                _write_line(out, _run_chunk(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                futures = [pool.submit(_run_chunk, *task) for task in tasks]
+                for future in as_completed(futures):
+                    _write_line(out, future.result())
+
+    return summarize_calibration(path)
+
+
+def _cell_key(record: dict) -> Tuple:
+    return record["generator"], record["n_samples"], record["n_features"]
+
+
+def _cell_stream(seed: int, cell: CalibrationCell) -> np.random.SeedSequence:
+    """Stream keyed by the cell's contents, so adding cells changes no other."""
+    text = f"{cell.generator}|{cell.n_samples}|{cell.n_features or 0}"
+    digest = hashlib.sha256(text.encode()).digest()
+    words = np.frombuffer(digest, dtype=np.uint32).tolist()
+    return np.random.SeedSequence([seed, *words])
+
+
+def _prepare_output(path: str, meta: dict) -> Set[Tuple]:
+    """
+    Validate an existing output file and list its finished chunks, or start
+    a new one with a header line.
+    """
+    meta = json.loads(json.dumps(meta))  # Tuples become lists, as when read back
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"meta": meta}) + "\n")
+        return set()
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if not text.endswith("\n"):
+        # Drop a line cut short by an interrupted write
+        text = text[: text.rfind("\n") + 1]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    lines = [json.loads(line) for line in text.splitlines() if line]
+    if not lines or lines[0].get("meta") != meta:
+        raise ValueError(
+            f"{path} holds a calibration run with different settings; "
+            "use a new output file"
+        )
+    return {(_cell_key(line), line["chunk"]) for line in lines[1:]}
+
+
+def _write_line(out, record: dict) -> None:
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+
+def _run_chunk(
+    cell: CalibrationCell,
+    chunk: int,
+    stream: np.random.SeedSequence,
+    size: int,
+    checks: Optional[List[str]],
+    thresholds: Optional[ThresholdProfile],
+) -> dict:
+    """Simulate and check one chunk of replicates; return its tallies."""
+    from app.core.dispatcher import run_all_checks
+
+    generate = list_simulations()[cell.generator]
+    kwargs = {"n_samples": cell.n_samples}
+    if cell.n_features is not None:
+        kwargs["n_features"] = cell.n_features
+
+    tallies: Dict[str, Dict[str, int]] = {}
+    for replicate in stream.spawn(size):
+        df = generate(seed=replicate, **kwargs)
+        results, _ = run_all_checks(
+            df.drop(columns="y"),
+            df["y"],
+            model_type="linear",
+            checks=checks,
+            thresholds=thresholds,
+            keep_arrays=False,
+        )
+        for name, result in results.items():
+            if result.statistics is None:
+                continue  # Not applicable to this design (e.g. one predictor)
+            tally = tallies.setdefault(name, {"runs": 0, "passes": 0})
+            tally["runs"] += 1
+            tally["passes"] += int(bool(result.passed))
+
+    return {**asdict(cell), "chunk": chunk, "replicates": size, "checks": tallies}
+
+
+def summarize_calibration(path: str) -> pd.DataFrame:
+    """
+    Aggregate the chunk lines of a calibration file into pass rates.
+
+    Args:
+        path (str): File written by run_calibration().
+
+    Returns:
+        pd.DataFrame: One row per cell and check with runs, passes,
+            pass_rate, fail_rate and the binomial std_error of the rates.
+    """
+    totals: Dict[Tuple, Dict[str, int]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "meta" in record:
+                continue
+            for name, tally in record["checks"].items():
+                total = totals.setdefault(
+                    (*_cell_key(record), name), {"runs": 0, "passes": 0}
+                )
+                total["runs"] += tally["runs"]
+                total["passes"] += tally["passes"]
+
+    columns = ["generator", "n_samples", "n_features", "check", "runs", "passes"]
+    frame = pd.DataFrame(
+        [(*key, t["runs"], t["passes"]) for key, t in totals.items()], columns=columns
+    )
+    # Nullable ints: cells without a feature count stay <NA>, not float NaN
+    frame["n_features"] = frame["n_features"].astype("Int64")
+    frame["pass_rate"] = frame["passes"] / frame["runs"]
+    frame["fail_rate"] = 1.0 - frame["pass_rate"]
+    frame["std_error"] = np.sqrt(
+        frame["pass_rate"] * frame["fail_rate"] / frame["runs"]
+    )
+    return frame.sort_values(columns[:4], na_position="first").reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate the assumption checks.")
+    parser.add_argument(
+        "--generators",
+        nargs="+",
+        choices=list_simulations().keys(),
+        default=list(list_simulations()),
+    )
+    parser.add_argument("--n", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--p", type=int, nargs="+", default=[])
+    parser.add_argument("--replicates", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--checks", nargs="+", default=None)
+    parser.add_argument("--out", default="calibration.ndjson")
+    args = parser.parse_args()
+
+    summary = run_calibration(
+        calibration_grid(args.generators, args.n, args.p),
+        args.out,
+        replicates=args.replicates,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        n_jobs=args.jobs,
+        checks=args.checks,
+    )
+    print(summary.to_string(index=False))
@@ -0,0 +1,225 @@
+# app/core/context.py
+"""
+Per-run fit context shared by every assumption check.
+
+Each intermediate (design matrix, QR/Cholesky factors, residuals, fitted
+values, leverage, correlation matrix) is computed lazily on first access
+and then cached for the rest of the run.
+"""
+
+from functools import cached_property, wraps
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.profiling import phase
+from app.core.types import RunArrays
+from app.models.base_model_wrapper import BaseModelWrapper
+from app.utils import PlotRegistry
+
+__all__ = [
+    "FitContext",
+    "INTERMEDIATE_DEPENDENCIES",
+    "plan_intermediates",
+    "resolve_context",
+]
+
+# Intermediates a check may declare, mapped to the intermediates they are built from
+INTERMEDIATE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "model_wrapper": (),
+    "design_matrix": ("model_wrapper",),
+    "qr": ("design_matrix",),
+    "cholesky": ("qr",),
+    "basis": ("qr",),
+    "leverage": ("qr",),
+    "residuals": ("model_wrapper",),
+    "fitted": ("model_wrapper",),
+    "sorted_residuals": ("residuals",),
+    "arrays": ("residuals", "fitted"),
+    "correlation": (),
+}
+
+
+def _intermediate(build):
+    """cached_property whose first (building) access is profiled as 'fit'."""
+
+    @wraps(build)
+    def timed(self):
+        with phase("fit"):
+            return build(self)
+
+    return cached_property(timed)
+
+
+class FitContext:
+    """Lazily computed, run-scoped intermediates derived from X, y and the model."""
+
+    def __init__(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        model_wrapper: Optional[BaseModelWrapper] = None,
+        keep_arrays: bool = True,
+    ):
+        if isinstance(X, pd.Series):
+            X = X.to_frame()
+        self.X = X
+        self.y = y
+        self._model_wrapper = model_wrapper
+        # Summary-only runs never build the per-row RunArrays
+        self.keep_arrays = keep_arrays
+        # Encoded figures shared between the run's checks
+        self.plots = PlotRegistry()
+
+    @_intermediate
+    def model_wrapper(self) -> BaseModelWrapper:
+        """Fitted model wrapper; fit on first use if none was supplied."""
+        if self._model_wrapper is None:
+            from app.models.utils import get_model_wrapper
+
+            return get_model_wrapper("linear", self.X, self.y)
+        return self._model_wrapper
+
+    @_intermediate
+    def design_matrix(self) -> pd.DataFrame:
+        """Predictors with a leading constant column (reused from the wrapper)."""
+        design = getattr(self.model_wrapper, "design", None)
+        if design is None:
+            from app.models.linear_model_wrapper import add_constant
+
+            design = add_constant(self.X)
+        return design
+
+    @_intermediate
+    def qr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Reduced QR factors (Q, R) of the design matrix."""
+        return np.linalg.qr(np.asarray(self.design_matrix, dtype=float))
+
+    @_intermediate
+    def cholesky(self) -> np.ndarray:
+        """Lower-triangular L with X'X = LL', derived from the QR factor R."""
+        _, R = self.qr
+        signs = np.sign(np.diag(R))
+        signs[signs == 0] = 1.0
+        return (signs[:, None] * R).T
+
+    @_intermediate
+    def basis(self) -> np.ndarray:
+        """
+        Orthonormal basis of the design's column space: Q when the design
+        has full column rank, otherwise a thin SVD (like column_basis).
+        """
+        Q, R = self.qr
+        diagonal = np.abs(np.diag(R))
+        if (
+            len(diagonal)
+            and diagonal.min() > np.sqrt(np.finfo(float).eps) * diagonal.max()
+        ):
+            return Q
+
+        # Near-dependent columns: Q would span spurious directions
+        from app.models.linear_model_wrapper import column_basis
+
+        return column_basis(self.design_matrix)
+
+    @_intermediate
+    def residuals(self):
+        """Model residuals."""
+        return self.model_wrapper.residuals()
+
+    @_intermediate
+    def fitted(self):
+        """Model fitted values."""
+        return self.model_wrapper.fitted()
+
+    @_intermediate
+    def arrays(self) -> Optional[RunArrays]:
+        """
+        Residuals and fitted values as one shared, Series-free RunArrays;
+        None when the context was created with keep_arrays=False.
+        """
+        if not self.keep_arrays:
+            return None
+        return RunArrays.from_values(self.residuals, self.fitted)
+
+    @_intermediate
+    def leverage(self) -> np.ndarray:
+        """Diagonal of the hat matrix, computed from Q without forming H."""
+        Q, _ = self.qr
+        return np.einsum("ij,ij->i", Q, Q)
+
+    @_intermediate
+    def sorted_residuals(self) -> np.ndarray:
+        """Residuals sorted ascending (for quantile-based diagnostics)."""
+        return np.sort(np.asarray(self.residuals, dtype=float))
+
+    @_intermediate
+    def correlation(self) -> pd.DataFrame:
+        """Pearson correlation matrix of the predictors."""
+        values = self.X.to_numpy(dtype=float)
+        if np.isnan(values).any():
+            # Pairwise-complete correlations only pandas handles
+            return self.X.corr()
+
+        # Single BLAS pass; zero-variance columns become NaN like X.corr()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.corrcoef(values, rowvar=False).reshape(
+                values.shape[1], values.shape[1]
+            )
+        return pd.DataFrame(corr, index=self.X.columns, columns=self.X.columns)
+
+
+def plan_intermediates(requires: Iterable[str]) -> List[str]:
+    """
+    Expand declared intermediates into a dependency-ordered build plan.
+
+    Args:
+        requires (Iterable[str]): Intermediates requested by the checks to run.
+
+    Raises:
+        ValueError: If an intermediate is not provided by FitContext.
+
+    Returns:
+        List[str]: Every needed intermediate (including transitive
+            dependencies), each listed after the ones it is built from.
+    """
+    plan: List[str] = []
+
+    def visit(key: str) -> None:
+        if key not in INTERMEDIATE_DEPENDENCIES:
+            raise ValueError(f"Unknown intermediate: '{key}'")
+        if key in plan:
+            return
+        for dependency in INTERMEDIATE_DEPENDENCIES[key]:
+            visit(dependency)
+        plan.append(key)
+
+    for key in requires:
+        visit(key)
+    return plan
+
+
+def resolve_context(
+    X: pd.DataFrame,
+    y: pd.Series,
+    model_wrapper: Optional[BaseModelWrapper] = None,
+    context: Optional[FitContext] = None,
+) -> FitContext:
+    """
+    Return the shared context if one was passed, otherwise build a fresh one.
+
+    Args:
+        X (pd.Series or pd.DataFrame): Predictor values (1D or multivariate)
+        y (pd.Series): Response (1D)
+        model_wrapper (Optional[BaseModelWrapper], optional): Pre-fit model.
+            Defaults to None.
+        context (Optional[FitContext], optional): Context created by the
+            dispatcher for the current run. Defaults to None.
+
+    Returns:
+        FitContext: Context to read intermediates from.
+    """
+    if context is not None:
+        return context
+    return FitContext(X, y, model_wrapper=model_wrapper)
@@ -1,22 +1,57 @@
 # app/core/dispatcher.py
-from typing import Dict, Tuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
+from dataclasses import replace
+from functools import partial
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
 
 import pandas as pd
 
+from app.config import ThresholdProfile
 from app.core import homoscedasticity  # noqa: F401
+from app.core import independence  # noqa: F401
 from app.core import linearity  # noqa: F401
 from app.core import multicollinearity  # noqa: F401
 from app.core import normality  # noqa: F401
+from app.core.cache import ResultCache, make_cache_key
+from app.core.context import INTERMEDIATE_DEPENDENCIES, FitContext, plan_intermediates
+from app.core.evaluation import rethreshold, rethreshold_result
+from app.core.profiling import (
+    RUN_PROFILE,
+    Callback,
+    Profiler,
+    notify,
+    profile_call,
+    profile_mode,
+    tracing,
+)
 from app.core.registry import ASSUMPTION_CHECKS
+from app.core.rendering import PlotRenderer, RenderOptions, resolve_plots
 from app.core.types import AssumptionResult
 from app.models.base_model_wrapper import BaseModelWrapper
 from app.models.utils import get_model_wrapper
 
-__all__ = ["check_assumption", "run_all_checks"]
+__all__ = ["EXECUTORS", "check_assumption", "run_all_checks"]
+
+# Supported strategies for running the registered checks of a single run
+EXECUTORS = ("serial", "thread", "process")
 
 
 def check_assumption(
-    name: str, X: pd.Series, y: pd.Series, return_plot: bool = False
+    name: str,
+    X: pd.Series,
+    y: pd.Series,
+    return_plot: bool = False,
+    cache: Optional[ResultCache] = None,
+    thresholds: Optional[ThresholdProfile] = None,
+    profile: Union[bool, str] = False,
+    callbacks: Optional[Iterable[Callback]] = None,
 ) -> AssumptionResult:
     """
     Run the specified assumption check by name.
@@ -27,6 +62,17 @@ def check_assumption(
         y (pd.Series): Response (1D)
         return_plot (bool, optional): Whether to return base64-encoded
             PNG of the plot. Defaults to False.
+        cache (Optional[ResultCache], optional): Cache to read from and
+            populate. Defaults to None (no caching).
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            call. Defaults to None (the module-level values in app.config).
+        profile (Union[bool, str], optional): Record wall/CPU time and peak
+            allocation per phase (fit, statistics, plotting, encoding) on the
+            result's ``profile``; 'time' skips allocation tracing, which
+            inflates timings. Cache hits are not profiled. Defaults to False.
+        callbacks (Optional[Iterable[Callable[[str, dict], None]]], optional):
+            Called with (name, profile) once the check has run with
+            profile=True. Defaults to None.
 
     Returns:
         AssumptionResult: An object containing the outcome of the
@@ -40,34 +86,364 @@ def check_assumption(
     if isinstance(X, pd.Series):
         X = X.to_frame()
 
-    return ASSUMPTION_CHECKS[name](X, y, return_plot)
+    func = ASSUMPTION_CHECKS[name]
+    mode = profile_mode(profile)
+
+    def run():
+        if mode is None:
+            return func(X, y, return_plot, thresholds=thresholds)
+        result = _profile_check(func, mode, X, y, return_plot, thresholds=thresholds)
+        notify(callbacks, name, result.profile)
+        return result
+
+    if cache is None:
+        return run()
+
+    key = make_cache_key(
+        X,
+        y,
+        "linear",
+        {name: getattr(func, "_version", 1)},
+        return_plot,
+        scope="check_assumption",
+    )
+    result = cache.get(key)
+    if result is None:
+        result = run()
+        # Profiles describe one call; never replay them from the cache
+        cache.put(key, replace(result, profile=None))
+        return result
+    return rethreshold_result(result, thresholds)
 
 
 def run_all_checks(
-    X: pd.Series, y: pd.Series, model_type=None, return_plot: bool = False
+    X: pd.Series,
+    y: pd.Series,
+    model_type=None,
+    return_plot: bool = False,
+    executor: str = "serial",
+    max_workers: Optional[int] = None,
+    checks: Optional[Iterable[str]] = None,
+    cache: Optional[ResultCache] = None,
+    thresholds: Optional[ThresholdProfile] = None,
+    render_options: Optional[RenderOptions] = None,
+    renderer: Optional[PlotRenderer] = None,
+    keep_arrays: bool = True,
+    profile: Union[bool, str] = False,
+    callbacks: Optional[Iterable[Callback]] = None,
 ) -> Tuple[Dict[str, AssumptionResult], BaseModelWrapper]:
     """
     Run all registered assumption checks and return a dictionary of results.
 
+    Intermediates declared by the selected checks (see register_assumption's
+    ``requires``) are built once on a shared FitContext; anything no selected
+    check needs is never computed.
+
     Args:
         X (pd.Series or pd.DataFrame): Predictor values (1D or multivariate)
         y (pd.Series): Response (1D)
         return_plot (bool, optional): Whether to return base64-encoded
             PNG of the plot. Defaults to False.
+        executor (str, optional): How to run the checks: 'serial', 'thread'
+            or 'process'. With either pool, plots are drawn on a renderer
+            process pool, so pyplot is never used from threads.
+            Defaults to 'serial'.
+        max_workers (Optional[int], optional): Worker count for the thread
+            or process pool. Defaults to None (the pool's own default).
+        checks (Optional[Iterable[str]], optional): Subset of registered
+            checks to run. Defaults to None (all checks for model_type).
+        cache (Optional[ResultCache], optional): Cache to read from and
+            populate; a hit skips the model fit and every check.
+            Defaults to None (no caching).
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run, so concurrent runs can use different profiles. Cached
+            results are re-judged against them. Defaults to None (the
+            module-level values in app.config).
+        render_options (Optional[RenderOptions], optional): Plot format, DPI
+            and output target. Defaults to None (the plot settings in
+            app.config: base64-encoded PNG).
+        renderer (Optional[PlotRenderer], optional): Long-lived renderer pool
+            to draw plots on; its own options apply. Defaults to None: plots
+            are drawn inline with 'serial' and on a per-run renderer pool
+            with the pooled executors.
+        keep_arrays (bool, optional): Keep the per-row residuals and fitted
+            values (one RunArrays shared by all results). False gives
+            summary-only results that are much smaller to cache or
+            serialize; the RunArrays is then never built, so it is not held
+            in memory during the run either. Defaults to True.
+        profile (Union[bool, str], optional): Record wall/CPU time and peak
+            allocation per phase (fit, statistics, plotting, encoding) on each
+            result's ``profile``; 'time' skips allocation tracing, which
+            inflates timings. Intermediates shared by the checks are built, and
+            pooled plot rendering is awaited, outside any one check; that
+            work is reported as a separate run-level profile. Cache hits are
+            not profiled. Defaults to False.
+        callbacks (Optional[Iterable[Callable[[str, dict], None]]], optional):
+            With profile=True, called with (check name, profile) for every
+            check and then with ('run', run-level profile), e.g. to forward
+            timings to a metrics system. Defaults to None.
 
     Returns:
         Dict[str, AssumptionResult]: A dictionary of assumption names
-            mapped to their result objects.
+            mapped to their result objects, in registry order.
     """
-    results = {}
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unsupported executor: '{executor}'. Choose from {', '.join(EXECUTORS)}."
+        )
+    if checks is not None:
+        checks = set(checks)
+        unknown = checks - set(ASSUMPTION_CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown assumption: '{sorted(unknown)[0]}'")
 
     if isinstance(X, pd.Series):
         X = X.to_frame()
 
-    model_wrapper = get_model_wrapper(model_type, X, y)
+    # Keep registry order so reports render checks in a stable sequence
+    selected = {
+        name: func
+        for name, func in ASSUMPTION_CHECKS.items()
+        if model_type in getattr(func, "_model_types", ["linear"])
+        and (checks is None or name in checks)
+    }
+
+    key = None
+    if cache is not None:
+        key = make_cache_key(
+            X,
+            y,
+            model_type,
+            {name: getattr(func, "_version", 1) for name, func in selected.items()},
+            return_plot,
+            scope="run_all_checks" if keep_arrays else "run_all_checks:summary",
+            render_options=(
+                (renderer.options if renderer else render_options)
+                if return_plot
+                else None
+            ),
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            results, model_wrapper = cached
+            return rethreshold(results, thresholds), model_wrapper
+
+    mode = profile_mode(profile)
+    run_profiler = Profiler() if mode else None
+    with tracing(mode == "memory"):
+        results, model_wrapper = _run_checks(
+            X,
+            y,
+            model_type,
+            selected,
+            return_plot,
+            executor,
+            max_workers,
+            thresholds,
+            render_options,
+            renderer,
+            keep_arrays,
+            run_profiler,
+            mode,
+        )
+
+    if mode:
+        for name, result in results.items():
+            notify(callbacks, name, result.profile)
+        notify(callbacks, RUN_PROFILE, run_profiler.to_dict())
+    if cache is not None:
+        # Profiles describe one call; never replay them from the cache
+        stored = {name: replace(r, profile=None) for name, r in results.items()}
+        cache.put(key, (stored, model_wrapper))
+    return results, model_wrapper
+
+
+def _run_checks(
+    X: pd.DataFrame,
+    y: pd.Series,
+    model_type,
+    selected: Dict[str, Callable[..., AssumptionResult]],
+    return_plot: bool,
+    executor: str,
+    max_workers: Optional[int],
+    thresholds: Optional[ThresholdProfile],
+    render_options: Optional[RenderOptions],
+    renderer: Optional[PlotRenderer],
+    keep_arrays: bool,
+    profiler: Optional[Profiler],
+    mode: Optional[str],
+) -> Tuple[Dict[str, AssumptionResult], BaseModelWrapper]:
+    """Fit the model and run the selected checks (the uncached path)."""
+    # Run-level work is profiled outside any one check
+    scope = profiler.activate() if profiler else nullcontext()
+    with scope, profiler.phase("fit") if profiler else nullcontext():
+        model_wrapper = get_model_wrapper(model_type, X, y)
+
+    # One context per run so checks share the design matrix, residuals, etc.
+    context = FitContext(X, y, model_wrapper=model_wrapper, keep_arrays=keep_arrays)
+
+    check_kwargs = dict(
+        model_wrapper=model_wrapper,
+        context=context,
+        return_plot=return_plot,
+        thresholds=thresholds,
+    )
 
-    for name, func in ASSUMPTION_CHECKS.items():
-        if model_type not in getattr(func, "_model_types", ["linear"]):
-            continue
-        results[name] = func(X, y, model_wrapper=model_wrapper, return_plot=return_plot)
+    # Checks emit plot specs; rendering happens inline ('serial') or on a
+    # renderer pool, off the path of the statistics
+    context.plots.options = render_options
+    owns_renderer = return_plot and renderer is None and executor != "serial"
+    if owns_renderer:
+        renderer = PlotRenderer(render_options, max_workers=max_workers)
+    context.plots.renderer = renderer if return_plot else None
+    try:
+        results = _schedule_checks(
+            X,
+            y,
+            selected,
+            context,
+            check_kwargs,
+            executor,
+            max_workers,
+            profiler,
+            mode,
+        )
+        if return_plot:
+            # Waiting on pooled renders; inline renders were profiled per check
+            scope = profiler.activate() if profiler else nullcontext()
+            with scope, profiler.phase("plotting") if profiler else nullcontext():
+                results = resolve_plots(results, context.plots)
+        results = _share_arrays(results, context, keep_arrays)
+    finally:
+        context.plots.renderer = None
+        if owns_renderer:
+            renderer.close()
     return results, model_wrapper
+
+
+def _profile_check(func, mode: str, X, y, *args, **kwargs) -> AssumptionResult:
+    """Run a check under its own profiler and attach the profile to its result."""
+    result, profile = profile_call(
+        func, X, y, *args, trace_memory=mode == "memory", **kwargs
+    )
+    return replace(result, profile=profile)
+
+
+def _build_intermediate(context: FitContext, key: str, profiler: Optional[Profiler]):
+    """Build one shared intermediate, profiled at run level if requested."""
+    if profiler is None:
+        return getattr(context, key)
+    with profiler.activate():
+        return getattr(context, key)
+
+
+def _share_arrays(
+    results: Dict[str, AssumptionResult], context: FitContext, keep_arrays: bool
+) -> Dict[str, AssumptionResult]:
+    """
+    Point every result that carries per-row arrays at the run's single
+    RunArrays (process workers return their own copies), or drop them all.
+    """
+    if keep_arrays:
+        # Only built if a check asked for it; never computed just for this
+        arrays = context.__dict__.get("arrays")
+        if arrays is None:
+            return results
+    else:
+        arrays = None
+
+    return {
+        name: (
+            result
+            if result.arrays is None or result.arrays is arrays
+            else replace(result, arrays=arrays)
+        )
+        for name, result in results.items()
+    }
+
+
+def _schedule_checks(
+    X: pd.DataFrame,
+    y: pd.Series,
+    selected: Dict[str, Callable[..., AssumptionResult]],
+    context: FitContext,
+    check_kwargs: dict,
+    executor: str,
+    max_workers: Optional[int],
+    profiler: Optional[Profiler] = None,
+    mode: Optional[str] = None,
+) -> Dict[str, AssumptionResult]:
+    """
+    Build the intermediates the selected checks need, then run the checks.
+
+    Intermediates and checks form a DAG. In 'serial' mode it is walked in
+    dependency order. In pooled modes every node is submitted as soon as its
+    dependencies finish, so independent intermediates and checks overlap.
+    Intermediates always run on threads (NumPy releases the GIL) because they
+    are cached on the in-process context; with 'process', checks start once
+    every intermediate is ready so workers receive a fully built context.
+
+    With a profiler, intermediates are profiled on it (as 'fit') and each
+    check runs under a profiler of its own, attached to its result.
+    """
+    requires = {name: getattr(func, "_requires", ()) for name, func in selected.items()}
+    if not context.keep_arrays:
+        # Summary-only run: don't plan RunArrays (or fitted values just for it)
+        requires = {
+            name: tuple(key for key in keys if key != "arrays")
+            for name, keys in requires.items()
+        }
+    plan = plan_intermediates(key for keys in requires.values() for key in keys)
+    if profiler is not None:
+        selected = {
+            name: partial(_profile_check, func, mode) for name, func in selected.items()
+        }
+
+    if executor == "serial":
+        for key in plan:
+            _build_intermediate(context, key, profiler)
+        return {name: func(X, y, **check_kwargs) for name, func in selected.items()}
+
+    thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+    check_pool: Executor = (
+        thread_pool
+        if executor == "thread"
+        else ProcessPoolExecutor(max_workers=max_workers)
+    )
+    try:
+        ready = {key for key in plan if key in context.__dict__}
+        waiting_keys = [key for key in plan if key not in ready]
+        waiting_checks = list(selected)
+        running = {}
+        results = {}
+
+        while waiting_keys or waiting_checks or running:
+            for key in list(waiting_keys):
+                if set(INTERMEDIATE_DEPENDENCIES[key]) <= ready:
+                    waiting_keys.remove(key)
+                    future = thread_pool.submit(
+                        _build_intermediate, context, key, profiler
+                    )
+                    running[future] = ("key", key)
+
+            for name in list(waiting_checks):
+                deps = set(plan) if executor == "process" else set(requires[name])
+                if deps <= ready:
+                    waiting_checks.remove(name)
+                    future = check_pool.submit(selected[name], X, y, **check_kwargs)
+                    running[future] = ("check", name)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, key = running.pop(future)
+                value = future.result()
+                if kind == "key":
+                    ready.add(key)
+                else:
+                    results[key] = value
+    finally:
+        if check_pool is not thread_pool:
+            check_pool.shutdown()
+        thread_pool.shutdown()
+
+    return {name: results[name] for name in selected}
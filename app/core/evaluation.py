@@ -0,0 +1,118 @@
+# app/core/evaluation.py
+"""
+Re-judge assumption results against a different threshold profile.
+
+Checks store their raw, threshold-free statistics on each AssumptionResult
+and register an evaluator that maps those statistics to a verdict. Sweeping
+thresholds therefore only re-runs the evaluators, never the model fit, the
+statistical tests or the plots.
+"""
+
+from dataclasses import replace
+from typing import Dict, Optional
+
+from app.config import ThresholdProfile, get_thresholds
+from app.core import homoscedasticity  # noqa: F401
+from app.core import independence  # noqa: F401
+from app.core import linearity  # noqa: F401
+from app.core import multicollinearity  # noqa: F401
+from app.core import normality  # noqa: F401
+from app.core.registry import ASSUMPTION_CHECKS, ASSUMPTION_EVALUATORS
+from app.core.types import AssumptionResult
+from app.utils import build_result
+
+__all__ = ["evaluate", "rethreshold", "rethreshold_result", "results_from_statistics"]
+
+
+def evaluate(
+    name: str, statistics: dict, thresholds: Optional[ThresholdProfile] = None
+) -> dict:
+    """
+    Run the registered evaluator for a check on raw statistics.
+
+    Args:
+        name (str): Assumption check name.
+        statistics (dict): Raw statistics produced by the check.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds to judge
+            against. Defaults to None (the module-level values in app.config).
+
+    Raises:
+        ValueError: If no evaluator is registered under name.
+
+    Returns:
+        dict: passed, summary, details, severity, recommendation and flag.
+    """
+    if name not in ASSUMPTION_EVALUATORS:
+        raise ValueError(f"No evaluator registered for assumption: '{name}'")
+    return ASSUMPTION_EVALUATORS[name](statistics, thresholds or get_thresholds())
+
+
+def rethreshold_result(
+    result: AssumptionResult, thresholds: Optional[ThresholdProfile] = None
+) -> AssumptionResult:
+    """
+    Return a copy of result with its verdict re-derived from new thresholds.
+
+    Residuals, fitted values and plots are shared with the original result.
+    Results without statistics (e.g. skipped checks) are returned unchanged.
+
+    Args:
+        result (AssumptionResult): Result to re-judge.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds to judge
+            against. Defaults to None (the module-level values in app.config).
+
+    Returns:
+        AssumptionResult: Re-judged result.
+    """
+    if result.statistics is None:
+        return result
+    return replace(result, **evaluate(result.name, result.statistics, thresholds))
+
+
+def rethreshold(
+    results: Dict[str, AssumptionResult],
+    thresholds: Optional[ThresholdProfile] = None,
+) -> Dict[str, AssumptionResult]:
+    """
+    Re-judge every result of a run against a threshold profile.
+
+    Args:
+        results (Dict[str, AssumptionResult]): Results from run_all_checks().
+        thresholds (Optional[ThresholdProfile], optional): Thresholds to judge
+            against. Defaults to None (the module-level values in app.config).
+
+    Returns:
+        Dict[str, AssumptionResult]: Re-judged results in the same order.
+    """
+    thresholds = thresholds or get_thresholds()
+    return {
+        name: rethreshold_result(result, thresholds) for name, result in results.items()
+    }
+
+
+def results_from_statistics(
+    statistics: Dict[str, dict], thresholds: Optional[ThresholdProfile] = None
+) -> Dict[str, AssumptionResult]:
+    """
+    Build results from raw statistics computed outside the check functions
+    (streaming, incremental or batched fits).
+
+    Args:
+        statistics (Dict[str, dict]): Check names mapped to raw statistics.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds to judge
+            against. Defaults to None (the module-level values in app.config).
+
+    Returns:
+        Dict[str, AssumptionResult]: Results in registry order, without
+            residual arrays or plots.
+    """
+    thresholds = thresholds or get_thresholds()
+    return {
+        name: build_result(
+            name=name,
+            statistics=statistics[name],
+            **evaluate(name, statistics[name], thresholds),
+        )
+        for name in ASSUMPTION_CHECKS
+        if name in statistics
+    }
@@ -7,22 +7,39 @@ Check homoscedasticity assumption using:
         - Breusch-Pagan test
 """
 
-import matplotlib.pyplot as plt
+from typing import Optional, Tuple
+
+import numpy as np
 import pandas as pd
-import statsmodels.api as sm
-from statsmodels.stats.diagnostic import het_breuschpagan
 
-from app.config import HOMOSCEDASTICITY_PVAL_THRESHOLD, PVAL_SEVERITY_THRESHOLDS
-from app.core.registry import register_assumption
+from app.config import ThresholdProfile, get_thresholds
+from app.core.context import FitContext, resolve_context
+from app.core.registry import register_assumption, register_evaluator
+from app.core.rendering import PlotSpec
 from app.core.types import AssumptionResult
-from app.utils import build_result, classify_severity, fig_to_base64
-
-__all__ = ["check_homoscedasticity"]
-
-
-@register_assumption("homoscedasticity", model_types=["linear"])
+from app.utils import build_result, classify_severity
+
+__all__ = [
+    "breusch_pagan_batch",
+    "breusch_pagan_from_moments",
+    "check_homoscedasticity",
+    "evaluate_homoscedasticity",
+]
+
+
+@register_assumption(
+    "homoscedasticity",
+    model_types=["linear"],
+    requires=("residuals", "fitted", "design_matrix", "basis", "arrays"),
+    version=2,  # Batched Breusch-Pagan kernel (p-values may differ in rounding)
+)
 def check_homoscedasticity(
-    X: pd.Series, y: pd.Series, return_plot: bool = False, model_wrapper=None
+    X: pd.Series,
+    y: pd.Series,
+    return_plot: bool = False,
+    model_wrapper=None,
+    context: Optional[FitContext] = None,
+    thresholds: Optional[ThresholdProfile] = None,
 ) -> AssumptionResult:
     """
     Check homoscedasticity assumption using:
@@ -35,6 +52,11 @@ def check_homoscedasticity(
         X (pd.Series): Predictor (1D)
         y (pd.Series): Response (1D)
         return_plot (bool, optional): Whether to return a plot. Defaults to False.
+        model_wrapper (BaseModelWrapper, optional): Pre-fit model. Defaults to None.
+        context (Optional[FitContext], optional): Shared per-run intermediates.
+            Defaults to None.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run. Defaults to None (the module-level values in app.config).
 
     Returns:
         AssumptionResult: Structured diagnostic output.
@@ -42,22 +64,127 @@ def check_homoscedasticity(
     if isinstance(X, pd.Series):
         X = X.to_frame()
 
-    # Guard for if model_wrapper is None
-    if model_wrapper is None:
-        from app.models.utils import get_model_wrapper
+    # Reuse the run's shared intermediates (fits a model if none was supplied)
+    context = resolve_context(X, y, model_wrapper, context)
+    residuals = context.residuals
+    y_pred = context.fitted
 
-        model_wrapper = get_model_wrapper("linear", X, y)
+    # Breusch-Pagan test checks for non-constant residual variance
+    # The auxiliary regression reuses the run's orthonormal basis of the design
+    _, pval = breusch_pagan_batch(residuals, context.design_matrix, basis=context.basis)
+    statistics = {"breusch_pagan_pval": float(pval)}
 
-    # Fit simple linear model to input data
-    residuals = model_wrapper.residuals()
-    y_pred = model_wrapper.fitted()
+    # Judge the statistics against the run's thresholds
+    verdict = evaluate_homoscedasticity(statistics, thresholds or get_thresholds())
 
-    # Breusch-Pagan test checks for non-constant residual variance
-    _, pval, _, _ = het_breuschpagan(residuals, sm.add_constant(X))
-    passed = pval > HOMOSCEDASTICITY_PVAL_THRESHOLD
+    # Plot residuals vs fitted values if requested
+    encoded = None
+    if return_plot:
+        # Shared with the other residual checks; rendered once per run
+        encoded = context.plots.request(
+            PlotSpec(
+                "residuals_vs_fitted",
+                (np.asarray(y_pred, dtype=float), np.asarray(residuals, dtype=float)),
+                title="Residuals vs Fitted",
+            )
+        )
+
+    # Package the diagnostic results using the shared builder
+    return build_result(
+        name="homoscedasticity",
+        statistics=statistics,
+        arrays=context.arrays,
+        plot_base64=encoded,
+        **verdict,
+    )
+
+
+def breusch_pagan_batch(
+    residuals: np.ndarray, design, basis: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Breusch-Pagan LM tests for a residual vector or every column of a matrix.
+
+    Koenker's studentized form, as statsmodels' het_breuschpagan: LM = n·R²
+    of regressing u = e² on the design. All k auxiliary regressions share
+    one orthonormal basis of the design, so they cost two matrix products.
+
+    Args:
+        residuals (np.ndarray): (n,) or (n, k) residuals.
+        design (array-like): (n, p) design matrix with a constant column.
+        basis (Optional[np.ndarray], optional): Orthonormal basis of the
+            design's column space, e.g. reused from the fit. Defaults to None
+            (computed with column_basis).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: LM statistics and chi-squared
+            p-values, of shape () or (k,).
+    """
+    from scipy.stats import chi2
+
+    from app.models.linear_model_wrapper import column_basis
+
+    design = np.asarray(design, dtype=float)
+    if basis is None:
+        basis = column_basis(design)
+    u = np.asarray(residuals, dtype=float) ** 2
+    n = u.shape[0]
+    u_bar = u.mean(axis=0)
+
+    # The constant lies in the column space, so ESS = |basis'u|² - n·ū²
+    projected = basis.T @ u
+    ess = np.sum(projected * projected, axis=0) - n * u_bar**2
+    tss = np.sum(u * u, axis=0) - n * u_bar**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lm = np.where(tss > 0, n * ess / tss, 0.0)
+    return lm, chi2.sf(lm, design.shape[1] - 1)
+
+
+def breusch_pagan_from_moments(
+    n: int, ZZ: np.ndarray, Zu: np.ndarray, uu: float
+) -> Tuple[float, float]:
+    """
+    Breusch-Pagan LM test from the moments of its auxiliary regression.
+
+    Matches statsmodels' het_breuschpagan (Koenker's studentized form,
+    LM = n·R² of regressing u = e² on Z) without holding e or Z.
+
+    Args:
+        n (int): Number of observations.
+        ZZ (np.ndarray): Z'Z of the design (constant in the first column).
+        Zu (np.ndarray): Z'u with u the squared residuals.
+        uu (float): u'u, i.e. the sum of e⁴.
+
+    Returns:
+        Tuple[float, float]: LM statistic and its chi-squared p-value.
+    """
+    from scipy.stats import chi2
+
+    gamma = np.linalg.lstsq(ZZ, Zu, rcond=None)[0]
+    u_bar = Zu[0] / n
+    ess = gamma @ Zu - n * u_bar**2
+    tss = uu - n * u_bar**2
+    lm = n * ess / tss if tss > 0 else 0.0
+    return lm, chi2.sf(lm, ZZ.shape[0] - 1)
+
+
+@register_evaluator("homoscedasticity")
+def evaluate_homoscedasticity(statistics: dict, thresholds: ThresholdProfile) -> dict:
+    """
+    Derive the homoscedasticity verdict from the Breusch-Pagan p-value.
+
+    Args:
+        statistics (dict): Raw statistics with key 'breusch_pagan_pval'.
+        thresholds (ThresholdProfile): Thresholds to judge against.
+
+    Returns:
+        dict: passed, summary, details, severity, recommendation and flag.
+    """
+    pval = statistics["breusch_pagan_pval"]
+    passed = pval > thresholds.homoscedasticity_pval
 
     # Classify severity of violation based on p-value
-    severity = classify_severity(pval, PVAL_SEVERITY_THRESHOLDS)
+    severity = classify_severity(pval, thresholds.pval_severity)
 
     # Recommend next steps if residuals are heteroskedastic
     recommendation = (
@@ -72,29 +199,13 @@ def check_homoscedasticity(
     # Set flag for UI or prioritization
     flag = "info" if passed else "warning"
 
-    # Plot residuals vs fitted values if requested
-    encoded = None
-    if return_plot:
-        fig, ax = plt.subplots()
-        ax.scatter(y_pred, residuals, alpha=0.7)
-        ax.axhline(0, color="red", linestyle="--")
-        ax.set_xlabel("Fitted values")
-        ax.set_ylabel("Residuals")
-        ax.set_title("Residuals vs Fitted (Homoscedasticity Check)")
-        encoded = fig_to_base64(fig)
-
-    # Package the diagnostic results using the shared builder
-    return build_result(
-        name="homoscedasticity",
+    return dict(
         passed=passed,
         summary=f"Breusch-Pagan p = {pval:.4f} → {'Pass' if passed else 'Fail'}",
         details={
             "breusch_pagan_pval": pval,
-            "homoscedasticity_pval_threshold": HOMOSCEDASTICITY_PVAL_THRESHOLD,
+            "homoscedasticity_pval_threshold": thresholds.homoscedasticity_pval,
         },
-        residuals=residuals,
-        fitted=y_pred,
-        plot_base64=encoded,
         severity=severity,
         recommendation=recommendation,
         flag=flag,
@@ -0,0 +1,303 @@
+# app/core/independence.py
+"""
+Check independence of errors using:
+    - Plots:
+        - Autocorrelation function (ACF) of residuals
+    - Statistical tests:
+        - Durbin-Watson statistic
+        - Ljung-Box test
+
+The residuals are taken in row order, so the check is only meaningful when
+rows follow a natural sequence (time, position, collection order).
+Autocorrelations for every lag come from a single FFT of the residuals,
+which costs O(n log n) regardless of the number of lags. The Durbin-Watson
+statistic is derived from the lag-1 term of the same pass.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app import config
+from app.config import ThresholdProfile, get_thresholds
+from app.core.context import FitContext, resolve_context
+from app.core.registry import register_assumption, register_evaluator
+from app.core.rendering import PlotSpec
+from app.core.types import AssumptionResult
+from app.utils import build_result, classify_severity
+
+__all__ = [
+    "acf_fft",
+    "check_independence",
+    "default_lags",
+    "durbin_watson_from_acf",
+    "evaluate_independence",
+    "independence_statistics",
+    "ljung_box",
+]
+
+
+@register_assumption(
+    "independence", model_types=["linear"], requires=("residuals", "arrays")
+)
+def check_independence(
+    X: pd.Series,
+    y: pd.Series,
+    return_plot: bool = False,
+    model_wrapper=None,
+    context: Optional[FitContext] = None,
+    thresholds: Optional[ThresholdProfile] = None,
+) -> AssumptionResult:
+    """
+    Check independence of errors using:
+    - Plots:
+        - Autocorrelation function (ACF) of residuals
+    - Statistical tests:
+        - Durbin-Watson statistic
+        - Ljung-Box test
+
+    Args:
+        X (pd.Series): Predictor (1D)
+        y (pd.Series): Response (1D)
+        return_plot (bool, optional): Whether to return a plot. Defaults to False.
+        model_wrapper (BaseModelWrapper, optional): Pre-fit model. Defaults to None.
+        context (Optional[FitContext], optional): Shared per-run intermediates.
+            Defaults to None.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run. Defaults to None (the module-level values in app.config).
+
+    Returns:
+        AssumptionResult: Structured diagnostic output.
+    """
+    if isinstance(X, pd.Series):
+        X = X.to_frame()
+
+    # Reuse the run's shared intermediates (fits a model if none was supplied)
+    context = resolve_context(X, y, model_wrapper, context)
+    residuals = np.asarray(context.residuals, dtype=float)
+
+    # One FFT gives the autocorrelations for the tests and the plot
+    acf = acf_fft(residuals, default_lags(len(residuals)))
+    statistics = _statistics_from_acf(residuals, acf)
+
+    # Judge the statistics against the run's thresholds
+    verdict = evaluate_independence(statistics, thresholds or get_thresholds())
+
+    # Plot the residual ACF if requested
+    encoded = None
+    if return_plot:
+        encoded = context.plots.request(
+            PlotSpec(
+                "acf",
+                (acf[1:],),
+                title="Autocorrelation of Residuals",
+                options={"n": len(residuals)},
+            )
+        )
+
+    # Package the diagnostic results using the shared builder
+    return build_result(
+        name="independence",
+        statistics=statistics,
+        arrays=context.arrays,
+        plot_base64=encoded,
+        **verdict,
+    )
+
+
+def default_lags(n: int) -> int:
+    """Ljung-Box lags for n residuals: min(INDEPENDENCE_MAX_LAGS, n // 5), >= 1."""
+    return max(1, min(config.INDEPENDENCE_MAX_LAGS, n // 5))
+
+
+def acf_fft(residuals: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Sample autocorrelations for lags 0..max_lag from one FFT.
+
+    Same values as statsmodels' acf(adjusted=False): autocovariances of the
+    mean-centered series divided by n, normalized by the lag-0 term. The
+    series is zero-padded to at least n + max_lag, which is enough to keep
+    the circular correlation from wrapping into the lags returned. An
+    (n, k) matrix is transformed column by column in the same call.
+
+    Args:
+        residuals (np.ndarray): (n,) series or (n, k) series in columns.
+        max_lag (int): Largest lag to return.
+
+    Returns:
+        np.ndarray: (max_lag + 1,) or (max_lag + 1, k) autocorrelations,
+            starting with 1.0.
+    """
+    from scipy import fft
+
+    centered = np.asarray(residuals, dtype=float)
+    centered = centered - centered.mean(axis=0)
+    n_fft = fft.next_fast_len(len(centered) + max_lag, real=True)
+
+    spectrum = fft.rfft(centered, n=n_fft, axis=0, workers=-1)
+    power = spectrum.real**2 + spectrum.imag**2
+    del spectrum
+    autocovariance = fft.irfft(power, n=n_fft, axis=0, workers=-1)[: max_lag + 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return autocovariance / autocovariance[0]
+
+
+def _scalar_or_array(values: np.ndarray):
+    return float(values) if np.ndim(values) == 0 else values
+
+
+def ljung_box(acf: np.ndarray, n: int) -> Tuple:
+    """
+    Ljung-Box Q test over lags 1..len(acf) - 1.
+
+    Q = n(n + 2) Σ ρ_k² / (n - k), chi-squared with one degree of freedom
+    per lag (as statsmodels' acorr_ljungbox with model_df=0).
+
+    Args:
+        acf (np.ndarray): Autocorrelations from lag 0, e.g. from acf_fft();
+            (L + 1, k) tests every column.
+        n (int): Length of the series.
+
+    Returns:
+        Tuple: Q statistics and p-values, as floats for a single series or
+            (k,) arrays.
+    """
+    from scipy.stats import chi2
+
+    lags = np.arange(1, len(acf))
+    weights = (1.0 / (n - lags)).reshape(-1, *[1] * (acf.ndim - 1))
+    q = n * (n + 2) * np.sum(acf[1:] ** 2 * weights, axis=0)
+    return _scalar_or_array(q), _scalar_or_array(chi2.sf(q, len(lags)))
+
+
+def durbin_watson_from_acf(residuals: np.ndarray, acf: np.ndarray):
+    """
+    Durbin-Watson statistic from the lag-1 autocorrelation of acf_fft().
+
+    DW = Σ(e_t - e_{t-1})² / Σe_t² on the raw (uncentered) residuals,
+    rebuilt from the centered lag-1 autocovariance, the mean and the two
+    end points, so it needs no second pass over lagged differences.
+
+    Args:
+        residuals (np.ndarray): (n,) series or (n, k) series in columns.
+        acf (np.ndarray): Autocorrelations from lag 0 (at least lag 1).
+
+    Returns:
+        Durbin-Watson statistic (about 2 for uncorrelated residuals): a float
+            for a single series, else a (k,) array.
+    """
+    e = np.asarray(residuals, dtype=float)
+    n = len(e)
+    mean = e.mean(axis=0)
+    first, last = e[0] - mean, e[-1] - mean
+
+    # Centered sums: Σc², Σc_t·c_{t-1}; then shift back to the raw residuals
+    sum_squares = np.einsum("i...,i...->...", e, e)
+    gamma0 = sum_squares - n * mean**2
+    gamma1 = acf[1] * gamma0
+    lag_product = gamma1 - mean * (first + last) + (n - 1) * mean**2
+    numerator = 2 * sum_squares - e[0] ** 2 - e[-1] ** 2 - 2 * lag_product
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _scalar_or_array(numerator / sum_squares)
+
+
+def independence_statistics(
+    residuals: np.ndarray, max_lag: Optional[int] = None
+) -> dict:
+    """
+    Raw statistics used by the independence check.
+
+    Args:
+        residuals (np.ndarray): 1-D series in order.
+        max_lag (Optional[int], optional): Ljung-Box lags. Defaults to None
+            (min(app.config.INDEPENDENCE_MAX_LAGS, n // 5), at least 1).
+
+    Returns:
+        dict: durbin_watson, ljung_box_stat, ljung_box_pval, ljung_box_lags
+            and acf_lag1.
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    if max_lag is None:
+        max_lag = default_lags(len(residuals))
+    return _statistics_from_acf(residuals, acf_fft(residuals, max_lag))
+
+
+def _statistics_from_acf(residuals: np.ndarray, acf: np.ndarray) -> dict:
+    q, pval = ljung_box(acf, len(residuals))
+    return {
+        "durbin_watson": durbin_watson_from_acf(residuals, acf),
+        "ljung_box_stat": q,
+        "ljung_box_pval": pval,
+        "ljung_box_lags": len(acf) - 1,
+        "acf_lag1": float(acf[1]),
+    }
+
+
+@register_evaluator("independence")
+def evaluate_independence(statistics: dict, thresholds: ThresholdProfile) -> dict:
+    """
+    Derive the independence verdict from the Ljung-Box p-value and the
+    Durbin-Watson statistic; both must pass.
+
+    Args:
+        statistics (dict): Raw statistics with keys 'ljung_box_pval',
+            'ljung_box_lags' and 'durbin_watson' ('ljung_box_stat' and
+            'acf_lag1' are passed through to the details).
+        thresholds (ThresholdProfile): Thresholds to judge against.
+
+    Returns:
+        dict: passed, summary, details, severity, recommendation and flag.
+    """
+    pval = statistics["ljung_box_pval"]
+    dw = statistics["durbin_watson"]
+    lower, upper = thresholds.durbin_watson_bounds
+
+    ljung_box_passed = pval > thresholds.independence_pval
+    durbin_watson_passed = lower <= dw <= upper
+    passed = ljung_box_passed and durbin_watson_passed
+
+    # Severity from the Ljung-Box p-value; a Durbin-Watson statistic outside
+    # its bounds signals strong lag-1 correlation
+    severity = classify_severity(pval, thresholds.pval_severity)
+    if not durbin_watson_passed:
+        severity = "high"
+
+    # Recommend next steps if residuals are autocorrelated
+    recommendation = (
+        None
+        if passed
+        else (
+            "Residuals are autocorrelated; consider lagged predictors, a time "
+            "series model for the errors, or HAC (Newey-West) standard errors."
+        )
+    )
+
+    # Set flag for UI or prioritization
+    flag = "info" if passed else "warning"
+
+    details = {
+        "ljung_box_pval": pval,
+        "ljung_box_lags": statistics["ljung_box_lags"],
+        "independence_pval_threshold": thresholds.independence_pval,
+        "durbin_watson": dw,
+        "durbin_watson_lower": lower,
+        "durbin_watson_upper": upper,
+    }
+    for key in ("ljung_box_stat", "acf_lag1"):
+        if key in statistics:
+            details[key] = statistics[key]
+
+    return dict(
+        passed=passed,
+        summary=(
+            f"Ljung-Box p = {pval:.4f} ({statistics['ljung_box_lags']} lags), "
+            f"Durbin-Watson = {dw:.3f} → {'Pass' if passed else 'Fail'}"
+        ),
+        details=details,
+        severity=severity,
+        recommendation=recommendation,
+        flag=flag,
+    )
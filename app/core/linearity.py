@@ -7,21 +7,34 @@ Check linearity assumption using:
         - R²
 """
 
-import matplotlib.pyplot as plt
+from typing import Optional
+
+import numpy as np
 import pandas as pd
-from sklearn.metrics import r2_score
 
-from app.config import LINEARITY_R2_THRESHOLD, R2_SEVERITY_THRESHOLDS
-from app.core.registry import register_assumption
+from app.config import ThresholdProfile, get_thresholds
+from app.core.context import FitContext, resolve_context
+from app.core.registry import register_assumption, register_evaluator
+from app.core.rendering import PlotSpec
 from app.core.types import AssumptionResult
-from app.utils import build_result, classify_severity, fig_to_base64
+from app.utils import build_result, classify_severity
 
-__all__ = ["check_linearity"]
+__all__ = ["check_linearity", "evaluate_linearity"]
 
 
-@register_assumption("linearity", model_types=["linear"])
+@register_assumption(
+    "linearity",
+    model_types=["linear"],
+    requires=("residuals", "fitted", "arrays"),
+    version=2,  # R² from the model wrapper's summary, not sklearn's r2_score
+)
 def check_linearity(
-    X: pd.Series, y: pd.Series, return_plot: bool = False, model_wrapper=None
+    X: pd.Series,
+    y: pd.Series,
+    return_plot: bool = False,
+    model_wrapper=None,
+    context: Optional[FitContext] = None,
+    thresholds: Optional[ThresholdProfile] = None,
 ) -> AssumptionResult:
     """
     Check linearity assumption using:
@@ -35,6 +48,11 @@ def check_linearity(
         y (pd.Series): Response (1D)
         return_plot (bool, optional): Whether to return base64-encoded
             PNG of the plot. Defaults to False.
+        model_wrapper (BaseModelWrapper, optional): Pre-fit model. Defaults to None.
+        context (Optional[FitContext], optional): Shared per-run intermediates.
+            Defaults to None.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run. Defaults to None (the module-level values in app.config).
 
     Returns:
         AssumptionResult: Structured diagnostic output.
@@ -58,24 +76,64 @@ def check_linearity(
             )
         X = X.iloc[:, 0]  # Convert to Series
 
-    # Guard for if model_wrapper is None
-    if model_wrapper is None:
-        from app.models.utils import get_model_wrapper
+    # Reuse the run's shared intermediates (fits a model if none was supplied)
+    context = resolve_context(X, y, model_wrapper, context)
+    residuals = context.residuals
+    y_pred = context.fitted
+
+    # Coefficient of determination (R²) measures goodness of fit; reuse the
+    # fit's own value rather than recomputing it
+    r2 = context.model_wrapper.summary().get("r_squared")
+    if r2 is None:
+        values = np.asarray(y, dtype=float)
+        centered = values - values.mean()
+        r2 = 1.0 - np.sum(np.square(residuals)) / (centered @ centered)
+    statistics = {"r_squared": float(r2)}
+
+    # Judge the statistics against the run's thresholds
+    verdict = evaluate_linearity(statistics, thresholds or get_thresholds())
+
+    # Generate residual vs fitted plot if requested
+    encoded = None
+    if return_plot:
+        # Shared with the other residual checks; rendered once per run
+        encoded = context.plots.request(
+            PlotSpec(
+                "residuals_vs_fitted",
+                (np.asarray(y_pred, dtype=float), np.asarray(residuals, dtype=float)),
+                title="Residuals vs Fitted",
+            )
+        )
 
-        model_wrapper = get_model_wrapper("linear", X, y)
+    # Package the diagnostic results using the shared builder
+    return build_result(
+        name="linearity",
+        statistics=statistics,
+        arrays=context.arrays,
+        plot_base64=encoded,
+        **verdict,
+    )
 
-    # Fit simple linear model to input data
-    residuals = model_wrapper.residuals()
-    y_pred = model_wrapper.fitted()
 
-    # Coefficient of determination (R²) measures goodness of fit
-    r2 = r2_score(y, y_pred)
+@register_evaluator("linearity")
+def evaluate_linearity(statistics: dict, thresholds: ThresholdProfile) -> dict:
+    """
+    Derive the linearity verdict from R² and the given thresholds.
+
+    Args:
+        statistics (dict): Raw statistics with key 'r_squared'.
+        thresholds (ThresholdProfile): Thresholds to judge against.
+
+    Returns:
+        dict: passed, summary, details, severity, recommendation and flag.
+    """
+    r2 = statistics["r_squared"]
 
     # Use config threshold to determine pass/fail status
-    passed = r2 > LINEARITY_R2_THRESHOLD
+    passed = r2 > thresholds.linearity_r2
 
     # Use centralized classifier to determine diagnostic severity
-    severity = classify_severity(r2, R2_SEVERITY_THRESHOLDS)
+    severity = classify_severity(r2, thresholds.r2_severity)
 
     # Suggest transformation or feature engineering if linearity is poor
     recommendation = (
@@ -87,26 +145,10 @@ def check_linearity(
     # Used for visual/UI indication - can help prioritize failed assumptions
     flag = "info" if passed else "warning"
 
-    # Generate residual vs fitted plot if requested
-    encoded = None
-    if return_plot:
-        fig, ax = plt.subplots()
-        ax.scatter(y_pred, residuals, alpha=0.7)
-        ax.axhline(0, color="red", linestyle="--")
-        ax.set_xlabel("Fitted values")
-        ax.set_ylabel("Residuals")
-        ax.set_title("Residuals vs Fitted (Linearity Check)")
-        encoded = fig_to_base64(fig)
-
-    # Package the diagnostic results using the shared builder
-    return build_result(
-        name="linearity",
+    return dict(
         passed=passed,
         summary=f"R² = {r2:.2f} → {'Pass' if passed else 'Fail'}",
-        details={"r_squared": r2, "r2_threshold": LINEARITY_R2_THRESHOLD},
-        residuals=residuals,
-        fitted=y_pred,
-        plot_base64=encoded,
+        details={"r_squared": r2, "r2_threshold": thresholds.linearity_r2},
         severity=severity,
         recommendation=recommendation,
         flag=flag,
@@ -7,22 +7,39 @@ Check multicollinearity assumption using:
         - Variance Inflation Factor (VIF)
 """
 
-import matplotlib.pyplot as plt
+from typing import Optional
+
+import numpy as np
 import pandas as pd
-import seaborn as sns
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 
-from app.config import VIF_SEVERITY_THRESHOLDS, VIF_THRESHOLD
-from app.core.registry import register_assumption
+from app.config import ThresholdProfile, get_thresholds
+from app.core.context import FitContext, resolve_context
+from app.core.registry import register_assumption, register_evaluator
+from app.core.rendering import PlotSpec
 from app.core.types import AssumptionResult
-from app.utils import build_result, classify_severity, fig_to_base64
-
-__all__ = ["check_multicollinearity"]
-
-
-@register_assumption("multicollinearity", model_types=["linear"])
+from app.utils import build_result, classify_severity
+
+__all__ = [
+    "check_multicollinearity",
+    "compute_vif",
+    "evaluate_multicollinearity",
+    "max_vif",
+]
+
+
+@register_assumption(
+    "multicollinearity",
+    model_types=["linear"],
+    requires=("correlation",),
+    version=2,
+)
 def check_multicollinearity(
-    X: pd.DataFrame, y: pd.Series, return_plot: bool = False, model_wrapper=None
+    X: pd.DataFrame,
+    y: pd.Series,
+    return_plot: bool = False,
+    model_wrapper=None,
+    context: Optional[FitContext] = None,
+    thresholds: Optional[ThresholdProfile] = None,
 ) -> AssumptionResult:
     """
     Check multicollinearity assumption using:
@@ -34,6 +51,11 @@ def check_multicollinearity(
     Args:
         X (pd.DataFrame): Predictor or Feature values (n, p≥2)
         return_plot (bool, optional): Whether to return a plot. Defaults to False.
+        model_wrapper (BaseModelWrapper, optional): Pre-fit model. Defaults to None.
+        context (Optional[FitContext], optional): Shared per-run intermediates.
+            Defaults to None.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run. Defaults to None (the module-level values in app.config).
 
     Returns:
         AssumptionResult: Structured diagnostic output.
@@ -53,29 +75,131 @@ def check_multicollinearity(
             flag="info",
         )
 
-    # Calculate VIF for each independent variable
-    vif_data = pd.DataFrame()
-    vif_data["feature"] = X.columns
-    vif_data["VIF"] = [
-        variance_inflation_factor(X.values, i) for i in range(X.shape[1])
-    ]
+    # Correlation matrix is shared with the rest of the run via the context
+    context = resolve_context(X, y, model_wrapper, context)
 
-    # Use config threshold to determine pass/fail for each feature
-    vif_data["passed"] = vif_data["VIF"].apply(lambda x: 1 if x <= VIF_THRESHOLD else 0)
+    # Every VIF at once from the inverse of the (shared) correlation matrix
+    vifs = compute_vif(context.correlation.to_numpy())
+    statistics = {"vif": dict(zip(X.columns, vifs.tolist()))}
 
-    # Use centralized classifier to determine diagnostic severity
-    vif_data["severity"] = vif_data["VIF"].apply(
-        lambda x: classify_severity(x, VIF_SEVERITY_THRESHOLDS)
+    # Judge the statistics against the run's thresholds
+    verdict = evaluate_multicollinearity(statistics, thresholds or get_thresholds())
+
+    # Plot heatmap of correlation matrix
+    encoded = None
+    if return_plot:
+        corr = context.correlation
+        encoded = context.plots.request(
+            PlotSpec(
+                "correlation_heatmap",
+                (corr.to_numpy(dtype=float),),
+                title="Correlation of feature values",
+                options={"labels": [str(c) for c in corr.columns]},
+            )
+        )
+
+    # Package the diagnostic results using the shared builder
+    return build_result(
+        name="multicollinearity",
+        statistics=statistics,
+        plot_base64=encoded,
+        **verdict,
     )
 
-    # Overall severity based on "worst" of the three
+
+def compute_vif(corr: np.ndarray, tol: float = 1e-10) -> np.ndarray:
+    """
+    Compute every variance inflation factor from the predictor correlation matrix.
+
+    VIF_j is the j-th diagonal element of the inverse correlation matrix, which
+    equals 1 / (1 - R²_j) for the regression of feature j (with intercept) on
+    all other features. One Cholesky factorization replaces p auxiliary OLS
+    fits. Near-singular matrices fall back to an eigendecomposition: features
+    loading on a (numerically) null direction get an infinite VIF, and
+    zero-variance features (NaN correlations) get NaN.
+
+    Args:
+        corr (np.ndarray): (p, p) correlation matrix.
+        tol (float, optional): Eigenvalues below tol * largest eigenvalue are
+            treated as exact collinearity. Defaults to 1e-10.
+
+    Returns:
+        np.ndarray: (p,) VIFs in column order.
+    """
+    corr = np.asarray(corr, dtype=float)
+    vif = np.full(corr.shape[0], np.nan)
+
+    # Constant features have undefined correlations; leave them out
+    valid = np.isfinite(np.diag(corr))
+    sub = corr[np.ix_(valid, valid)]
+    if sub.size == 0:
+        return vif
+
+    try:
+        # diag(R⁻¹) = column sums of squares of L⁻¹ where R = LLᵀ
+        L_inv = np.linalg.inv(np.linalg.cholesky(sub))
+        diag = np.einsum("ij,ij->j", L_inv, L_inv)
+        if np.all(np.isfinite(diag)) and diag.max() < 1 / tol:
+            vif[valid] = diag
+            return vif
+    except np.linalg.LinAlgError:
+        pass
+
+    w, V = np.linalg.eigh(sub)
+    null = w <= tol * max(w.max(), tol)
+    diag = (V[:, ~null] ** 2 / w[~null]).sum(axis=1)
+    diag[(V[:, null] ** 2).sum(axis=1) > np.sqrt(tol)] = np.inf
+    vif[valid] = diag
+    return vif
+
+
+def max_vif(vifs: dict) -> float:
+    """
+    Largest VIF, ignoring the NaN VIFs of zero-variance features.
+
+    Args:
+        vifs (dict): Feature names mapped to VIFs.
+
+    Returns:
+        float: The maximum (inf for exact collinearity), or NaN when every
+            VIF is NaN, regardless of the features' order.
+    """
+    values = np.asarray(list(vifs.values()), dtype=float)
+    values = values[~np.isnan(values)]
+    return float(values.max()) if values.size else float("nan")
+
+
+@register_evaluator("multicollinearity")
+def evaluate_multicollinearity(statistics: dict, thresholds: ThresholdProfile) -> dict:
+    """
+    Derive the multicollinearity verdict from per-feature VIFs.
+
+    Args:
+        statistics (dict): Raw statistics with key 'vif' mapping each feature
+            to its variance inflation factor.
+        thresholds (ThresholdProfile): Thresholds to judge against.
+
+    Returns:
+        dict: passed, summary, details, severity, recommendation and flag.
+    """
+    vifs = statistics["vif"]
+    largest = max_vif(vifs)
+
+    # Zero-variance features have NaN VIFs: they duplicate the intercept, so
+    # they count as collinear and are named in the details
+    degenerate = [feature for feature, vif in vifs.items() if np.isnan(vif)]
+
+    # Use centralized classifier to determine diagnostic severity, keeping
+    # the "worst" feature as the overall severity
     severity = max(
-        vif_data["severity"].values,
+        (classify_severity(vif, thresholds.vif_severity) for vif in vifs.values()),
         key=lambda s: ["low", "moderate", "high"].index(s),
     )
+    if degenerate:
+        severity = "high"
 
-    # Check if all VIF values are below 5
-    passed = all(vif_data["VIF"] < 5)
+    # Check if all VIF values are below the threshold
+    passed = not degenerate and all(vif < thresholds.vif for vif in vifs.values())
 
     # Recommend next steps if features are correlated
     recommendation = (
@@ -91,41 +215,23 @@ def check_multicollinearity(
     flag = "info" if passed else "warning"
 
     # Flattened details per feature for aligned rendering in report.py
-    feature_detail_rows = {
-        f"{row['feature']} (VIF)": row["VIF"]
-        for row in vif_data.to_dict(orient="records")
-    }
-    threshold_detail_rows = {
-        f"{row['feature']} threshold": VIF_THRESHOLD
-        for row in vif_data.to_dict(orient="records")
-    }
-
     details = {
-        **feature_detail_rows,
-        **threshold_detail_rows,
-        "max_variance_inflation_factor": vif_data["VIF"].max(),
-        "multicollinearity_vif_threshold": VIF_THRESHOLD,
+        **{f"{feature} (VIF)": vif for feature, vif in vifs.items()},
+        **{f"{feature} threshold": thresholds.vif for feature in vifs},
+        "max_variance_inflation_factor": largest,
+        "multicollinearity_vif_threshold": thresholds.vif,
     }
+    if degenerate:
+        details["constant_features"] = degenerate
 
-    # Plot heatmap of correlation matrix
-    encoded = None
-    if return_plot:
-        fig, ax = plt.subplots()
-        corr = X.corr()
-        sns.heatmap(corr, annot=True, fmt=".2f", cmap="coolwarm", center=0, ax=ax)
-        ax.set_title("Correlation of feature values")
-        encoded = fig_to_base64(fig)
-
-    # Package the diagnostic results using the shared builder
-    return build_result(
-        name="multicollinearity",
+    return dict(
         passed=passed,
         summary=(
-            f"Max VIF among predictors = {vif_data.loc[:, 'VIF'].max():.2f} → "
-            f"{'Pass' if passed else 'Fail'}"
+            f"Max VIF among predictors = {largest:.2f}"
+            + (f" ({len(degenerate)} constant)" if degenerate else "")
+            + f" → {'Pass' if passed else 'Fail'}"
         ),
         details=details,
-        plot_base64=encoded,
         severity=severity,
         recommendation=recommendation,
         flag=flag,
@@ -8,24 +8,50 @@ Check normality assumption using:
         - Shapiro-Wilk test
         - D'Agostino and Pearson's test
         - Anderson-Darling test
+
+Above app.config.NORMALITY_LARGE_N residuals the check switches to a
+bounded-cost mode: Shapiro-Wilk and Anderson-Darling are run on repeated
+random subsamples (median p-value / statistic over the draws), the
+D'Agostino-Pearson test uses the moments of the full residual vector.
 """
 
-import matplotlib.pyplot as plt
+from typing import Optional
+
+import numpy as np
 import pandas as pd
-import statsmodels.api as sm  # Q-Q plot
-from scipy.stats import anderson, normaltest, shapiro
 
-from app.config import NORMALITY_PVAL_THRESHOLD, PVAL_SEVERITY_THRESHOLDS
-from app.core.registry import register_assumption
+from app import config
+from app.config import ThresholdProfile, get_thresholds
+from app.core.context import FitContext, resolve_context
+from app.core.registry import register_assumption, register_evaluator
+from app.core.rendering import PlotSpec
 from app.core.types import AssumptionResult
-from app.utils import build_result, classify_severity, fig_to_base64
+from app.utils import build_result, classify_severity
 
-__all__ = ["check_normality"]
+__all__ = [
+    "anderson_darling_batch",
+    "check_normality",
+    "dagostino_jarque_bera_batch",
+    "evaluate_normality",
+    "normality_from_moments",
+    "normality_statistics",
+    "shapiro_batch",
+]
 
 
-@register_assumption("normality", model_types=["linear"])
+@register_assumption(
+    "normality",
+    model_types=["linear"],
+    requires=("residuals", "fitted", "arrays"),
+    version=2,  # Subsampled Shapiro-Wilk / Anderson-Darling above NORMALITY_LARGE_N
+)
 def check_normality(
-    X: pd.Series, y: pd.Series, return_plot: bool = False, model_wrapper=None
+    X: pd.Series,
+    y: pd.Series,
+    return_plot: bool = False,
+    model_wrapper=None,
+    context: Optional[FitContext] = None,
+    thresholds: Optional[ThresholdProfile] = None,
 ) -> AssumptionResult:
     """
     Check normality assumption using:
@@ -37,10 +63,18 @@ def check_normality(
         - D'Agostino and Pearson's test
         - Anderson-Darling test
 
+    Large residual vectors are tested in the subsampled mode described in the
+    module docstring; details report the sample size and method used.
+
     Args:
         X (pd.Series): Predictor (1D)
         y (pd.Series): Response (1D)
         return_plot (bool, optional): Whether to return a plot. Defaults to False.
+        model_wrapper (BaseModelWrapper, optional): Pre-fit model. Defaults to None.
+        context (Optional[FitContext], optional): Shared per-run intermediates.
+            Defaults to None.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run. Defaults to None (the module-level values in app.config).
 
     Returns:
         AssumptionResult: Structured diagnostic output.
@@ -48,112 +82,382 @@ def check_normality(
     if isinstance(X, pd.Series):
         X = X.to_frame()
 
-    # Guard for if model_wrapper is None
-    if model_wrapper is None:
-        from app.models.utils import get_model_wrapper
-
-        model_wrapper = get_model_wrapper("linear", X, y)
-
-    # Fit simple linear model to input data
-    residuals = model_wrapper.residuals()
-    y_pred = model_wrapper.fitted()
-
-    # Shapiro-Wilks test checks if data comes from a normally distributed population
-    _, shapiro_pval = shapiro(residuals)
-    shapiro_passed = shapiro_pval > NORMALITY_PVAL_THRESHOLD
-
-    # Classify severity of violation based on Shapiro p-value
-    shapiro_severity = classify_severity(shapiro_pval, PVAL_SEVERITY_THRESHOLDS)
-
-    # Normal test checks whether a sample differs from a normal distribution
-    _, dagostino_pval = normaltest(residuals)
-    dagostino_passed = dagostino_pval > NORMALITY_PVAL_THRESHOLD
+    # Reuse the run's shared intermediates (fits a model if none was supplied)
+    context = resolve_context(X, y, model_wrapper, context)
+    residuals = context.residuals
 
-    # Classify severity of violation based on Normaltest p-value
-    dagostino_severity = classify_severity(dagostino_pval, PVAL_SEVERITY_THRESHOLDS)
-
-    # Anderson test checks whether a sample differs from a specified distribution
-    anderson_result = anderson(residuals, dist="norm")
-    anderson_stat = anderson_result.statistic
-    anderson_critical = anderson_result.critical_values[2]  # 5% level
-    anderson_passed = anderson_stat < anderson_critical
-
-    # Manually assign severity based on how far we are from the critical value
-    # You can define custom thresholds later if needed
-    anderson_severity = "low" if anderson_passed else "high"
-
-    # Overall severity based on "worst" of the three
-    severity = max(
-        [shapiro_severity, dagostino_severity, anderson_severity],
-        key=lambda s: ["low", "moderate", "high"].index(s),
-    )
-
-    passed = sum([shapiro_passed, dagostino_passed, anderson_passed]) >= 2
-
-    # Recommend next steps if residuals are not from a normal distribution
-    recommendation = (
-        None if passed else "Consider log-transforming Y or using robust regression."
-    )
+    statistics = normality_statistics(np.asarray(residuals, dtype=float))
 
-    # Set flag for UI or prioritization
-    flag = "info" if passed else "warning"
+    # Judge the statistics against the run's thresholds
+    verdict = evaluate_normality(statistics, thresholds or get_thresholds())
 
     # Plot Q-Q plot and Histogram of residuals if requested
     plots = []
     if return_plot:
-        # Q-Q Plot
-        fig1 = sm.qqplot(residuals, line="45")
-        fig1.suptitle("Q-Q Plot (Normality Check)")
+        values = np.asarray(residuals, dtype=float)
+
+        # Q-Q Plot (thinned to fixed quantiles for long residual vectors)
         plots.append(
             {
                 "title": "Q-Q Plot",
                 "type": "qq",
-                "image": fig_to_base64(fig1),
+                "image": context.plots.request(
+                    PlotSpec("qq", (values,), title="Q-Q Plot (Normality Check)")
+                ),
             }
         )
 
         # Histogram
-        fig2, ax = plt.subplots()
-        ax.hist(residuals, bins=20, alpha=0.7, color="steelblue", edgecolor="black")
-        ax.set_title("Histogram of Residuals")
         plots.append(
             {
                 "title": "Histogram",
                 "type": "histogram",
-                "image": fig_to_base64(fig2),
+                "image": context.plots.request(
+                    PlotSpec(
+                        "histogram",
+                        (values,),
+                        title="Histogram of Residuals",
+                        options={"bins": 20},
+                    )
+                ),
             }
         )
 
-    overall_str = "Pass (≥ 2 of 3 passed)" if passed else "Fail (≤ 2 of 3 passed)"
-
     # Package the diagnostic results using the shared builder
     return build_result(
         name="normality",
-        passed=passed,
-        summary=(
-            f"Shapiro-Wilk p = {shapiro_pval:.4f} → "
-            f"{'Pass' if shapiro_passed else 'Fail'}, "
-            f"D'Agostino p = {dagostino_pval:.4f} → "
-            f"{'Pass' if dagostino_passed else 'Fail'}, "
-            f"Anderson stat = {anderson_stat:.4f} < (crit = {anderson_critical:.4f}) → "
-            f"{'Pass' if anderson_passed else 'Fail'}"
-            f" | Overall → {overall_str}"
-        ),
-        details={
+        statistics=statistics,
+        arrays=context.arrays,
+        plots=plots,
+        **verdict,
+    )
+
+
+def normality_statistics(residuals: np.ndarray) -> dict:
+    """
+    Raw normality statistics, as check_normality computes them (subsampled
+    above app.config.NORMALITY_LARGE_N).
+
+    Accepts one residual vector or an (n, k) matrix of residual vectors, in
+    which case every test runs for all k columns at once and each value is
+    an array of length k.
+
+    Args:
+        residuals (np.ndarray): (n,) residuals or (n, k) residual matrix.
+
+    Returns:
+        dict: 'shapiro_pval', 'dagostino_pval', 'anderson_stat',
+            'anderson_critical_5pct', 'sample_size' and 'method' (plus
+            moments and subsample settings in large-sample mode).
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    n = residuals.shape[0]
+    if n > config.NORMALITY_LARGE_N:
+        statistics = _large_sample_statistics(residuals)
+    else:
+        # Shapiro-Wilks test checks if data comes from a normally distributed
+        # population
+        shapiro_pval = shapiro_batch(residuals)
+
+        # Normal test checks whether a sample differs from a normal distribution
+        dagostino_pval = dagostino_jarque_bera_batch(residuals)["dagostino_pval"]
+
+        # Anderson test checks whether a sample differs from a specified
+        # distribution
+        anderson_stat, anderson_critical = anderson_darling_batch(residuals)
+
+        statistics = {
             "shapiro_pval": shapiro_pval,
             "dagostino_pval": dagostino_pval,
             "anderson_stat": anderson_stat,
-            "anderson_critical_5pct": anderson_critical,
-            "normality_pval_threshold": NORMALITY_PVAL_THRESHOLD,
-            "tests_used:": [
-                "Shapiro-Wilk (tests overall shape)",
-                "D'Agostino-Pearson (tests skew/kurtosis)",
-                "Anderson-Darling (emphasizes tails)",
-            ],
-        },
-        residuals=residuals,
-        fitted=y_pred,
-        plots=plots,
+            "anderson_critical_5pct": anderson_critical,  # 5%
+            "sample_size": n,
+            "method": "full",
+        }
+    if residuals.ndim == 1:
+        return {
+            key: float(value) if isinstance(value, np.ndarray) else value
+            for key, value in statistics.items()
+        }
+    return statistics
+
+
+def _large_sample_statistics(residuals: np.ndarray) -> dict:
+    """Normality statistics with time and memory bounded by the subsample size."""
+    n = residuals.shape[0]
+    size = min(config.NORMALITY_SUBSAMPLE_SIZE, n)
+    draws = config.NORMALITY_SUBSAMPLE_DRAWS
+
+    # Fixed seed so repeated runs (and cached results) agree; every column of
+    # a residual matrix is subsampled at the same rows
+    rng = np.random.default_rng(config.NORMALITY_SUBSAMPLE_SEED)
+    shapiro_pvals, anderson_stats = [], []
+    for _ in range(draws):
+        sample = residuals[rng.choice(n, size=size, replace=False)]
+        shapiro_pvals.append(shapiro_batch(sample))
+        anderson_stat, anderson_critical = anderson_darling_batch(sample)
+        anderson_stats.append(anderson_stat)
+
+    # Skew/kurtosis test on the full vector needs only its central moments
+    tests = dagostino_jarque_bera_batch(residuals)
+
+    return {
+        "shapiro_pval": np.median(shapiro_pvals, axis=0),
+        "dagostino_pval": tests["dagostino_pval"],
+        "anderson_stat": np.median(anderson_stats, axis=0),
+        # Critical values depend only on the subsample size
+        "anderson_critical_5pct": anderson_critical,
+        "skewness": tests["skewness"],
+        "kurtosis": tests["kurtosis"],
+        "sample_size": n,
+        "method": "subsample",
+        "subsample_size": size,
+        "subsample_draws": draws,
+    }
+
+
+def shapiro_batch(residuals: np.ndarray) -> np.ndarray:
+    """
+    Shapiro-Wilk p-values for a residual vector or every column of a matrix.
+
+    Unlike the other *_batch kernels this is not vectorized: scipy runs
+    Shapiro-Wilk once per column (k calls, each O(n log n)), so it only
+    gives the batched path a uniform interface.
+
+    Args:
+        residuals (np.ndarray): (n,) or (n, k) residuals.
+
+    Returns:
+        np.ndarray: p-values, shape () or (k,).
+    """
+    from scipy.stats import shapiro
+
+    return np.asarray(shapiro(residuals, axis=0).pvalue)
+
+
+def dagostino_jarque_bera_batch(residuals: np.ndarray) -> dict:
+    """
+    D'Agostino-Pearson K² and Jarque-Bera tests along axis 0.
+
+    One pass of central moments over the (n, k) matrix feeds
+    normality_from_moments; matches scipy's normaltest / jarque_bera.
+
+    Args:
+        residuals (np.ndarray): (n,) or (n, k) residuals.
+
+    Returns:
+        dict: 'skewness', 'kurtosis', 'dagostino_stat', 'dagostino_pval',
+            'jarque_bera_stat' and 'jarque_bera_pval', each of shape () or (k,).
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    centered = residuals - residuals.mean(axis=0)
+    squared = centered * centered
+    m2 = squared.mean(axis=0)
+    skewness = (squared * centered).mean(axis=0) / m2**1.5
+    kurtosis = (squared * squared).mean(axis=0) / m2**2
+    tests = normality_from_moments(residuals.shape[0], skewness, kurtosis)
+    return {"skewness": skewness, "kurtosis": kurtosis, **tests}
+
+
+# Anderson-Darling critical values for a normal with estimated mean and
+# variance at 15, 10, 5, 2.5 and 1%, as in scipy.stats.anderson
+_ANDERSON_NORMAL_CRITICAL = np.array([0.561, 0.631, 0.752, 0.873, 1.035])
+
+
+def anderson_darling_batch(residuals: np.ndarray) -> tuple:
+    """
+    Anderson-Darling normality statistic along axis 0.
+
+    Sorts every column once and evaluates the normal log-CDF in bulk;
+    matches scipy.stats.anderson(x, dist="norm").statistic.
+
+    Args:
+        residuals (np.ndarray): (n,) or (n, k) residuals.
+
+    Returns:
+        tuple: A² statistics of shape () or (k,), and the 5% critical value
+            for n observations.
+    """
+    from scipy.special import log_ndtr
+
+    residuals = np.asarray(residuals, dtype=float)
+    n = residuals.shape[0]
+    ordered = np.sort(residuals, axis=0)
+    w = (ordered - ordered.mean(axis=0)) / ordered.std(axis=0, ddof=1)
+
+    weights = (2.0 * np.arange(1, n + 1) - 1.0) / n
+    if ordered.ndim > 1:
+        weights = weights[:, None]
+    # log(1 - Φ(w)) of the reversed order statistics is log Φ(-w) reversed
+    terms = log_ndtr(w) + log_ndtr(-w)[::-1]
+    statistic = -n - np.sum(weights * terms, axis=0)
+
+    critical = np.around(_ANDERSON_NORMAL_CRITICAL / (1.0 + 0.75 / n + 2.25 / n / n), 3)
+    return statistic, critical[2]
+
+
+def normality_from_moments(n, skewness, kurtosis) -> dict:
+    """
+    D'Agostino-Pearson K² and Jarque-Bera tests from sample moments alone.
+
+    Both statistics depend on the data only through n, the (biased) sample
+    skewness and the Pearson kurtosis, so they can be computed from streamed
+    power sums without holding the residuals. Inputs broadcast, so arrays of
+    moments are tested in one call.
+
+    Args:
+        n (int or np.ndarray): Sample size(s).
+        skewness (float or np.ndarray): Sample skewness m3 / m2^1.5.
+        kurtosis (float or np.ndarray): Pearson kurtosis m4 / m2² (3 if normal).
+
+    Returns:
+        dict: 'dagostino_stat', 'dagostino_pval', 'jarque_bera_stat'
+            and 'jarque_bera_pval'.
+    """
+    from scipy.stats import chi2
+
+    n = np.asarray(n, dtype=float)
+    b1 = np.asarray(skewness, dtype=float)
+    b2 = np.asarray(kurtosis, dtype=float)
+
+    # Skewness z-score (D'Agostino 1970), as in scipy.stats.skewtest
+    y = b1 * np.sqrt(((n + 1) * (n + 3)) / (6.0 * (n - 2)))
+    beta2 = (
+        3.0
+        * (n**2 + 27 * n - 70)
+        * (n + 1)
+        * (n + 3)
+        / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9))
+    )
+    W2 = -1 + np.sqrt(2 * (beta2 - 1))
+    delta = 1 / np.sqrt(0.5 * np.log(W2))
+    alpha = np.sqrt(2.0 / (W2 - 1))
+    y = np.where(y == 0, 1, y)
+    z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+
+    # Kurtosis z-score (Anscombe & Glynn 1983), as in scipy.stats.kurtosistest
+    E = 3.0 * (n - 1) / (n + 1)
+    var_b2 = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) * (n + 1.0) * (n + 3) * (n + 5))
+    x = (b2 - E) / np.sqrt(var_b2)
+    sqrt_beta1 = (
+        6.0
+        * (n * n - 5 * n + 2)
+        / ((n + 7) * (n + 9))
+        * np.sqrt((6.0 * (n + 3) * (n + 5)) / (n * (n - 2) * (n - 3)))
+    )
+    A = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + np.sqrt(1 + 4.0 / sqrt_beta1**2))
+    term1 = 1 - 2 / (9.0 * A)
+    denom = 1 + x * np.sqrt(2 / (A - 4.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term2 = np.sign(denom) * np.cbrt((1 - 2.0 / A) / np.abs(denom))
+    z_kurt = (term1 - term2) / np.sqrt(2 / (9.0 * A))
+
+    k2 = z_skew**2 + z_kurt**2
+    jb = n / 6.0 * (b1**2 + (b2 - 3.0) ** 2 / 4.0)
+    return {
+        "dagostino_stat": k2,
+        "dagostino_pval": chi2.sf(k2, 2),
+        "jarque_bera_stat": jb,
+        "jarque_bera_pval": chi2.sf(jb, 2),
+    }
+
+
+# Normality tests the evaluator knows how to vote with, in report order:
+# (statistics key, summary label, description for "tests_used")
+_PVAL_TESTS = {
+    "shapiro": ("shapiro_pval", "Shapiro-Wilk", "Shapiro-Wilk (tests overall shape)"),
+    "dagostino": (
+        "dagostino_pval",
+        "D'Agostino",
+        "D'Agostino-Pearson (tests skew/kurtosis)",
+    ),
+    "jarque_bera": (
+        "jarque_bera_pval",
+        "Jarque-Bera",
+        "Jarque-Bera (tests skew/kurtosis)",
+    ),
+}
+
+
+@register_evaluator("normality")
+def evaluate_normality(statistics: dict, thresholds: ThresholdProfile) -> dict:
+    """
+    Derive the normality verdict (majority vote of the tests run) from raw
+    statistics.
+
+    Args:
+        statistics (dict): Raw statistics. Any of 'shapiro_pval',
+            'dagostino_pval', 'jarque_bera_pval' and the pair
+            'anderson_stat' / 'anderson_critical_5pct' cast a vote; other
+            entries (e.g. skewness) are passed through to the details.
+        thresholds (ThresholdProfile): Thresholds to judge against.
+
+    Returns:
+        dict: passed, summary, details, severity, recommendation and flag.
+    """
+    votes, severities, parts, tests_used = [], [], [], []
+    details = {}
+
+    for key, label, description in _PVAL_TESTS.values():
+        if key not in statistics:
+            continue
+        pval = statistics[key]
+        test_passed = pval > thresholds.normality_pval
+        votes.append(test_passed)
+
+        # Classify severity of violation based on the test's p-value
+        severities.append(classify_severity(pval, thresholds.pval_severity))
+        parts.append(f"{label} p = {pval:.4f} → {'Pass' if test_passed else 'Fail'}")
+        tests_used.append(description)
+        details[key] = pval
+
+    if "anderson_stat" in statistics:
+        anderson_stat = statistics["anderson_stat"]
+        anderson_critical = statistics["anderson_critical_5pct"]
+        anderson_passed = anderson_stat < anderson_critical
+        votes.append(anderson_passed)
+
+        # Manually assign severity based on how far we are from the critical value
+        # You can define custom thresholds later if needed
+        severities.append("low" if anderson_passed else "high")
+        parts.append(
+            f"Anderson stat = {anderson_stat:.4f} < (crit = {anderson_critical:.4f}) → "
+            f"{'Pass' if anderson_passed else 'Fail'}"
+        )
+        tests_used.append("Anderson-Darling (emphasizes tails)")
+        details["anderson_stat"] = anderson_stat
+        details["anderson_critical_5pct"] = anderson_critical
+
+    # Overall severity based on the "worst" test
+    severity = max(severities, key=lambda s: ["low", "moderate", "high"].index(s))
+
+    # Majority rule, e.g. at least 2 of 3 tests must pass
+    needed = len(votes) // 2 + 1
+    passed = sum(votes) >= needed
+
+    # Recommend next steps if residuals are not from a normal distribution
+    recommendation = (
+        None if passed else "Consider log-transforming Y or using robust regression."
+    )
+
+    # Set flag for UI or prioritization
+    flag = "info" if passed else "warning"
+
+    overall_str = (
+        f"Pass (≥ {needed} of {len(votes)} passed)"
+        if passed
+        else f"Fail (≤ {needed} of {len(votes)} passed)"
+    )
+
+    # Anything that did not vote (sample size, skewness, ...) is informational
+    details.update({k: v for k, v in statistics.items() if k not in details})
+    details["normality_pval_threshold"] = thresholds.normality_pval
+    details["tests_used:"] = tests_used
+
+    return dict(
+        passed=passed,
+        summary=", ".join(parts) + f" | Overall → {overall_str}",
+        details=details,
         severity=severity,
         recommendation=recommendation,
         flag=flag,
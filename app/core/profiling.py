@@ -0,0 +1,234 @@
+# app/core/profiling.py
+"""
+Per-phase timing and memory instrumentation.
+
+A Profiler records, for each phase of a check, its wall time, the CPU time
+of the thread running it and its peak traced allocation:
+
+    - fit: building FitContext intermediates (model fit, design matrix,
+      QR factors, correlation matrix, ...)
+    - statistics: the check's own computation (everything not claimed by a
+      more specific phase)
+    - plotting: drawing figures
+    - encoding: saving figures to PNG/SVG/WebP and base64 / file output
+
+Library code marks phases with the module-level phase() context manager,
+which is a no-op unless a Profiler is active in the current thread or task,
+so unprofiled runs pay one context-variable lookup per phase.
+
+Phases nest and times are exclusive: a fit triggered from inside a check's
+statistics phase is counted under fit only. Peak memory comes from
+tracemalloc and is exact for serial runs; concurrent threads share one
+tracer, so their peaks are approximate. Tracing allocations slows Python-heavy
+code (plot drawing and encoding in particular) several-fold, so the 'time'
+mode skips it when only undistorted timings are wanted.
+"""
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+__all__ = [
+    "PHASES",
+    "PROFILE_MODES",
+    "Profiler",
+    "RUN_PROFILE",
+    "notify",
+    "phase",
+    "profile_call",
+    "profile_mode",
+    "tracing",
+]
+
+# Phases reported per check, in display order
+PHASES = ("fit", "statistics", "plotting", "encoding")
+
+# 'time': wall/CPU time only; 'memory': also trace peak allocations
+PROFILE_MODES = ("time", "memory")
+
+# Name under which run-level work (shared intermediates, waiting on the
+# renderer pool) is reported to callbacks
+RUN_PROFILE = "run"
+
+Callback = Callable[[str, dict], None]
+
+_ACTIVE: ContextVar[Optional["Profiler"]] = ContextVar("profiler", default=None)
+
+
+class _Frame:
+    __slots__ = ("name", "wall", "cpu", "child_wall", "child_cpu", "base", "peak")
+
+    def __init__(self, name: str, base: int):
+        self.name = name
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.base = base  # Traced bytes at entry
+        self.peak = base  # Highest traced bytes seen so far
+
+
+class Profiler:
+    """Accumulates exclusive wall/CPU time and peak memory per phase."""
+
+    def __init__(self):
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def activate(self):
+        """Make this the profiler that phase() reports to."""
+        token = _ACTIVE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE.reset(token)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block under the given phase."""
+        stack = self._stack
+        tracing_memory = tracemalloc.is_tracing()
+        if tracing_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # Keep the enclosing phase's peak before resetting the tracer's
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+        frame = _Frame(name, current if tracing_memory else 0)
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            wall = time.perf_counter() - frame.wall
+            cpu = time.thread_time() - frame.cpu
+            peak_bytes = None
+            if tracing_memory and tracemalloc.is_tracing():
+                frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+                peak_bytes = frame.peak - frame.base
+            if stack:
+                parent = stack[-1]
+                parent.child_wall += wall
+                parent.child_cpu += cpu
+                parent.peak = max(parent.peak, frame.peak)
+            self._add(name, wall - frame.child_wall, cpu - frame.child_cpu, peak_bytes)
+            if not stack:
+                self._add("total", wall, cpu, peak_bytes)
+
+    def _add(self, name: str, wall: float, cpu: float, peak_bytes) -> None:
+        with self._lock:
+            entry = self.phases.setdefault(
+                name, {"wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": None, "calls": 0}
+            )
+            entry["wall_s"] += wall
+            entry["cpu_s"] += cpu
+            entry["calls"] += 1
+            if peak_bytes is not None:
+                entry["peak_bytes"] = max(entry["peak_bytes"] or 0, peak_bytes)
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot of the recorded phases.
+
+        Returns:
+            dict: Phase name ('fit', 'statistics', 'plotting', 'encoding',
+                plus 'total' for the outermost blocks) mapped to 'wall_s',
+                'cpu_s', 'peak_bytes' (None when memory was not traced) and
+                'calls'.
+        """
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.phases.items()}
+
+
+def phase(name: str):
+    """
+    Mark a block as belonging to a phase of the active profiler, if any.
+
+    Args:
+        name (str): One of PHASES.
+
+    Returns:
+        A context manager (a no-op when nothing is being profiled).
+    """
+    profiler = _ACTIVE.get()
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
+
+
+def profile_mode(profile: Union[bool, str]) -> Optional[str]:
+    """
+    Normalize a ``profile=`` argument.
+
+    Args:
+        profile (Union[bool, str]): False, True (same as 'memory'), or one
+            of PROFILE_MODES.
+
+    Raises:
+        ValueError: If profile is not a supported value.
+
+    Returns:
+        Optional[str]: None when profiling is off, otherwise the mode.
+    """
+    if profile is False or profile is None:
+        return None
+    if profile is True:
+        return "memory"
+    if profile not in PROFILE_MODES:
+        raise ValueError(
+            f"Unsupported profile mode: '{profile}'. "
+            f"Choose from {', '.join(PROFILE_MODES)}."
+        )
+    return profile
+
+
+@contextmanager
+def tracing(enabled: bool = True):
+    """Trace allocations for the duration of the block, unless already tracing."""
+    if not enabled or tracemalloc.is_tracing():
+        yield
+        return
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+
+def profile_call(
+    func: Callable, *args, trace_memory: bool = True, **kwargs
+) -> Tuple[object, dict]:
+    """
+    Call func under a fresh profiler, attributing unclaimed time to statistics.
+
+    Args:
+        func (Callable): Typically a registered check.
+        *args, **kwargs: Passed to func.
+        trace_memory (bool, optional): Record peak allocations with
+            tracemalloc. Defaults to True.
+
+    Returns:
+        Tuple[object, dict]: func's return value and the profile.
+    """
+    profiler = Profiler()
+    with tracing(trace_memory), profiler.activate(), profiler.phase("statistics"):
+        value = func(*args, **kwargs)
+    return value, profiler.to_dict()
+
+
+def notify(callbacks: Optional[Iterable[Callback]], name: str, profile: dict) -> None:
+    """Hand one profile to every user callback."""
+    for callback in callbacks or ():
+        callback(name, profile)
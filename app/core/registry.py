@@ -1,11 +1,18 @@
 # app/core/registry.py
-from typing import Callable, Dict
+from typing import Callable, Dict, Iterable
 
 import pandas as pd
 
+from app.config import ThresholdProfile
+from app.core.context import INTERMEDIATE_DEPENDENCIES
 from app.core.types import AssumptionResult
 
-__all__ = ["ASSUMPTION_CHECKS", "register_assumption"]
+__all__ = [
+    "ASSUMPTION_CHECKS",
+    "ASSUMPTION_EVALUATORS",
+    "register_assumption",
+    "register_evaluator",
+]
 
 ASSUMPTION_CHECKS: Dict[
     str, Callable[[pd.Series, pd.Series, bool], AssumptionResult]
@@ -13,24 +20,75 @@ ASSUMPTION_CHECKS: Dict[
 
 AssumptionCheck = Callable[[pd.Series, pd.Series, bool], AssumptionResult]
 
+# Maps raw statistics + a ThresholdProfile to verdict fields
+# (passed, summary, details, severity, recommendation, flag)
+AssumptionEvaluator = Callable[[dict, ThresholdProfile], dict]
+
+ASSUMPTION_EVALUATORS: Dict[str, AssumptionEvaluator] = {}
+
 
 def register_assumption(
-    name: str, model_types: list = ["linear"]
+    name: str,
+    model_types: list = ["linear"],
+    requires: Iterable[str] = (),
+    version: int = 1,
 ) -> Callable[[AssumptionCheck], AssumptionCheck]:
     """
     Decorator to register an assumption check function under a given name.
 
     Args:
         name (str): Assumption check name.
+        model_types (list, optional): Model types the check applies to.
+            Defaults to ["linear"].
+        requires (Iterable[str], optional): FitContext intermediates the check
+            reads (e.g. "residuals", "leverage", "correlation"). The dispatcher
+            builds only these, once per run. Defaults to ().
+        version (int, optional): Bump whenever the check's statistics or
+            verdict logic change, so cached results are invalidated.
+            Defaults to 1.
+
+    Raises:
+        ValueError: If a required intermediate is not provided by FitContext.
 
     Returns:
         Callable: A decorator that registers the function and returns it unchanged.
     """
 
+    requires = tuple(requires)
+    unknown = [key for key in requires if key not in INTERMEDIATE_DEPENDENCIES]
+    if unknown:
+        raise ValueError(f"Unknown intermediates for '{name}': {unknown}")
+
     def decorator(func: AssumptionCheck) -> AssumptionCheck:
         func._assumption_name = name
         func._model_types = model_types
+        func._requires = requires
+        func._version = version
         ASSUMPTION_CHECKS[name] = func
         return func
 
     return decorator
+
+
+def register_evaluator(
+    name: str,
+) -> Callable[[AssumptionEvaluator], AssumptionEvaluator]:
+    """
+    Decorator to register the verdict logic of an assumption check.
+
+    Evaluators must be cheap and pure: they only read the statistics a check
+    stored on its result and the thresholds, so results can be re-judged
+    without recomputing anything.
+
+    Args:
+        name (str): Assumption check name.
+
+    Returns:
+        Callable: A decorator that registers the function and returns it unchanged.
+    """
+
+    def decorator(func: AssumptionEvaluator) -> AssumptionEvaluator:
+        ASSUMPTION_EVALUATORS[name] = func
+        return func
+
+    return decorator
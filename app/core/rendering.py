@@ -0,0 +1,302 @@
+# app/core/rendering.py
+"""
+Plot rendering pipeline.
+
+Checks describe figures as lightweight PlotSpec objects instead of drawing
+them inline. A spec is turned into an image by render_spec(), either
+synchronously (standalone check calls) or on a PlotRenderer process pool
+(matplotlib is not thread-safe), whose futures the dispatcher resolves once
+the checks have finished. RenderOptions select the image format, DPI and
+where the output goes: base64 text, raw bytes, or a file in a
+content-addressed directory.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from app import config
+from app.core.profiling import phase
+from app.core.types import AssumptionResult
+from app.utils import PlotRegistry, plot_qq, plot_residuals_vs_fitted
+
+__all__ = [
+    "FORMATS",
+    "PLOT_DRAWERS",
+    "PlotRenderer",
+    "PlotSpec",
+    "RenderOptions",
+    "get_render_options",
+    "register_plot_kind",
+    "render_spec",
+    "resolve_plots",
+    "TARGETS",
+]
+
+# Supported image formats and output targets
+FORMATS = ("png", "svg", "webp")
+TARGETS = ("base64", "bytes", "directory")
+
+# Plot kind -> function drawing a PlotSpec onto a new matplotlib Figure
+PLOT_DRAWERS: Dict[str, Callable[["PlotSpec"], object]] = {}
+
+Image = Union[str, bytes]
+
+
+@dataclass(frozen=True)
+class PlotSpec:
+    """Everything needed to draw one figure, without drawing it."""
+
+    kind: str
+    arrays: Tuple[np.ndarray, ...]
+    title: str = ""
+    options: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """How rendered figures are encoded and where they are delivered."""
+
+    format: str = "png"
+    dpi: int = 100
+    target: str = "base64"
+    directory: Optional[str] = None
+
+    def __post_init__(self):
+        if self.format not in FORMATS:
+            raise ValueError(
+                f"Unsupported plot format: '{self.format}'. "
+                f"Choose from {', '.join(FORMATS)}."
+            )
+        if self.target not in TARGETS:
+            raise ValueError(
+                f"Unsupported plot target: '{self.target}'. "
+                f"Choose from {', '.join(TARGETS)}."
+            )
+        if self.target == "directory" and self.directory is None:
+            raise ValueError("The 'directory' plot target needs a directory")
+
+
+def get_render_options(**overrides) -> RenderOptions:
+    """
+    Snapshot the plot settings in app.config into a RenderOptions.
+
+    Args:
+        **overrides: RenderOptions fields to replace, e.g. ``format="svg"``.
+
+    Returns:
+        RenderOptions: Options for one run.
+    """
+    options = RenderOptions(format=config.PLOT_FORMAT, dpi=config.PLOT_DPI)
+    return replace(options, **overrides)
+
+
+def register_plot_kind(kind: str):
+    """Register the function that draws PlotSpecs of the given kind."""
+
+    def decorator(func):
+        PLOT_DRAWERS[kind] = func
+        return func
+
+    return decorator
+
+
+def render_spec(spec: PlotSpec, options: Optional[RenderOptions] = None) -> Image:
+    """
+    Draw a PlotSpec and deliver it to the configured target.
+
+    Args:
+        spec (PlotSpec): Figure to draw.
+        options (Optional[RenderOptions], optional): Format, DPI and target.
+            Defaults to None (get_render_options()).
+
+    Returns:
+        Union[str, bytes]: Base64 text, raw bytes, or the path of the written
+            file, depending on options.target.
+    """
+    if spec.kind not in PLOT_DRAWERS:
+        raise ValueError(f"Unknown plot kind: '{spec.kind}'")
+    options = options or get_render_options()
+
+    with phase("plotting"):
+        import matplotlib.pyplot as plt
+
+        fig = PLOT_DRAWERS[spec.kind](spec)
+    with phase("encoding"):
+        buf = io.BytesIO()
+        fig.savefig(buf, format=options.format, dpi=options.dpi)
+        plt.close(fig)
+        return _deliver(buf.getvalue(), options)
+
+
+def _deliver(data: bytes, options: RenderOptions) -> Image:
+    """Hand encoded image bytes to the configured target."""
+    if options.target == "bytes":
+        return data
+    if options.target == "base64":
+        return base64.b64encode(data).decode("utf-8")
+
+    # Content-addressed file: identical figures share one file
+    os.makedirs(options.directory, exist_ok=True)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    path = os.path.join(options.directory, f"{digest}.{options.format}")
+    if not os.path.exists(path):
+        fd, tmp = tempfile.mkstemp(dir=options.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return path
+
+
+class PlotRenderer:
+    """Renders PlotSpecs on a pool of worker processes."""
+
+    def __init__(
+        self,
+        options: Optional[RenderOptions] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            options (Optional[RenderOptions], optional): Format, DPI and
+                target for every figure. Defaults to None
+                (get_render_options()).
+            max_workers (Optional[int], optional): Worker processes.
+                Defaults to None (the pool's own default).
+        """
+        self.options = options or get_render_options()
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+
+    def submit(self, spec: PlotSpec) -> Future:
+        """Queue a figure; the future resolves to the rendered image."""
+        return self._pool.submit(render_spec, spec, self.options)
+
+    def render(self, spec: PlotSpec) -> Image:
+        """Render a figure and wait for it."""
+        return self.submit(spec).result()
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        self._pool.shutdown()
+
+    def __enter__(self) -> "PlotRenderer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def resolve_plots(
+    results: Dict[str, AssumptionResult], registry: PlotRegistry
+) -> Dict[str, AssumptionResult]:
+    """
+    Replace PlotSpec placeholders in results with their rendered images.
+
+    Args:
+        results (Dict[str, AssumptionResult]): Results of one run.
+        registry (PlotRegistry): The run's plot registry.
+
+    Returns:
+        Dict[str, AssumptionResult]: Results holding images only.
+    """
+    resolved = {}
+    for name, result in results.items():
+        plots = result.plots
+        if plots:
+            plots = [
+                {**plot, "image": registry.resolve(plot.get("image"))} for plot in plots
+            ]
+        resolved[name] = replace(
+            result, plot_base64=registry.resolve(result.plot_base64), plots=plots
+        )
+    return resolved
+
+
+@register_plot_kind("residuals_vs_fitted")
+def _draw_residuals_vs_fitted(spec: PlotSpec):
+    import matplotlib.pyplot as plt
+
+    fitted, residuals = spec.arrays
+    fig, ax = plt.subplots()
+    plot_residuals_vs_fitted(ax, fitted, residuals)
+    ax.axhline(0, color="red", linestyle="--")
+    ax.set_xlabel("Fitted values")
+    ax.set_ylabel("Residuals")
+    ax.set_title(spec.title)
+    return fig
+
+
+@register_plot_kind("qq")
+def _draw_qq(spec: PlotSpec):
+    import matplotlib.pyplot as plt
+
+    (residuals,) = spec.arrays
+    fig, ax = plt.subplots()
+    plot_qq(ax, residuals)
+    fig.suptitle(spec.title)
+    return fig
+
+
+@register_plot_kind("correlation_heatmap")
+def _draw_correlation_heatmap(spec: PlotSpec):
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
+    (corr,) = spec.arrays
+    labels = spec.options.get("labels")
+    fig, ax = plt.subplots()
+    sns.heatmap(
+        pd.DataFrame(corr, index=labels, columns=labels),
+        annot=True,
+        fmt=".2f",
+        cmap="coolwarm",
+        center=0,
+        ax=ax,
+    )
+    ax.set_title(spec.title)
+    return fig
+
+
+@register_plot_kind("histogram")
+def _draw_histogram(spec: PlotSpec):
+    import matplotlib.pyplot as plt
+
+    (values,) = spec.arrays
+    fig, ax = plt.subplots()
+    ax.hist(
+        values,
+        bins=spec.options.get("bins", 20),
+        alpha=0.7,
+        color="steelblue",
+        edgecolor="black",
+    )
+    ax.set_title(spec.title)
+    return fig
+
+
+@register_plot_kind("acf")
+def _draw_acf(spec: PlotSpec):
+    import matplotlib.pyplot as plt
+
+    (acf,) = spec.arrays
+    lags = np.arange(1, len(acf) + 1)
+    fig, ax = plt.subplots()
+    ax.vlines(lags, 0, acf, color="steelblue")
+    ax.plot(lags, acf, "o", color="steelblue", markersize=4)
+    ax.axhline(0, color="black", linewidth=0.8)
+
+    # Approximate 95% band for the autocorrelations of white noise
+    band = 1.96 / np.sqrt(spec.options["n"])
+    ax.axhspan(-band, band, color="red", alpha=0.15)
+    ax.set_xlabel("Lag")
+    ax.set_ylabel("Autocorrelation")
+    ax.set_title(spec.title)
+    return fig
@@ -0,0 +1,138 @@
+# app/core/rolling.py
+"""
+Rolling and expanding-window assumption monitoring for time-ordered data.
+
+Each window's statistics come from a MomentAccumulator that is updated with
+the rows entering the window and downdated with the rows leaving it, so a
+slide costs O(step·p⁴) instead of a refit over the whole window. Verdicts
+use the registered check evaluators, and columns are named after the
+AssumptionResult detail keys (r_squared, breusch_pagan_pval, ...).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import ThresholdProfile, get_thresholds
+from app.core.evaluation import evaluate
+from app.core.multicollinearity import max_vif
+from app.models.moments import MomentAccumulator, statistics_from_moments
+
+__all__ = ["rolling_checks"]
+
+
+def rolling_checks(
+    X: pd.DataFrame,
+    y: pd.Series,
+    window: int,
+    step: int = 1,
+    expanding: bool = False,
+    n_jobs: int = 1,
+    thresholds: Optional[ThresholdProfile] = None,
+) -> pd.DataFrame:
+    """
+    Compute assumption statistics over sliding or expanding windows.
+
+    Args:
+        X (pd.Series or pd.DataFrame): Time-ordered predictor values.
+        y (pd.Series): Time-ordered response values.
+        window (int): Rows per window (the first window when expanding).
+        step (int, optional): Rows between consecutive window ends.
+            Defaults to 1.
+        expanding (bool, optional): Grow windows from the first row instead of
+            sliding a fixed-size window. Defaults to False.
+        n_jobs (int, optional): Worker processes; windows are split into
+            contiguous segments, one accumulator per segment. Defaults to 1.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for the
+            pass/fail columns. Defaults to None (the module-level values in
+            app.config).
+
+    Raises:
+        ValueError: If window or step are not positive or window exceeds the
+            number of rows.
+
+    Returns:
+        pd.DataFrame: One row per window, indexed by the label of its last
+            row, with r_squared, breusch_pagan_pval, dagostino_pval,
+            jarque_bera_pval, skewness, kurtosis, max_variance_inflation_factor
+            (two or more predictors) and a '<check>_passed' column per check.
+    """
+    if isinstance(X, pd.Series):
+        X = X.to_frame()
+    n = len(X)
+    if window < 1 or step < 1:
+        raise ValueError("window and step must be positive")
+    if window > n:
+        raise ValueError(f"window ({window}) is larger than the data ({n} rows)")
+
+    values = np.column_stack([X.to_numpy(dtype=float), np.asarray(y, dtype=float)])
+    ends = np.arange(window, n + 1, step)
+    features = list(X.columns)
+    thresholds = thresholds or get_thresholds()
+
+    segments = [s for s in np.array_split(ends, max(n_jobs, 1)) if len(s)]
+    args = [(values, seg, window, expanding, features, thresholds) for seg in segments]
+    if n_jobs > 1 and len(segments) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            rows = [
+                row for part in pool.map(_roll_segment, *zip(*args)) for row in part
+            ]
+    else:
+        rows = [row for a in args for row in _roll_segment(*a)]
+
+    return pd.DataFrame(rows, index=X.index[ends - 1])
+
+
+def _roll_segment(
+    values: np.ndarray,
+    ends: np.ndarray,
+    window: int,
+    expanding: bool,
+    features: List[str],
+    thresholds: ThresholdProfile,
+) -> List[dict]:
+    """Slide one accumulator across a contiguous run of window ends."""
+    p = values.shape[1] - 1
+    rows = []
+    accumulator, start, end, replaced = None, 0, 0, 0
+
+    for new_end in ends:
+        new_start = 0 if expanding else new_end - window
+        if accumulator is None or replaced >= window:
+            # (Re)seed from scratch once every row has been swapped out, which
+            # bounds round-off drift at no extra asymptotic cost
+            accumulator = MomentAccumulator(p, order=4)
+            accumulator.update(values[new_start:new_end])
+            replaced = 0
+        else:
+            accumulator.update(values[end:new_end])
+            if new_start > start:
+                accumulator.downdate(values[start:new_start])
+                replaced += new_start - start
+        start, end = new_start, new_end
+        rows.append(_window_row(accumulator, features, thresholds))
+    return rows
+
+
+def _window_row(
+    accumulator: MomentAccumulator,
+    features: List[str],
+    thresholds: ThresholdProfile,
+) -> dict:
+    """Flatten one window's statistics and verdicts into a table row."""
+    beta, r2, _ = accumulator.ols()
+    power_sums, Zu = accumulator.residual_sums(beta)
+    statistics = statistics_from_moments(accumulator, r2, power_sums, Zu, features)
+
+    row = {"r_squared": r2}
+    row.update(statistics["homoscedasticity"])
+    row.update(statistics["normality"])
+    if "multicollinearity" in statistics:
+        row["max_variance_inflation_factor"] = max_vif(
+            statistics["multicollinearity"]["vif"]
+        )
+    for name, stats in statistics.items():
+        row[f"{name}_passed"] = evaluate(name, stats, thresholds)["passed"]
+    return row
@@ -0,0 +1,48 @@
+# app/core/streaming.py
+"""
+Run assumption checks on data that does not fit in memory.
+
+Statistics come from StreamingLinearModelWrapper's two passes over the
+chunks and are judged by the same evaluators the in-memory checks register,
+so verdicts, summaries and details line up with run_all_checks().
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.config import ThresholdProfile
+from app.core.evaluation import results_from_statistics
+from app.core.types import AssumptionResult
+from app.models.streaming_model_wrapper import ChunkSource, StreamingLinearModelWrapper
+
+__all__ = ["run_streaming_checks"]
+
+
+def run_streaming_checks(
+    chunks: ChunkSource,
+    target: str = "y",
+    features: Optional[List[str]] = None,
+    thresholds: Optional[ThresholdProfile] = None,
+) -> Tuple[Dict[str, AssumptionResult], StreamingLinearModelWrapper]:
+    """
+    Fit OLS and run the assumption checks in two streaming passes.
+
+    Normality uses the moment-based D'Agostino-Pearson and Jarque-Bera tests
+    (Shapiro-Wilk and Anderson-Darling need the full sorted sample). Results
+    carry no residual arrays or plots.
+
+    Args:
+        chunks (ChunkSource): Callable returning a fresh iterator of
+            DataFrames, or a re-iterable collection of DataFrames.
+        target (str, optional): Response column. Defaults to "y".
+        features (Optional[List[str]], optional): Predictor columns.
+            Defaults to every column except target.
+        thresholds (Optional[ThresholdProfile], optional): Thresholds for this
+            run. Defaults to None (the module-level values in app.config).
+
+    Returns:
+        Tuple[Dict[str, AssumptionResult], StreamingLinearModelWrapper]:
+            Results in registry order and the fitted streaming wrapper.
+    """
+    model_wrapper = StreamingLinearModelWrapper(chunks, target, features).fit()
+    results = results_from_statistics(model_wrapper.diagnostics(), thresholds)
+    return results, model_wrapper
@@ -3,11 +3,35 @@ from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 
-__all__ = ["AssumptionResult"]
+__all__ = ["AssumptionResult", "RunArrays"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RunArrays:
+    """Per-row arrays of one run, shared by reference by all of its results."""
+
+    residuals: np.ndarray
+    fitted: np.ndarray
+    index: Optional[pd.Index] = None  # Row labels of X / y (not copied)
+
+    @classmethod
+    def from_values(cls, residuals, fitted) -> "RunArrays":
+        """Build from array-likes (e.g. Series), keeping the row labels once."""
+        index = getattr(residuals, "index", None)
+        return cls(
+            residuals=np.asarray(residuals, dtype=float),
+            fitted=np.asarray(fitted, dtype=float),
+            index=index,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.residuals.nbytes + self.fitted.nbytes
+
+
+@dataclass(frozen=True, slots=True)
 class AssumptionResult:
     """Represents the result of a single statistical assumption check."""
 
@@ -15,10 +39,48 @@ class AssumptionResult:
     passed: bool
     summary: str  # One-liner for report
     details: dict  # Raw test stats, R², VIF, etc.
-    residuals: Optional[np.ndarray] = None
-    fitted: Optional[np.ndarray] = None
+    statistics: Optional[dict] = None  # Threshold-free inputs to the verdict
+    arrays: Optional[RunArrays] = None  # Residuals/fitted shared across the run
     plot_base64: Optional[str] = None  # For simple assumptions
     plots: Optional[list[dict]] = None  # For rich visual outputs
     severity: Optional[str] = None  # "low", "moderate", "high"
     recommendation: Optional[str] = None  # e.g., "Try log-transforming Y"
     flag: Optional[str] = None  # "warning", "critical", "info"
+    profile: Optional[dict] = None  # Per-phase timings when run with profile=True
+
+    @property
+    def residuals(self) -> Optional[np.ndarray]:
+        return None if self.arrays is None else self.arrays.residuals
+
+    @property
+    def fitted(self) -> Optional[np.ndarray]:
+        return None if self.arrays is None else self.arrays.fitted
+
+    def to_dict(self, include_arrays: bool = False) -> dict:
+        """
+        Plain-dict view of the result (slots leave no __dict__ to dump).
+
+        Args:
+            include_arrays (bool, optional): Add 'residuals' and 'fitted' as
+                lists. Defaults to False.
+
+        Returns:
+            dict: Field names mapped to values.
+        """
+        data = {
+            "name": self.name,
+            "passed": self.passed,
+            "summary": self.summary,
+            "details": self.details,
+            "statistics": self.statistics,
+            "plot_base64": self.plot_base64,
+            "plots": self.plots,
+            "severity": self.severity,
+            "recommendation": self.recommendation,
+            "flag": self.flag,
+            "profile": self.profile,
+        }
+        if include_arrays and self.arrays is not None:
+            data["residuals"] = self.arrays.residuals.tolist()
+            data["fitted"] = self.arrays.fitted.tolist()
+        return data
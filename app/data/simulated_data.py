@@ -1,4 +1,19 @@
 # app/data/simulated_data.py
+"""
+Simulated datasets with known assumption violations.
+
+Every generator takes a seed that may be an int, a SeedSequence or a
+Generator (anything np.random.default_rng accepts) and draws only from its
+own Generator, so concurrent threads or processes never share random state.
+dtype=np.float32 halves memory. Datasets larger than memory come from
+iter_simulated_data(), which yields fixed-size chunks drawn from independent
+spawned streams, or write_simulated_data(), which streams those chunks into
+a memory-mapped .npy file or a Parquet file.
+"""
+
+import os
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
 import numpy as np
 import pandas as pd
 
@@ -6,14 +21,119 @@ __all__ = [
     "generate_linear_data",
     "generate_heteroscedastic_data",
     "generate_multicollinear_data",
+    "generate_multivariate_data",
     "generate_nonlinear_data",
     "generate_skewed_data",
+    "iter_simulated_data",
     "list_simulations",
+    "write_simulated_data",
 ]
 
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+Columns = Dict[str, np.ndarray]
+
+
+def _float_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Unsupported dtype: '{dtype}'. Choose float32 or float64.")
+    return dtype
+
+
+def _normal(rng: np.random.Generator, size, dtype, scale=1.0) -> np.ndarray:
+    # scale * N(0, 1) draws the same values as rng.normal(0, scale) in float64
+    draws = rng.standard_normal(size, dtype=dtype)
+    draws *= scale
+    return draws
+
+
+def _frame(columns: Columns, start: int = 0) -> pd.DataFrame:
+    n = len(next(iter(columns.values())))
+    return pd.DataFrame(columns, index=pd.RangeIndex(start, start + n))
+
+
+# --- Samplers: column arrays for n rows drawn from one Generator ---
+
+
+def _linear(rng, n, dtype, noise_std=1.0) -> Columns:
+    x = _normal(rng, n, dtype)
+    y = _normal(rng, n, dtype, noise_std)
+    y += 3 * x
+    return {"x": x, "y": y}
+
+
+def _heteroscedastic(rng, n, dtype) -> Columns:
+    x = _normal(rng, n, dtype)
+    y = _normal(rng, n, dtype, 0.5 + 0.5 * np.abs(x))
+    y += 3 * x
+    return {"x": x, "y": y}
+
+
+def _multicollinear(rng, n, dtype) -> Columns:
+    x1 = _normal(rng, n, dtype)
+    x2 = _normal(rng, n, dtype, 0.01)
+    x2 += x1  # x2 ≈ x1
+    noise = _normal(rng, n, dtype)
+    y = 2 * x1
+    y += 3 * x2
+    y += noise
+    return {"x1": x1, "x2": x2, "y": y}
+
+
+def _multivariate_coefficients(rng, n_features=5, **_) -> dict:
+    return {"beta": rng.uniform(-2, 2, size=n_features)}
+
+
+def _multivariate(rng, n, dtype, n_features=5, noise_std=1.0, beta=None) -> Columns:
+    X = _normal(rng, (n, n_features), dtype)
+    if beta is None:
+        beta = _multivariate_coefficients(rng, n_features)["beta"]
+    y = X @ beta.astype(dtype)
+    y += _normal(rng, n, dtype, noise_std)
+    columns = {f"x{i}": X[:, i] for i in range(n_features)}
+    columns["y"] = y
+    return columns
+
+
+def _nonlinear(rng, n, dtype) -> Columns:
+    x = rng.random(n, dtype=dtype)
+    x *= 6
+    x -= 3  # Uniform on [-3, 3)
+    noise = _normal(rng, n, dtype, 0.3)
+    y = np.sin(x)
+    y += noise
+    return {"x": x, "y": y}
+
+
+def _skewed(rng, n, dtype) -> Columns:
+    x = _normal(rng, n, dtype)
+    # Exponential errors are positively skewed → residuals will be non-normal
+    y = rng.standard_exponential(n, dtype=dtype)
+    y += 2 * x
+    return {"x": x, "y": y}
+
+
+_SAMPLERS: Dict[str, Callable[..., Columns]] = {
+    "linear": _linear,
+    "heteroscedastic": _heteroscedastic,
+    "multicollinear": _multicollinear,
+    "multivariate": _multivariate,
+    "nonlinear": _nonlinear,
+    "skewed": _skewed,
+}
+
+# Parameters drawn once per dataset, so every chunk of a stream shares them
+_SHARED_PARAMETERS: Dict[str, Callable[..., dict]] = {
+    "multivariate": _multivariate_coefficients,
+}
+
 
 def generate_linear_data(
-    n_samples: int = 100, noise_std: float = 1.0, seed: int = None
+    n_samples: int = 100,
+    noise_std: float = 1.0,
+    seed: SeedLike = None,
+    dtype=np.float64,
 ) -> pd.DataFrame:
     """
     Generate simple linear data: y = 3x + noise
@@ -21,100 +141,260 @@ def generate_linear_data(
     Args:
         n_samples (int, optional): Number of observations to generate. Defaults to 100.
         noise_std (float, optional): Standard deviation of the noise. Defaults to 1.0.
-        seed (int, optional): Randomness seed. Defaults to None.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
 
     Returns:
         pd.DataFrame: A DataFrame with columns 'x' and 'y'
             where y = 3x + noise.
     """
     rng = np.random.default_rng(seed)
-    X = rng.normal(0, 1, size=n_samples)
-    noise = rng.normal(0, noise_std, size=n_samples)
-    y = 3 * X + noise
-    return pd.DataFrame({"x": X, "y": y})
+    return _frame(_linear(rng, n_samples, _float_dtype(dtype), noise_std))
 
 
 def generate_heteroscedastic_data(
-    n_samples: int = 100, seed: int = None
+    n_samples: int = 100, seed: SeedLike = None, dtype=np.float64
 ) -> pd.DataFrame:
     """
     Generate data where residual variance increases with X (heteroscedasticity).
 
     Args:
         n_samples (int, optional): Number of observations to generate. Defaults to 100.
-        seed (int, optional): Randomness seed. Defaults to None.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
 
     Returns:
         pd.DataFrame: A DataFrame with columns 'x' and 'y'
             where y = 3x + noise.
     """
     rng = np.random.default_rng(seed)
-    X = rng.normal(0, 1, size=n_samples)
-    noise = rng.normal(0, 0.5 + 0.5 * np.abs(X), size=n_samples)
-    y = 3 * X + noise
-    return pd.DataFrame({"x": X, "y": y})
+    return _frame(_heteroscedastic(rng, n_samples, _float_dtype(dtype)))
 
 
 def generate_multicollinear_data(
-    n_samples: int = 100, seed: int = None
+    n_samples: int = 100, seed: SeedLike = None, dtype=np.float64
 ) -> pd.DataFrame:
     """
     Generate data with two highly correlated predictors (multicollinearity).
 
     Args:
         n_samples (int, optional): Number of observations to generate. Defaults to 100.
-        seed (int, optional): Randomness seed. Defaults to None.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
 
     Returns:
         pd.DataFrame: A DataFrame with columns 'x1', 'x2', and 'y'
             where y = 2 * x1 + 3 * x2 + noise.
     """
     rng = np.random.default_rng(seed)
-    x1 = rng.normal(0, 1, size=n_samples)
-    x2 = x1 + rng.normal(0, 0.01, size=n_samples)  # x2 ≈ x1
-    noise = rng.normal(0, 1, size=n_samples)
-    y = 2 * x1 + 3 * x2 + noise
-    return pd.DataFrame({"x1": x1, "x2": x2, "y": y})
+    return _frame(_multicollinear(rng, n_samples, _float_dtype(dtype)))
+
+
+def generate_multivariate_data(
+    n_samples: int = 100,
+    n_features: int = 5,
+    noise_std: float = 1.0,
+    seed: SeedLike = None,
+    dtype=np.float64,
+) -> pd.DataFrame:
+    """
+    Generate linear data with independent predictors: y = X @ beta + noise,
+    with coefficients beta drawn uniformly from [-2, 2].
+
+    Args:
+        n_samples (int, optional): Number of observations to generate. Defaults to 100.
+        n_features (int, optional): Number of predictors. Defaults to 5.
+        noise_std (float, optional): Standard deviation of the noise. Defaults to 1.0.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
+
+    Returns:
+        pd.DataFrame: A DataFrame with columns 'x0' ... 'x{n_features - 1}'
+            and 'y'.
+    """
+    rng = np.random.default_rng(seed)
+    return _frame(
+        _multivariate(rng, n_samples, _float_dtype(dtype), n_features, noise_std)
+    )
 
 
-def generate_nonlinear_data(n_samples: int = 100, seed: int = None) -> pd.DataFrame:
+def generate_nonlinear_data(
+    n_samples: int = 100, seed: SeedLike = None, dtype=np.float64
+) -> pd.DataFrame:
     """
     Generate nonlinear data using y = sin(x) + noise.
 
     Args:
         n_samples (int, optional): Number of observations to generate. Defaults to 100.
-        seed (int, optional): Randomness seed. Defaults to None.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
 
     Returns:
         pd.DataFrame: A DataFrame with columns 'x' and 'y'
             where y = np.sin(X) + noise.
     """
     rng = np.random.default_rng(seed)
-    X = rng.uniform(-3, 3, size=n_samples)
-    noise = rng.normal(0, 0.3, size=n_samples)
-    y = np.sin(X) + noise
-    return pd.DataFrame({"x": X, "y": y})
+    return _frame(_nonlinear(rng, n_samples, _float_dtype(dtype)))
 
 
-def generate_skewed_data(n_samples: int = 100, seed: int = None) -> pd.DataFrame:
+def generate_skewed_data(
+    n_samples: int = 100, seed: SeedLike = None, dtype=np.float64
+) -> pd.DataFrame:
     """
     Generate linear-looking data with clearly non-normal
      residuals using an exponential noise component.
 
     Args:
         n_samples (int, optional): Number of observations to generate. Defaults to 100.
-        seed (int, optional): Randomness seed. Defaults to None.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
 
     Returns:
         pd.DataFrame: A DataFrame with columns 'x' and 'y'.
     """
-    if seed is not None:
-        np.random.seed(seed)
-    x = np.random.normal(loc=0, scale=1, size=n_samples)
-    # Exponential errors are positively skewed → residuals will be non-normal
-    error = np.random.exponential(scale=1.0, size=n_samples)
-    y = 2 * x + error
-    return pd.DataFrame({"x": x, "y": y})
+    rng = np.random.default_rng(seed)
+    return _frame(_skewed(rng, n_samples, _float_dtype(dtype)))
+
+
+def _spawn(seed: SeedLike, n: int) -> List[np.random.Generator]:
+    """n independent Generators derived from seed."""
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n)  # numpy >= 1.25
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed.spawn(n)]
+
+
+def _iter_columns(
+    name: str, n_samples: int, chunk_size: int, seed: SeedLike, dtype, params: dict
+) -> Iterator[Tuple[int, Columns]]:
+    """(first row, columns) per chunk; see iter_simulated_data()."""
+    if name not in _SAMPLERS:
+        raise ValueError(
+            f"Unknown simulation: '{name}'. Choose from {', '.join(_SAMPLERS)}."
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    sampler = _SAMPLERS[name]
+    dtype = _float_dtype(dtype)
+
+    n_chunks = max(1, -(-n_samples // chunk_size))
+    shared, *streams = _spawn(seed, n_chunks + 1)
+    if name in _SHARED_PARAMETERS:
+        params = {**_SHARED_PARAMETERS[name](shared, **params), **params}
+
+    for i, rng in enumerate(streams):
+        start = i * chunk_size
+        yield start, sampler(rng, min(chunk_size, n_samples - start), dtype, **params)
+
+
+def iter_simulated_data(
+    name: str,
+    n_samples: int,
+    chunk_size: int = 1_000_000,
+    seed: SeedLike = None,
+    dtype=np.float64,
+    **params,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a simulated dataset in chunks, without holding it in memory.
+
+    Each chunk draws from its own stream spawned from seed (and parameters
+    such as the multivariate coefficients are drawn once for the dataset),
+    so the output is reproducible for a given seed and chunk_size. It
+    differs from the one-shot generator's output for the same seed.
+
+    Args:
+        name (str): Simulation name from list_simulations().
+        n_samples (int): Total number of observations.
+        chunk_size (int, optional): Rows per chunk. Defaults to 1_000_000.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
+        **params: Generator options, e.g. noise_std or n_features.
+
+    Raises:
+        ValueError: If the name, chunk_size or dtype is invalid.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks, indexed by global row number.
+    """
+    for start, columns in _iter_columns(
+        name, n_samples, chunk_size, seed, dtype, params
+    ):
+        yield _frame(columns, start)
+
+
+def write_simulated_data(
+    name: str,
+    path: str,
+    n_samples: int,
+    chunk_size: int = 1_000_000,
+    seed: SeedLike = None,
+    dtype=np.float64,
+    **params,
+) -> List[str]:
+    """
+    Stream a simulated dataset to a memory-mapped .npy file or a Parquet file.
+
+    The data are the chunks of iter_simulated_data(); only one chunk is held
+    in memory at a time. A .npy file holds an (n_samples, n_columns) array
+    whose columns follow the returned names; a Parquet file gets one row
+    group per chunk and needs pyarrow.
+
+    Args:
+        name (str): Simulation name from list_simulations().
+        path (str): Output file ending in '.npy' or '.parquet'.
+        n_samples (int): Total number of observations.
+        chunk_size (int, optional): Rows per chunk. Defaults to 1_000_000.
+        seed (SeedLike, optional): Seed, SeedSequence or Generator. Defaults to None.
+        dtype (optional): float64 or float32. Defaults to np.float64.
+        **params: Generator options, e.g. noise_std or n_features.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+        ImportError: If a Parquet file is requested without pyarrow.
+
+    Returns:
+        List[str]: Column names, in file order.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    chunks = _iter_columns(name, n_samples, chunk_size, seed, dtype, params)
+
+    if extension == ".npy":
+        out = None
+        for start, columns in chunks:
+            if out is None:
+                out = np.lib.format.open_memmap(
+                    path, mode="w+", dtype=dtype, shape=(n_samples, len(columns))
+                )
+            stop = start + len(columns["y"])
+            for j, values in enumerate(columns.values()):
+                out[start:stop, j] = values
+        out.flush()
+        return list(columns)
+
+    if extension == ".parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Writing Parquet files requires pyarrow: pip install pyarrow"
+            ) from exc
+
+        writer = None
+        try:
+            for _, columns in chunks:
+                table = pa.table(columns)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return list(columns)
+
+    raise ValueError(f"Unsupported file type: '{extension}'. Use '.npy' or '.parquet'.")
 
 
 def list_simulations() -> dict:
@@ -129,6 +409,7 @@ def list_simulations() -> dict:
         "linear": generate_linear_data,
         "heteroscedastic": generate_heteroscedastic_data,
         "multicollinear": generate_multicollinear_data,
+        "multivariate": generate_multivariate_data,
         "nonlinear": generate_nonlinear_data,
         "skewed": generate_skewed_data,
     }
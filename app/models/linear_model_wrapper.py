@@ -1,15 +1,145 @@
-import statsmodels.api as sm
+from dataclasses import dataclass
+from typing import Optional
 
+import numpy as np
+import pandas as pd
+
+from app import config
 from app.models.base_model_wrapper import BaseModelWrapper
 
+__all__ = [
+    "ENGINES",
+    "LinearModelWrapper",
+    "OLSResults",
+    "add_constant",
+    "column_basis",
+]
+
+# Backends LinearModelWrapper can fit with
+ENGINES = ("numpy", "statsmodels")
+
+
+@dataclass
+class OLSResults:
+    """
+    Lean stand-in for statsmodels' RegressionResults holding only what the
+    checks read (no covariance matrix, inference or summary tables).
+    """
+
+    params: pd.Series
+    fittedvalues: pd.Series
+    resid: pd.Series
+    rsquared: float
+    rank: int
+    nobs: int
+
+    def predict(self, exog) -> pd.Series:
+        """Predictions for a design matrix laid out like the fitted one."""
+        values = np.asarray(exog, dtype=float) @ self.params.to_numpy()
+        return pd.Series(values, index=getattr(exog, "index", None))
+
+
+def add_constant(X: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepend a 'const' column of ones, like statsmodels' add_constant.
+
+    As in statsmodels, nothing is added when X already has a non-zero
+    constant column.
+
+    Args:
+        X (pd.DataFrame): Predictors.
+
+    Returns:
+        pd.DataFrame: Design matrix.
+    """
+    if isinstance(X, pd.Series):
+        X = X.to_frame()
+    values = X.to_numpy()
+    if values.dtype.kind in "biuf" and len(values):
+        is_const = (np.ptp(values, axis=0) == 0) & np.all(values != 0, axis=0)
+        if is_const.any():
+            return X
+    design = X.copy()
+    design.insert(0, "const", 1.0)
+    return design
+
+
+def column_basis(A: np.ndarray) -> np.ndarray:
+    """
+    Orthonormal basis of A's column space from a thin SVD.
+
+    Projecting onto it gives least-squares fitted values for any number of
+    responses; rank-deficient designs are handled like lstsq / pinv.
+
+    Args:
+        A (np.ndarray): (n, p) design matrix.
+
+    Returns:
+        np.ndarray: (n, rank) matrix with orthonormal columns.
+    """
+    U, s, _ = np.linalg.svd(np.asarray(A, dtype=float), full_matrices=False)
+    rank = int(np.sum(s > s[0] * max(A.shape) * np.finfo(float).eps)) if len(s) else 0
+    return U[:, :rank]
+
 
 class LinearModelWrapper(BaseModelWrapper):
+    def __init__(self, X, y, engine: Optional[str] = None):
+        """
+        Args:
+            X (pd.Series or pd.DataFrame): Predictors.
+            y (pd.Series): Response.
+            engine (Optional[str], optional): 'numpy' fits with one
+                least-squares solve and exposes a lean OLSResults as .model;
+                'statsmodels' builds a full statsmodels results object for
+                inference. Defaults to None (app.config.LINEAR_ENGINE).
+        """
+        super().__init__(X, y)
+        self.engine = engine or config.LINEAR_ENGINE
+        if self.engine not in ENGINES:
+            raise ValueError(
+                f"Unsupported engine: '{self.engine}'. "
+                f"Choose from {', '.join(ENGINES)}."
+            )
+
     def fit(self):
-        self.model = sm.OLS(self.y, sm.add_constant(self.X)).fit()
+        if self.engine == "statsmodels":
+            import statsmodels.api as sm
+
+            # Build the design matrix once; predict() and FitContext reuse it
+            self.design = sm.add_constant(self.X)
+            self.model = sm.OLS(self.y, self.design).fit()
+            return self
+
+        self.design = add_constant(self.X)
+        self.model = self._fit_numpy()
         return self
 
+    def _fit_numpy(self) -> OLSResults:
+        # One SVD-based least-squares solve on contiguous arrays; handles
+        # rank-deficient designs with the minimum-norm solution, as
+        # statsmodels' pinv does
+        A = np.ascontiguousarray(self.design.to_numpy(dtype=float))
+        y = np.asarray(self.y, dtype=float)
+        beta, _, rank, _ = np.linalg.lstsq(A, y, rcond=None)
+
+        fitted = A @ beta
+        resid = y - fitted
+        centered = y - y.mean()
+        tss = centered @ centered
+        rsquared = 1.0 - (resid @ resid) / tss if tss > 0 else np.nan
+
+        index = getattr(self.y, "index", None)
+        return OLSResults(
+            params=pd.Series(beta, index=self.design.columns),
+            fittedvalues=pd.Series(fitted, index=index),
+            resid=pd.Series(resid, index=index),
+            rsquared=float(rsquared),
+            rank=int(rank),
+            nobs=len(y),
+        )
+
     def predict(self):
-        return self.model.predict(sm.add_constant(self.X))
+        return self.model.predict(self.design)
 
     def residuals(self):
         return self.model.resid
@@ -0,0 +1,217 @@
+"""
+Sufficient statistics for linear regression diagnostics.
+
+A MomentAccumulator keeps the Gram matrix of augmented rows a = [1, x, y]
+(p predictors plus the response) so OLS coefficients, R² and predictor
+correlations can be recovered without holding the data. With ``order=4`` it
+keeps the fourth-order moment tensor instead, from which residual power sums
+and the Breusch-Pagan auxiliary regression follow exactly for any
+coefficient vector. Rows are shifted by the mean of the first batch before
+accumulating, which keeps the sums well conditioned when columns have large
+offsets; shifting does not change slopes, residuals, R² or correlations.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["MomentAccumulator", "statistics_from_moments"]
+
+
+class MomentAccumulator:
+    """Running moments of [1, x - shift, y - shift] over appended rows."""
+
+    def __init__(self, n_features: int, order: int = 2):
+        """
+        Args:
+            n_features (int): Number of predictors p.
+            order (int, optional): 2 keeps the (p + 2)² Gram matrix; 4 keeps
+                the (p + 2)⁴ moment tensor needed for exact residual moments
+                (updates then cost O(batch·p⁴)). Defaults to 2.
+        """
+        if order not in (2, 4):
+            raise ValueError(f"Unsupported moment order: {order}")
+        d = n_features + 2
+        self.n_features = n_features
+        self.order = order
+        self.n = 0
+        self.shift: Optional[np.ndarray] = None
+        self._moments = np.zeros((d, d) if order == 2 else (d * d, d * d))
+
+    def augment(self, values: np.ndarray) -> np.ndarray:
+        """
+        Shift an (n, p + 1) block of [x, y] rows and prepend the constant.
+
+        Args:
+            values (np.ndarray): Predictor columns followed by the response.
+
+        Returns:
+            np.ndarray: (n, p + 2) augmented rows in shifted coordinates.
+        """
+        values = np.asarray(values, dtype=float)
+        if self.shift is None:
+            self.shift = values.mean(axis=0)
+        return np.column_stack([np.ones(len(values)), values - self.shift])
+
+    def _block(self, values: np.ndarray) -> np.ndarray:
+        A = self.augment(values)
+        if self.order == 4:
+            # Row-wise a⊗a, so one BLAS product gives Σ a⊗a⊗a⊗a
+            A = (A[:, :, None] * A[:, None, :]).reshape(len(A), -1)
+        return A
+
+    def update(self, values: np.ndarray) -> "MomentAccumulator":
+        """Add a block of [x, y] rows (rank-k update of the moments)."""
+        B = self._block(values)
+        self._moments += B.T @ B
+        self.n += len(B)
+        return self
+
+    def downdate(self, values: np.ndarray) -> "MomentAccumulator":
+        """Remove a block of previously added [x, y] rows."""
+        B = self._block(values)
+        self._moments -= B.T @ B
+        self.n -= len(B)
+        return self
+
+    @property
+    def gram(self) -> np.ndarray:
+        """Σ a a' over the accumulated rows."""
+        if self.order == 2:
+            return self._moments
+        d = self.n_features + 2
+        return self._moments[0, :].reshape(d, d)
+
+    @property
+    def design_gram(self) -> np.ndarray:
+        """Z'Z for the shifted design Z = [1, x]."""
+        return self.gram[:-1, :-1]
+
+    def ols(self) -> Tuple[np.ndarray, float, float]:
+        """
+        Solve the normal equations in shifted coordinates.
+
+        Returns:
+            Tuple[np.ndarray, float, float]: Shifted coefficients
+                (intercept first), R² and the residual sum of squares.
+        """
+        gram = self.gram
+        ZZ = gram[:-1, :-1]
+        Zy = gram[:-1, -1]
+        yy = gram[-1, -1]
+        beta = np.linalg.lstsq(ZZ, Zy, rcond=None)[0]
+        rss = max(yy - beta @ Zy, 0.0)
+        tss = yy - gram[0, -1] ** 2 / self.n
+        r2 = 1.0 - rss / tss if tss > 0 else 0.0
+        return beta, r2, rss
+
+    def coefficients(self, beta: np.ndarray) -> np.ndarray:
+        """Map shifted coefficients back to the original (unshifted) scale."""
+        shift_x, shift_y = self.shift[:-1], self.shift[-1]
+        intercept = shift_y + beta[0] - shift_x @ beta[1:]
+        return np.r_[intercept, beta[1:]]
+
+    def correlation(self) -> np.ndarray:
+        """Pearson correlation matrix of the predictors."""
+        gram = self.gram
+        sums = gram[0, 1:-1]
+        cov = gram[1:-1, 1:-1] - np.outer(sums, sums) / self.n
+        scale = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return cov / np.outer(scale, scale)
+
+    def residual_sums(self, beta: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact residual moments for shifted coefficients beta (order 4 only).
+
+        With e = a·w and w = [-beta, 1], every residual power sum is a
+        contraction of the moment tensor with w.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Power sums [Σe⁰, .., Σe⁴] and
+                Z'u with u = e².
+        """
+        if self.order != 4:
+            raise ValueError("residual_sums() needs a MomentAccumulator(order=4)")
+        d = self.n_features + 2
+        w = np.r_[-beta, 1.0]
+        M = self._moments.reshape(d, d, d, d)
+        M3 = M[0]
+        ww = np.outer(w, w).ravel()
+        Zu = (M3.reshape(d, d * d) @ ww)[:-1]
+        e2 = w @ self.gram @ w
+        e3 = w @ (M3.reshape(d, d * d) @ ww)
+        e4 = ww @ self._moments @ ww
+        power_sums = np.array([self.n, self.gram[0] @ w, e2, e3, e4])
+        return power_sums, Zu
+
+
+def statistics_from_moments(
+    accumulator: MomentAccumulator,
+    r_squared: float,
+    power_sums: Optional[np.ndarray],
+    Zu: Optional[np.ndarray],
+    features: List[str],
+) -> dict:
+    """
+    Raw statistics for each applicable assumption check from residual moments.
+
+    Args:
+        accumulator (MomentAccumulator): Moments of the fitted rows.
+        r_squared (float): R² of the fit.
+        power_sums (Optional[np.ndarray]): Residual power sums
+            [Σe⁰, .., Σe⁴]; None skips the residual-based checks.
+        Zu (Optional[np.ndarray]): Z'u with u the squared residuals.
+        features (List[str]): Predictor names, in column order.
+
+    Returns:
+        dict: Check names mapped to the statistics their evaluators expect
+            ('linearity' only for one predictor, 'multicollinearity' only
+            for two or more).
+    """
+    from app.core.multicollinearity import compute_vif
+
+    p = accumulator.n_features
+    statistics = {}
+    if p == 1:
+        statistics["linearity"] = {"r_squared": float(r_squared)}
+
+    if power_sums is not None:
+        statistics.update(_residual_statistics(accumulator, power_sums, Zu))
+
+    if p >= 2:
+        vifs = compute_vif(accumulator.correlation())
+        statistics["multicollinearity"] = {"vif": dict(zip(features, vifs.tolist()))}
+    return statistics
+
+
+def _residual_statistics(
+    accumulator: MomentAccumulator, power_sums: np.ndarray, Zu: np.ndarray
+) -> dict:
+    """Breusch-Pagan and normality statistics from residual moments."""
+    from app.core.homoscedasticity import breusch_pagan_from_moments
+    from app.core.normality import normality_from_moments
+
+    n = power_sums[0]
+    _, bp_pval = breusch_pagan_from_moments(
+        n, accumulator.design_gram, Zu, power_sums[4]
+    )
+
+    # Central residual moments (the mean is ~0 with an intercept)
+    mu = power_sums[1] / n
+    s2, s3, s4 = power_sums[2:] / n
+    m2 = s2 - mu**2
+    m3 = s3 - 3 * mu * s2 + 2 * mu**3
+    m4 = s4 - 4 * mu * s3 + 6 * mu**2 * s2 - 3 * mu**4
+    skewness, kurtosis = m3 / m2**1.5, m4 / m2**2
+    tests = normality_from_moments(n, skewness, kurtosis)
+
+    return {
+        "homoscedasticity": {"breusch_pagan_pval": float(bp_pval)},
+        "normality": {
+            "dagostino_pval": float(tests["dagostino_pval"]),
+            "jarque_bera_pval": float(tests["jarque_bera_pval"]),
+            "skewness": float(skewness),
+            "kurtosis": float(kurtosis),
+        },
+    }
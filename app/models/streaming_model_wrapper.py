@@ -0,0 +1,119 @@
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.models.base_model_wrapper import BaseModelWrapper
+from app.models.moments import MomentAccumulator, statistics_from_moments
+
+ChunkSource = Union[Callable[[], Iterable[pd.DataFrame]], Iterable[pd.DataFrame]]
+
+
+class StreamingLinearModelWrapper(BaseModelWrapper):
+    """
+    Out-of-core OLS fit over an iterable of DataFrame chunks.
+
+    The first pass (fit) accumulates the Gram matrix of [1, x, y]; the second
+    pass (diagnostics) streams residuals to build the Breusch-Pagan auxiliary
+    regression and the residual moments. Peak memory is bounded by the
+    chunk size plus O(p²).
+    """
+
+    def __init__(
+        self,
+        chunks: ChunkSource,
+        target: str = "y",
+        features: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            chunks (ChunkSource): Callable returning a fresh iterator of
+                DataFrames (e.g. ``lambda: pd.read_csv(path, chunksize=100_000)``)
+                or a re-iterable collection of DataFrames. Objects with a
+                ``to_pandas()`` method (Arrow record batches) are converted.
+            target (str, optional): Response column. Defaults to "y".
+            features (Optional[List[str]], optional): Predictor columns.
+                Defaults to every column except target.
+        """
+        if not callable(chunks) and iter(chunks) is chunks:
+            raise ValueError(
+                "chunks must be re-iterable: pass a callable returning a fresh "
+                "iterator, e.g. lambda: pd.read_csv(path, chunksize=100_000)"
+            )
+        super().__init__(X=None, y=None)
+        self.chunks = chunks
+        self.target = target
+        self.features = features
+
+    def _iter_blocks(self) -> Iterator[np.ndarray]:
+        """Yield (n_chunk, p + 1) float blocks of [features, target]."""
+        source = self.chunks() if callable(self.chunks) else self.chunks
+        for chunk in source:
+            if hasattr(chunk, "to_pandas"):
+                chunk = chunk.to_pandas()
+            if self.features is None:
+                self.features = [c for c in chunk.columns if c != self.target]
+            yield chunk[self.features + [self.target]].to_numpy(dtype=float)
+
+    def fit(self):
+        self.accumulator = None
+        for block in self._iter_blocks():
+            if self.accumulator is None:
+                self.accumulator = MomentAccumulator(block.shape[1] - 1)
+            self.accumulator.update(block)
+        if self.accumulator is None:
+            raise ValueError("chunks produced no rows")
+
+        self._beta, self.r_squared, self.rss = self.accumulator.ols()
+        self.coefficients = self.accumulator.coefficients(self._beta)
+        self.n_obs = self.accumulator.n
+        return self
+
+    def iter_fitted_residuals(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Stream (fitted, residuals) arrays one chunk at a time."""
+        for block in self._iter_blocks():
+            A = self.accumulator.augment(block)
+            fitted = A[:, :-1] @ self._beta
+            yield fitted + self.accumulator.shift[-1], A[:, -1] - fitted
+
+    def predict(self):
+        return self.fitted()
+
+    def residuals(self):
+        # Materializes all n residuals; prefer iter_fitted_residuals()
+        return np.concatenate([e for _, e in self.iter_fitted_residuals()])
+
+    def fitted(self):
+        # Materializes all n fitted values; prefer iter_fitted_residuals()
+        return np.concatenate([f for f, _ in self.iter_fitted_residuals()])
+
+    def summary(self):
+        return {
+            "model_type": "Linear Regression (streaming)",
+            "r_squared": self.r_squared,
+            "n_obs": self.n_obs,
+        }
+
+    def diagnostics(self) -> dict:
+        """
+        Second pass: raw statistics for each applicable assumption check.
+
+        Returns:
+            dict: Check names mapped to the statistics their evaluators
+                expect ('linearity' only for one predictor,
+                'multicollinearity' only for two or more).
+        """
+        p = self.accumulator.n_features
+        Zu = np.zeros(p + 1)
+        power_sums = np.zeros(5)  # Σe⁰ .. Σe⁴
+
+        for block in self._iter_blocks():
+            A = self.accumulator.augment(block)
+            e = A[:, -1] - A[:, :-1] @ self._beta
+            u = e * e
+            Zu += A[:, :-1].T @ u
+            power_sums += [len(e), e.sum(), u.sum(), (u * e).sum(), (u * u).sum()]
+
+        return statistics_from_moments(
+            self.accumulator, self.r_squared, power_sums, Zu, self.features
+        )
@@ -1,10 +1,14 @@
+from typing import Optional
+
 from app.models.base_model_wrapper import BaseModelWrapper
 from app.models.linear_model_wrapper import LinearModelWrapper
 
 
-def get_model_wrapper(model_type: str, X, y) -> BaseModelWrapper:
+def get_model_wrapper(
+    model_type: str, X, y, engine: Optional[str] = None
+) -> BaseModelWrapper:
     if model_type == "linear":
-        return LinearModelWrapper(X, y).fit()
+        return LinearModelWrapper(X, y, engine=engine).fit()
     elif model_type == "PLACEHOLDER":
         ...
     else:
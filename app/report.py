@@ -2,14 +2,22 @@
 
 import argparse
 import json
+import os
 from datetime import datetime
 
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from app.core.dispatcher import run_all_checks
+from app.core.cache import ResultCache
+from app.core.dispatcher import EXECUTORS, run_all_checks
+from app.core.profiling import PHASES, PROFILE_MODES, RUN_PROFILE
+from app.core.rendering import FORMATS, get_render_options
+from app.core.types import AssumptionResult, RunArrays
 from app.data.simulated_data import list_simulations
+from app.store import ResultStore
+from app.utils import json_default
 
 
 def generate_report(
@@ -19,8 +27,16 @@ def generate_report(
     return_plot: bool = False,
     output_format: str = "console",
     verbose: bool = False,
+    executor: str = "serial",
+    max_workers: int = None,
+    cache=None,
+    thresholds=None,
+    render_options=None,
+    store=None,
+    dataset_id: str = None,
+    profile=False,
+    callbacks=None,
 ) -> None:
-
     """
     Generate an assumption diagnostic report using the registered checks.
 
@@ -28,28 +44,60 @@ def generate_report(
         X (pd.Series or pd.DataFrame): Predictor values (1D or multivariate)
         y (pd.Series): Response values.
         return_plot (bool, optional): Include base64-encoded plots in results.
-        output_format (str): 'console', 'json', or 'markdown'.
+        output_format (str): 'console', 'json', 'ndjson' (with .npy array
+            sidecars) or 'markdown'.
         verbose (bool): If True, includes extra detail in console output.
-        
+        executor (str): How to run the checks: 'serial', 'thread' or 'process'.
+        max_workers (int, optional): Worker count for the thread/process pool.
+        cache (ResultCache, optional): Reuse results for identical inputs.
+        thresholds (ThresholdProfile, optional): Thresholds for this report.
+        render_options (RenderOptions, optional): Plot format, DPI and target.
+        store (ResultStore, optional): Append this run's results to a store.
+        dataset_id (str, optional): Dataset identifier recorded in the store.
+            Defaults to "unnamed".
+        profile (bool or str, optional): Profile each check's phases (True,
+            'memory' or 'time'; see run_all_checks); the console report
+            then ends with a timing table.
+        callbacks (list, optional): Called with (name, profile) per check and
+            for the run, e.g. to forward timings to a metrics system.
+
     Raises:
         ValueError: If the output_format is not recognized.
     """
 
+    # Collect every profile (including the run-level one) for the console
+    profiles = {}
     results, model_wrapper = run_all_checks(
-        X, y, model_type=model_type, return_plot=return_plot
+        X,
+        y,
+        model_type=model_type,
+        return_plot=return_plot,
+        executor=executor,
+        max_workers=max_workers,
+        cache=cache,
+        thresholds=thresholds,
+        render_options=render_options,
+        profile=profile,
+        callbacks=[profiles.__setitem__, *(callbacks or [])],
     )
 
+    if store is not None:
+        store.add_run(results, dataset_id or "unnamed", model_type=model_type)
+
     if output_format == "console":
         print_console_report(results, model_wrapper=model_wrapper, verbose=verbose)
+        if profiles:
+            print_profile_report(profiles)
     elif output_format == "json":
         export_to_json(results)
+    elif output_format == "ndjson":
+        print(f"✅ Report saved to {export_to_ndjson(results)}")
     elif output_format == "markdown":
         export_to_markdown(results)
     else:
         raise ValueError("Unsupported output format")
 
 
-
 def print_console_report(results, model_wrapper, verbose: bool = False):
     """
     Print a structured Rich panel for each assumption result.
@@ -87,6 +135,8 @@ def print_console_report(results, model_wrapper, verbose: bool = False):
             "breusch_pagan_pval": "≥",
             "shapiro_pval": "≥",
             "dagostino_pval": "≥",
+            "jarque_bera_pval": "≥",
+            "ljung_box_pval": "≥",
             "anderson_stat": "≤",
             "vif": "≤",
         }
@@ -96,6 +146,8 @@ def print_console_report(results, model_wrapper, verbose: bool = False):
             "breusch_pagan_pval": "homoscedasticity_pval_threshold",
             "shapiro_pval": "normality_pval_threshold",
             "dagostino_pval": "normality_pval_threshold",
+            "jarque_bera_pval": "normality_pval_threshold",
+            "ljung_box_pval": "independence_pval_threshold",
             # Add others as needed
         }
 
@@ -175,25 +227,140 @@ def print_console_report(results, model_wrapper, verbose: bool = False):
         )
 
 
-def export_to_json(results, filename: str = None) -> None:
+def print_profile_report(profiles: dict) -> None:
+    """
+    Print per-check phase timings as a Rich table.
+
+    Args:
+        profiles (dict): Check names (and 'run' for shared work) mapped to
+            profiles from run_all_checks(profile=...).
+    """
+    table = Table(title="Profile (wall ms per phase)")
+    table.add_column("Check", no_wrap=True)
+    headers = {"statistics": "Stats", "plotting": "Plot", "encoding": "Encode"}
+    for phase in PHASES:
+        table.add_column(headers.get(phase, phase.title()), justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("CPU", justify="right")
+    table.add_column("Peak MiB", justify="right")
+
+    def ms(entry):
+        return f"{entry['wall_s'] * 1e3:.1f}" if entry else "—"
+
+    for name, profile in profiles.items():
+        total = profile.get("total") or {}
+        peak = total.get("peak_bytes")
+        table.add_row(
+            "shared" if name == RUN_PROFILE else name,
+            *(ms(profile.get(phase)) for phase in PHASES),
+            ms(total),
+            f"{total['cpu_s'] * 1e3:.1f}" if total else "—",
+            "—" if peak is None else f"{peak / 2**20:.1f}",
+        )
+    Console().print(table)
+
+
+def export_to_json(results, filename: str = None, include_arrays: bool = False) -> None:
     """
     Save data to json file.
 
     Args:
         results (dict): Assumption names mapped to AssumptionResult objects.
         filename (str, optional): Output filename. Defaults to None.
+        include_arrays (bool, optional): Include per-row residuals and fitted
+            values. Defaults to False.
     """
-    payload = {k: r.__dict__ for k, r in results.items()}
+    payload = {k: r.to_dict(include_arrays=include_arrays) for k, r in results.items()}
 
     # Default to timestamped filename if none provided
     filename = (
         filename or f"assumption_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     )
     with open(filename, "w") as f:
-        json.dump(payload, f, indent=2)
+        json.dump(payload, f, indent=2, default=json_default)
     print(f"✅ Report saved to {filename}")
 
 
+def export_to_ndjson(results, filename: str = None, include_arrays: bool = True) -> str:
+    """
+    Stream results to disk: one compact JSON line per result, with per-row
+    arrays written once per run as binary .npy sidecars next to it.
+
+    Args:
+        results (dict): Assumption names mapped to AssumptionResult objects.
+        filename (str, optional): Output .ndjson filename. Defaults to None
+            (timestamped).
+        include_arrays (bool, optional): Write residuals/fitted sidecars.
+            Defaults to True.
+
+    Returns:
+        str: Path of the .ndjson file.
+    """
+    # Default to timestamped filename if none provided
+    filename = (
+        filename
+        or f"assumption_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+    )
+    stem = filename[: -len(".ndjson")] if filename.endswith(".ndjson") else filename
+
+    sidecars = {}  # id(RunArrays) -> {"residuals": file, "fitted": file}
+    with open(filename, "w") as f:
+        for result in results.values():
+            line = result.to_dict()
+            arrays = result.arrays if include_arrays else None
+            if arrays is not None:
+                if id(arrays) not in sidecars:
+                    # Results of one run share arrays, so each is written once
+                    suffix = f".{len(sidecars)}" if sidecars else ""
+                    files = {}
+                    for key in ("residuals", "fitted"):
+                        path = f"{stem}{suffix}.{key}.npy"
+                        np.save(path, getattr(arrays, key))
+                        files[key] = os.path.basename(path)
+                    sidecars[id(arrays)] = files
+                line["arrays"] = sidecars[id(arrays)]
+            f.write(json.dumps(line, separators=(",", ":"), default=json_default))
+            f.write("\n")
+    return filename
+
+
+def load_ndjson_report(filename: str, mmap: bool = True) -> dict:
+    """
+    Load results written by export_to_ndjson.
+
+    Args:
+        filename (str): Path of the .ndjson file.
+        mmap (bool, optional): Memory-map the .npy sidecars read-only instead
+            of reading them into memory. Defaults to True.
+
+    Returns:
+        dict: Assumption names mapped to AssumptionResult objects; results
+            that shared arrays share one RunArrays again.
+    """
+    directory = os.path.dirname(filename)
+    loaded = {}  # sidecar file names -> RunArrays
+    results = {}
+    with open(filename) as f:
+        for raw in f:
+            line = json.loads(raw)
+            files = line.pop("arrays", None)
+            arrays = None
+            if files is not None:
+                key = (files["residuals"], files["fitted"])
+                if key not in loaded:
+                    residuals, fitted = (
+                        np.load(
+                            os.path.join(directory, name),
+                            mmap_mode="r" if mmap else None,
+                        )
+                        for name in key
+                    )
+                    loaded[key] = RunArrays(residuals=residuals, fitted=fitted)
+                arrays = loaded[key]
+            results[line["name"]] = AssumptionResult(**line, arrays=arrays)
+    return results
+
+
 def export_to_markdown(results, filename: str = None) -> None:
     """
     Save data to markdown file.
@@ -240,7 +407,7 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--format",
-        choices=["console", "json", "markdown"],
+        choices=["console", "json", "ndjson", "markdown"],
         default="console",
         help="Output format.",
     )
@@ -252,6 +419,53 @@ if __name__ == "__main__":
     parser.add_argument(
         "--plot", action="store_true", help="Include base64-encoded plots."
     )
+    parser.add_argument(
+        "--plot-format",
+        choices=FORMATS,
+        default=None,
+        help="Image format for plots (defaults to app.config.PLOT_FORMAT).",
+    )
+    parser.add_argument(
+        "--plot-dpi", type=int, default=None, help="Resolution of rendered plots."
+    )
+    parser.add_argument(
+        "--plot-dir",
+        default=None,
+        help="Write plots to this content-addressed directory instead of inline.",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        default="serial",
+        help="Run checks serially or concurrently in a thread/process pool.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Worker count for the thread/process pool.",
+    )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="Append results to this SQLite result store (see app/store.py).",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="memory",
+        default=False,
+        choices=PROFILE_MODES,
+        help=(
+            "Print wall/CPU time and peak memory per check phase; 'time' "
+            "skips memory tracing, which slows the run."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache results on disk here and reuse them for identical inputs.",
+    )
 
     args = parser.parse_args()
 
@@ -266,6 +480,15 @@ if __name__ == "__main__":
     X = df.drop(columns="y")
     y = df["y"]
 
+    # Only override the configured plot settings the user asked to change
+    plot_overrides = {
+        key: value
+        for key, value in (("format", args.plot_format), ("dpi", args.plot_dpi))
+        if value is not None
+    }
+    if args.plot_dir:
+        plot_overrides.update(target="directory", directory=args.plot_dir)
+
     generate_report(
         X,
         y,
@@ -273,4 +496,11 @@ if __name__ == "__main__":
         return_plot=args.plot,
         output_format=args.format,
         verbose=args.verbose,
+        executor=args.executor,
+        max_workers=args.max_workers,
+        cache=ResultCache(directory=args.cache_dir) if args.cache_dir else None,
+        render_options=get_render_options(**plot_overrides),
+        store=ResultStore(args.store) if args.store else None,
+        dataset_id=args.data,
+        profile=args.profile,
     )
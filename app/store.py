@@ -0,0 +1,250 @@
+# app/store.py
+"""
+Persistent, queryable store of assumption check results.
+
+Each run appends one row per check to a local SQLite database, with indexed
+columns for the dataset id, model type, check name, verdict, severity and
+run time, plus the key statistics as plain numeric columns. That answers
+questions such as "which datasets failed homoscedasticity last month"
+without re-running checks or parsing report files.
+"""
+
+import json
+import sqlite3
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from app.core.multicollinearity import max_vif
+from app.core.types import AssumptionResult
+from app.utils import json_default
+
+__all__ = ["KEY_STATISTICS", "ResultStore"]
+
+# Raw statistics stored in their own columns (NULL when a check lacks them);
+# max_vif is derived from the multicollinearity VIFs
+KEY_STATISTICS = (
+    "r_squared",
+    "breusch_pagan_pval",
+    "shapiro_pval",
+    "dagostino_pval",
+    "jarque_bera_pval",
+    "max_vif",
+    "ljung_box_pval",
+    "durbin_watson",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    dataset_id TEXT NOT NULL,
+    model_type TEXT,
+    check_name TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    severity TEXT,
+    flag TEXT,
+    {", ".join(f"{key} REAL" for key in KEY_STATISTICS)},
+    summary TEXT,
+    statistics TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_dataset ON results (dataset_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_check
+    ON results (check_name, passed, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_model ON results (model_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_severity ON results (severity);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id);
+"""
+
+_COLUMNS = (
+    "run_id",
+    "created_at",
+    "dataset_id",
+    "model_type",
+    "check_name",
+    "passed",
+    "severity",
+    "flag",
+    *KEY_STATISTICS,
+    "summary",
+    "statistics",
+)
+
+Run = Tuple[Dict[str, AssumptionResult], str, Optional[str]]
+
+
+def _iso(moment: datetime) -> str:
+    """UTC ISO-8601 text, so stored times compare correctly as strings."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+
+def _key_statistics(statistics: Optional[dict]) -> List[Optional[float]]:
+    """Pull the indexed statistics out of a result's raw statistics."""
+    statistics = statistics or {}
+    values = {key: statistics.get(key) for key in KEY_STATISTICS}
+    if statistics.get("vif"):
+        values["max_vif"] = max_vif(statistics["vif"])
+    return [None if v is None else float(v) for v in values.values()]
+
+
+class ResultStore:
+    """SQLite-backed history of assumption check runs."""
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path (str, optional): Database file; created if missing.
+                Defaults to ":memory:".
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        if path != ":memory:":
+            # WAL lets dashboards read while a batch job appends
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self) -> None:
+        """Add key statistic columns introduced after a database was created."""
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+        with self._conn:
+            for key in KEY_STATISTICS:
+                if key not in existing:
+                    self._conn.execute(f"ALTER TABLE results ADD COLUMN {key} REAL")
+
+    def add_run(
+        self,
+        results: Dict[str, AssumptionResult],
+        dataset_id: str,
+        model_type: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+    ) -> str:
+        """
+        Append one run's results.
+
+        Args:
+            results (Dict[str, AssumptionResult]): Results of one run.
+            dataset_id (str): Identifier of the dataset the run checked.
+            model_type (Optional[str], optional): Model type of the run.
+                Defaults to None.
+            created_at (Optional[datetime], optional): Run time; naive times
+                are taken as UTC. Defaults to None (now).
+
+        Returns:
+            str: Generated run id.
+        """
+        return self.add_runs([(results, dataset_id, model_type)], created_at)[0]
+
+    def add_runs(
+        self, runs: Iterable[Run], created_at: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Append many runs in a single transaction.
+
+        Args:
+            runs (Iterable[Tuple[dict, str, Optional[str]]]): (results,
+                dataset_id, model_type) per run.
+            created_at (Optional[datetime], optional): Time stamped on every
+                run. Defaults to None (now, UTC).
+
+        Returns:
+            List[str]: Generated run ids, in input order.
+        """
+        timestamp = _iso(created_at or datetime.now(timezone.utc))
+        run_ids, rows = [], []
+        for results, dataset_id, model_type in runs:
+            run_id = uuid.uuid4().hex
+            run_ids.append(run_id)
+            for name, result in results.items():
+                rows.append(
+                    (
+                        run_id,
+                        timestamp,
+                        dataset_id,
+                        model_type,
+                        name,
+                        int(bool(result.passed)),
+                        result.severity,
+                        result.flag,
+                        *_key_statistics(result.statistics),
+                        result.summary,
+                        json.dumps(result.statistics, default=json_default),
+                    )
+                )
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO results ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                rows,
+            )
+        return run_ids
+
+    def query(
+        self,
+        dataset_id: Optional[str] = None,
+        model_type: Optional[str] = None,
+        check: Optional[str] = None,
+        passed: Optional[bool] = None,
+        severity: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Filter stored results; every argument left as None matches all rows.
+
+        Args:
+            dataset_id (Optional[str], optional): Dataset identifier.
+            model_type (Optional[str], optional): Model type.
+            check (Optional[str], optional): Check name, e.g. 'normality'.
+            passed (Optional[bool], optional): Verdict.
+            severity (Optional[str], optional): 'low', 'moderate' or 'high'.
+            since (Optional[datetime], optional): Earliest run time (inclusive).
+            until (Optional[datetime], optional): Latest run time (exclusive).
+            limit (Optional[int], optional): Maximum rows, newest first.
+
+        Returns:
+            pd.DataFrame: Matching rows, newest first, with 'passed' as bool
+                and 'created_at' as timestamps.
+        """
+        filters = [
+            ("dataset_id = ?", dataset_id),
+            ("model_type = ?", model_type),
+            ("check_name = ?", check),
+            ("passed = ?", None if passed is None else int(passed)),
+            ("severity = ?", severity),
+            ("created_at >= ?", _iso(since) if since else None),
+            ("created_at < ?", _iso(until) if until else None),
+        ]
+        clauses = [clause for clause, value in filters if value is not None]
+        params = [value for _, value in filters if value is not None]
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM results"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        frame = pd.read_sql_query(sql, self._conn, params=params)
+        frame["passed"] = frame["passed"].astype(bool)
+        frame["created_at"] = pd.to_datetime(frame["created_at"], format="ISO8601")
+        return frame
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
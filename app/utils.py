@@ -1,28 +1,228 @@
 # app/utils.py
 import base64
+import hashlib
 import io
-from typing import Any, Dict, List, Optional
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from app.core.types import AssumptionResult
+from app import config
+from app.core.types import AssumptionResult, RunArrays
 
-__all__ = ["fig_to_base64", "build_result", "classify_severity"]
+__all__ = [
+    "PlotRegistry",
+    "fig_to_base64",
+    "json_default",
+    "build_result",
+    "classify_severity",
+    "binned_quantiles",
+    "plot_qq",
+    "plot_key",
+    "plot_residuals_vs_fitted",
+    "qq_quantiles",
+]
 
 
 def fig_to_base64(fig) -> str:
+    import matplotlib.pyplot as plt
+
     buf = io.BytesIO()
     fig.savefig(buf, format="png")
     plt.close(fig)
     return base64.b64encode(buf.getvalue()).decode("utf-8")
 
 
+def json_default(value):
+    """Convert NumPy scalars/arrays and raw image bytes for json.dump(default=...)."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("utf-8")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def plot_key(kind: str, *arrays) -> str:
+    """
+    Identify a figure by its kind and the exact contents of its source arrays.
+
+    Args:
+        kind (str): Plot kind, e.g. 'residuals_vs_fitted'.
+        *arrays: Arrays (or Series) the figure is drawn from.
+
+    Returns:
+        str: Hex digest usable as a PlotRegistry key.
+    """
+    h = hashlib.blake2b(kind.encode(), digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(np.asarray(array, dtype=float))
+        h.update(repr(array.shape).encode())
+        h.update(array.data)
+    return h.hexdigest()
+
+
+def _spec_kind(spec) -> str:
+    """Everything but the arrays that makes a PlotSpec's figure distinct."""
+    options = json.dumps(spec.options, sort_keys=True, default=str)
+    return f"{spec.kind}|{spec.title}|{options}"
+
+
+class PlotRegistry:
+    """
+    Run-scoped store of encoded figures, so a figure shared by several checks
+    is rendered and encoded once and every result references the same image.
+
+    Without a renderer, request() draws figures synchronously. With a
+    PlotRenderer attached (see app.core.rendering), request() queues the
+    figure on the renderer's process pool and returns the PlotSpec as a
+    placeholder that resolve() later swaps for the finished image.
+    """
+
+    def __init__(self, options=None):
+        """
+        Args:
+            options (Optional[RenderOptions], optional): Format, DPI and target
+                for synchronously rendered figures. Defaults to None (the
+                plot settings in app.config).
+        """
+        self.options = options
+        self.renderer = None
+        self.deferred = False
+        self.renders = 0
+        self.hits = 0
+        self._images: Dict[str, Any] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_render(
+        self, kind: str, arrays: Sequence[Any], render: Callable[[], str]
+    ) -> str:
+        """
+        Return the encoded figure for (kind, arrays), rendering it on first use.
+
+        Args:
+            kind (str): Plot kind, e.g. 'residuals_vs_fitted'.
+            arrays (Sequence[Any]): Source arrays the figure is drawn from.
+            render (Callable[[], str]): Draws and encodes the figure.
+
+        Returns:
+            str: Encoded image.
+        """
+        key = plot_key(kind, *arrays)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent checks asking for the same figure wait for one render
+        with key_lock:
+            if key in self._images:
+                with self._lock:
+                    self.hits += 1
+                return self._images[key]
+            image = render()
+            with self._lock:
+                self._images[key] = image
+                self.renders += 1
+            return image
+
+    def request(self, spec) -> Any:
+        """
+        Image for a PlotSpec, or the spec itself while its render is pending.
+
+        Args:
+            spec (PlotSpec): Figure a check wants to attach to its result.
+
+        Returns:
+            Any: The rendered image, or the PlotSpec as a placeholder when a
+                renderer is attached or rendering is deferred to the parent
+                process.
+        """
+        from app.core.rendering import render_spec
+
+        kind = _spec_kind(spec)
+        if self.renderer is None:
+            if self.deferred:
+                return spec
+            return self.get_or_render(
+                kind, spec.arrays, lambda: render_spec(spec, self.options)
+            )
+
+        key = plot_key(kind, *spec.arrays)
+        with self._lock:
+            if key in self._images:
+                self.hits += 1
+            else:
+                self._images[key] = self.renderer.submit(spec)
+                self.renders += 1
+        return spec
+
+    def resolve(self, image: Any) -> Any:
+        """
+        Swap a PlotSpec placeholder for its rendered image, waiting if needed.
+
+        Args:
+            image (Any): A result's image field (placeholder, image or None).
+
+        Returns:
+            Any: The rendered image, or the input unchanged if it was not a
+                placeholder.
+        """
+        from app.core.rendering import PlotSpec, render_spec
+
+        if not isinstance(image, PlotSpec):
+            return image
+        spec = image
+        kind = _spec_kind(spec)
+        key = plot_key(kind, *spec.arrays)
+
+        with self._lock:
+            entry = self._images.get(key)
+            if entry is None and self.renderer is not None:
+                # Deferred by a worker process; queue it here
+                entry = self._images[key] = self.renderer.submit(spec)
+                self.renders += 1
+        if entry is None:
+            return self.get_or_render(
+                kind, spec.arrays, lambda: render_spec(spec, self.options)
+            )
+        if isinstance(entry, Future):
+            entry = entry.result()
+            with self._lock:
+                self._images[key] = entry
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __getstate__(self) -> dict:
+        # Locks, pools and futures cannot be pickled. Worker processes get
+        # fresh locks and, if a renderer is attached here, defer rendering
+        # back to this process so shared figures are still drawn once.
+        state = self.__dict__.copy()
+        del state["_key_locks"], state["_lock"]
+        state["deferred"] = self.deferred or self.renderer is not None
+        state["renderer"] = None
+        state["_images"] = {
+            k: v for k, v in self._images.items() if not isinstance(v, Future)
+        }
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+
 def build_result(
     name: str,
     passed: bool,
     summary: str,
     details: Dict[str, Any],
+    statistics: Optional[Dict[str, Any]] = None,
+    arrays: Optional[RunArrays] = None,
     residuals: Optional[np.ndarray] = None,
     fitted: Optional[np.ndarray] = None,
     plot_base64: Optional[str] = None,
@@ -39,10 +239,14 @@ def build_result(
         passed (bool): Whether the assumption check passed.
         summary (str): Short summary of result.
         details (Dict[str, Any]): Test statistics, p-values, etc.
-        residuals (Optional[np.ndarray], optional): Residuals from model.
-            Defaults to None.
-        fitted (Optional[np.ndarray], optional): Fitted values from model.
-            Defaults to None.
+        statistics (Optional[Dict[str, Any]], optional): Raw, threshold-free
+            statistics the verdict was derived from. Defaults to None.
+        arrays (Optional[RunArrays], optional): The run's shared residuals and
+            fitted values. Defaults to None.
+        residuals (Optional[np.ndarray], optional): Residuals from model, used
+            when arrays is not given. Defaults to None.
+        fitted (Optional[np.ndarray], optional): Fitted values from model, used
+            when arrays is not given. Defaults to None.
         plot_base64 (Optional[str], optional): Base64 image string for primary plot.
             Defaults to None.
         plots (Optional[List[Dict[str, str]]], optional): Additional plots with titles
@@ -57,13 +261,15 @@ def build_result(
     Returns:
         AssumptionResult: Complete diagnostic output
     """
+    if arrays is None and residuals is not None:
+        arrays = RunArrays.from_values(residuals, fitted)
     return AssumptionResult(
         name=name,
         passed=passed,
         summary=summary,
         details=details,
-        residuals=residuals,
-        fitted=fitted,
+        statistics=statistics,
+        arrays=arrays,
         plot_base64=plot_base64,
         plots=plots,
         severity=severity,
@@ -89,3 +295,113 @@ def classify_severity(value: float, thresholds: dict) -> str:
         return "moderate"
     else:
         return "low"
+
+
+def binned_quantiles(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_bins: int,
+    quantiles: Sequence[float] = (0.1, 0.5, 0.9),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantiles of y within equal-count bins of x (a cheap smoother for big n).
+
+    Args:
+        x (np.ndarray): Values to bin on (e.g. fitted values).
+        y (np.ndarray): Values to summarize per bin (e.g. residuals).
+        n_bins (int): Number of bins.
+        quantiles (Sequence[float], optional): Quantiles of y to compute.
+            Defaults to (0.1, 0.5, 0.9).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Bin centers (median x per bin) and an
+            (n_bins, len(quantiles)) array of y quantiles.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.quantile(x, np.linspace(0, 1, n_bins + 1))
+    bins = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, n_bins - 1)
+
+    # One sort groups the rows by bin; split at the cumulative bin counts
+    # rather than scanning all n rows once per bin
+    order = np.argsort(bins, kind="stable")
+    splits = np.cumsum(np.bincount(bins, minlength=n_bins))[:-1]
+
+    centers, values = [], []
+    for rows in np.split(order, splits):
+        if len(rows):
+            centers.append(np.median(x[rows]))
+            values.append(np.quantile(y[rows], quantiles))
+    return np.array(centers), np.array(values)
+
+
+def qq_quantiles(residuals: np.ndarray, n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normal Q-Q coordinates at n_points evenly spaced plotting positions.
+
+    Args:
+        residuals (np.ndarray): Residuals to compare against the normal.
+        n_points (int): Number of quantiles to return.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Theoretical and sample quantiles.
+    """
+    from scipy.stats import norm
+
+    probs = (np.arange(1, n_points + 1) - 0.5) / n_points
+    return norm.ppf(probs), np.quantile(residuals, probs)
+
+
+def plot_residuals_vs_fitted(ax, fitted: np.ndarray, residuals: np.ndarray) -> None:
+    """
+    Draw residuals against fitted values, as a density above
+    config.PLOT_DENSITY_THRESHOLD points so render time and image size stay flat.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        fitted (np.ndarray): Fitted values (x axis).
+        residuals (np.ndarray): Residuals (y axis).
+    """
+    fitted = np.asarray(fitted, dtype=float)
+    residuals = np.asarray(residuals, dtype=float)
+    if len(residuals) <= config.PLOT_DENSITY_THRESHOLD:
+        ax.scatter(fitted, residuals, alpha=0.7)
+        return
+
+    # Log-scaled hexbin density plus a binned 10/50/90% quantile smoother
+    ax.hexbin(
+        fitted,
+        residuals,
+        gridsize=config.PLOT_HEXBIN_GRIDSIZE,
+        bins="log",
+        mincnt=1,
+        cmap="Blues",
+    )
+    centers, bands = binned_quantiles(fitted, residuals, config.PLOT_SMOOTHER_BINS)
+    ax.plot(centers, bands[:, 1], color="black", label="Binned median")
+    ax.plot(centers, bands[:, 0], color="black", linestyle=":", label="10% / 90%")
+    ax.plot(centers, bands[:, 2], color="black", linestyle=":")
+    ax.legend(loc="best")
+
+
+def plot_qq(ax, residuals: np.ndarray) -> None:
+    """
+    Draw a normal Q-Q plot with a 45° reference line, thinned to
+    config.PLOT_QQ_POINTS quantiles above config.PLOT_DENSITY_THRESHOLD points.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        residuals (np.ndarray): Residuals to compare against the normal.
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    if len(residuals) <= config.PLOT_DENSITY_THRESHOLD:
+        import statsmodels.api as sm
+
+        sm.qqplot(residuals, line="45", ax=ax)
+        return
+
+    theoretical, sample = qq_quantiles(residuals, config.PLOT_QQ_POINTS)
+    ax.plot(theoretical, sample, "o", markersize=3)
+    ax.axline((0, 0), slope=1, color="r")
+    ax.set_xlabel("Theoretical Quantiles")
+    ax.set_ylabel("Sample Quantiles")
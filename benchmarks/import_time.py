@@ -0,0 +1,97 @@
+# benchmarks/import_time.py
+"""
+Cold-start import benchmark.
+
+Imports a module in fresh interpreters and reports the median wall time and
+which heavy optional libraries were loaded as a side effect. Exits non-zero
+when the median exceeds the budget or a heavy library is loaded, so it can
+gate CI:
+
+    python -m benchmarks.import_time --module app.core.dispatcher --budget 1.0
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import List
+
+__all__ = ["HEAVY_MODULES", "loaded_heavy_modules", "measure_import"]
+
+# Libraries that must only load on first use of a check or a plot
+HEAVY_MODULES = ("matplotlib", "seaborn", "statsmodels", "scipy.stats", "sklearn")
+
+# Probes run from the repository root so `app` is importable
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+
+def _probe(code: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(code=code, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=_ROOT,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def loaded_heavy_modules(code: str) -> List[str]:
+    """
+    Heavy libraries loaded by running code in a fresh interpreter.
+
+    Args:
+        code (str): Python statements, e.g. 'import app.core.dispatcher'.
+
+    Returns:
+        List[str]: Entries of HEAVY_MODULES present in sys.modules afterwards.
+    """
+    return _probe(code)["heavy"]
+
+
+def measure_import(module: str, repeats: int = 5) -> dict:
+    """
+    Median cold import time of a module over fresh interpreters.
+
+    Args:
+        module (str): Dotted module name.
+        repeats (int, optional): Number of interpreters to start. Defaults to 5.
+
+    Returns:
+        dict: 'module', 'median_seconds', 'runs' and 'heavy' (heavy
+            libraries loaded by the import).
+    """
+    probes = [_probe(f"import {module}") for _ in range(repeats)]
+    runs = [p["seconds"] for p in probes]
+    return {
+        "module": module,
+        "median_seconds": statistics.median(runs),
+        "runs": runs,
+        "heavy": probes[-1]["heavy"],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure cold-start import time.")
+    parser.add_argument("--module", default="app.core.dispatcher")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--budget", type=float, default=1.0, help="Maximum median seconds."
+    )
+    args = parser.parse_args()
+
+    report = measure_import(args.module, args.repeats)
+    print(json.dumps(report, indent=2))
+    if report["median_seconds"] > args.budget or report["heavy"]:
+        sys.exit(1)
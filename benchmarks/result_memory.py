@@ -0,0 +1,99 @@
+# benchmarks/result_memory.py
+"""
+Per-run result footprint benchmark.
+
+Compares the memory retained by, and the pickled size of, the results of one
+run_all_checks() call:
+
+    - per_result_copies: each residual-based result holding its own residual
+      and fitted Series (the previous layout, e.g. after a process-pool run
+      or when results are cached one by one)
+    - shared: the default, one RunArrays shared by every result
+    - summary_only: keep_arrays=False
+
+    python -m benchmarks.result_memory --rows 1000000
+"""
+
+import argparse
+import gc
+import json
+import pickle
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from app.core.dispatcher import run_all_checks
+
+__all__ = ["measure_results"]
+
+
+def _retained(build) -> tuple:
+    """Bytes still allocated by build()'s return value, and the value."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, value
+
+
+def measure_results(n_rows: int = 100_000, n_features: int = 1, seed: int = 0) -> dict:
+    """
+    Retained bytes and pickled size of one run's results per layout.
+
+    Args:
+        n_rows (int, optional): Rows of simulated data. Defaults to 100_000.
+        n_features (int, optional): Predictors. Defaults to 1.
+        seed (int, optional): Data seed. Defaults to 0.
+
+    Returns:
+        dict: Layout name mapped to {'retained_bytes', 'pickled_bytes'}.
+    """
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(
+        rng.normal(size=(n_rows, n_features)),
+        columns=[f"x{i}" for i in range(n_features)],
+    )
+    y = pd.Series(X.sum(axis=1).to_numpy() + rng.normal(size=n_rows), name="y")
+
+    def per_result_copies():
+        results, _ = run_all_checks(X, y, model_type="linear")
+        return {
+            name: (
+                result,
+                pd.Series(result.residuals, index=y.index.copy()),
+                pd.Series(result.fitted, index=y.index.copy()),
+            )
+            for name, result in results.items()
+            if result.arrays is not None
+        }
+
+    layouts = {
+        "per_result_copies": per_result_copies,
+        "shared": lambda: run_all_checks(X, y, model_type="linear")[0],
+        "summary_only": lambda: run_all_checks(
+            X, y, model_type="linear", keep_arrays=False
+        )[0],
+    }
+    # Warm up so lazy imports and library caches are not attributed to a layout
+    layouts["shared"]()
+
+    report = {}
+    for name, build in layouts.items():
+        retained, value = _retained(build)
+        report[name] = {
+            "retained_bytes": retained,
+            "pickled_bytes": len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+        }
+        del value
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure per-run result size.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=1)
+    args = parser.parse_args()
+    print(json.dumps(measure_results(args.rows, args.features), indent=2))
@@ -0,0 +1,389 @@
+# benchmarks/suite.py
+"""
+Scaling benchmark for the assumption checks.
+
+Runs every registered check (through check_assumption) and run_all_checks on
+simulated data over a grid of sample sizes n and feature counts p, with and
+without plots, and records for each cell:
+
+    - wall_s: best-of-repeats wall time
+    - peak_bytes: tracemalloc peak of one extra run
+
+From those it fits log-log scaling exponents (time ∝ n^k for each p, and
+time ∝ p^k for each n). Reports are JSON, so one can be saved as a baseline
+and later runs compared against it:
+
+    python -m benchmarks.suite --grid quick --save baseline.json
+    python -m benchmarks.suite --grid quick --compare baseline.json
+
+Comparisons exit with status 1 when any cell got slower (or bigger) than
+the baseline by more than --tolerance.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.dispatcher import check_assumption, run_all_checks
+from app.core.registry import ASSUMPTION_CHECKS
+from app.data.simulated_data import generate_linear_data, generate_multivariate_data
+
+__all__ = [
+    "GRIDS",
+    "compare_to_baseline",
+    "load_report",
+    "run_suite",
+    "save_report",
+    "scaling_exponents",
+]
+
+# Named (n, p) grids; 'full' spans the whole supported range and takes hours
+GRIDS = {
+    "quick": {"n": (100, 1_000, 10_000), "p": (1, 10)},
+    "default": {"n": (100, 1_000, 10_000, 100_000, 1_000_000), "p": (1, 10, 100)},
+    "full": {
+        "n": (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+        "p": (1, 10, 100, 1_000),
+    },
+}
+
+# Cells whose design matrix exceeds this many values are skipped (1e7 × 1000
+# would need 80 GB); override with --max-elements
+MAX_ELEMENTS = 50_000_000
+
+# The annotated correlation heatmap is unreadable (and draws p² labels)
+# beyond this many features, so plotted cells stop here
+MAX_PLOT_FEATURES = 50
+
+# Below this baseline time a cell is too noisy to flag as a regression
+MIN_COMPARABLE_SECONDS = 0.005
+
+RUN_ALL = "run_all_checks"
+
+
+def _make_data(n: int, p: int, seed: int) -> Tuple[pd.DataFrame, pd.Series]:
+    """Simulated linear data with p predictors."""
+    if p == 1:
+        df = generate_linear_data(n_samples=n, seed=seed)
+    else:
+        df = generate_multivariate_data(n_samples=n, n_features=p, seed=seed)
+    return df.drop(columns="y"), df["y"]
+
+
+def _time(func: Callable[[], object], repeats: int) -> float:
+    """Best wall time of up to `repeats` calls; slow cells (>1 s) run once."""
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+        if best > 1.0:
+            break
+    return best
+
+
+def _peak(func: Callable[[], object]) -> int:
+    """Peak bytes allocated by one call (tracemalloc slows it, so not timed)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _skip_reason(n: int, p: int, plots: bool, max_elements: int) -> Optional[str]:
+    if n <= p + 1:
+        return "fewer rows than parameters"
+    if n * p > max_elements:
+        return f"n·p above max_elements ({max_elements})"
+    if plots and p > MAX_PLOT_FEATURES:
+        return f"plots limited to p <= {MAX_PLOT_FEATURES}"
+    return None
+
+
+def run_suite(
+    n_values: Iterable[int] = GRIDS["quick"]["n"],
+    p_values: Iterable[int] = GRIDS["quick"]["p"],
+    plots: Iterable[bool] = (False, True),
+    targets: Optional[Iterable[str]] = None,
+    repeats: int = 3,
+    max_elements: int = MAX_ELEMENTS,
+    seed: int = 0,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Time and measure the checks over an (n, p) grid.
+
+    Args:
+        n_values (Iterable[int], optional): Sample sizes. Defaults to the
+            'quick' grid.
+        p_values (Iterable[int], optional): Feature counts. Defaults to the
+            'quick' grid.
+        plots (Iterable[bool], optional): Plot settings to run each cell
+            with. Defaults to (False, True).
+        targets (Optional[Iterable[str]], optional): Registered check names
+            and/or 'run_all_checks'. Defaults to None (all of them).
+        repeats (int, optional): Timed calls per cell. Defaults to 3.
+        max_elements (int, optional): Largest n·p to run. Defaults to
+            MAX_ELEMENTS.
+        seed (int, optional): Data seed. Defaults to 0.
+        progress (Optional[Callable[[dict], None]], optional): Called with
+            each record as it is produced. Defaults to None.
+
+    Returns:
+        dict: Report with 'meta', 'records', 'skipped' and 'scaling'.
+    """
+    targets = list(targets or [*ASSUMPTION_CHECKS, RUN_ALL])
+    unknown = set(targets) - {*ASSUMPTION_CHECKS, RUN_ALL}
+    if unknown:
+        raise ValueError(f"Unknown benchmark targets: {', '.join(sorted(unknown))}")
+    n_values, p_values, plots = list(n_values), list(p_values), list(plots)
+
+    def call(target, X, y, return_plot):
+        if target == RUN_ALL:
+            return lambda: run_all_checks(
+                X, y, model_type="linear", return_plot=return_plot
+            )
+        return lambda: check_assumption(target, X, y, return_plot=return_plot)
+
+    # Warm up so lazy imports and first-call caches land in no cell
+    X, y = _make_data(50, 2, seed)
+    for return_plot in plots:
+        call(RUN_ALL, X, y, return_plot)()
+
+    records, skipped = [], []
+    for p in p_values:
+        for n in n_values:
+            data = None
+            for return_plot in plots:
+                reason = _skip_reason(n, p, return_plot, max_elements)
+                if reason:
+                    skipped.append(dict(n=n, p=p, plots=return_plot, reason=reason))
+                    continue
+                if data is None:
+                    data = _make_data(n, p, seed)
+                for target in targets:
+                    func = call(target, *data, return_plot)
+                    record = dict(
+                        target=target,
+                        n=n,
+                        p=p,
+                        plots=return_plot,
+                        wall_s=_time(func, repeats),
+                        peak_bytes=_peak(func),
+                    )
+                    records.append(record)
+                    if progress:
+                        progress(record)
+
+    return {
+        "meta": _metadata(n_values, p_values, plots, repeats, seed),
+        "records": records,
+        "skipped": skipped,
+        "scaling": scaling_exponents(records),
+    }
+
+
+def _metadata(n_values, p_values, plots, repeats, seed) -> dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "n_values": n_values,
+        "p_values": p_values,
+        "plots": plots,
+        "repeats": repeats,
+        "seed": seed,
+    }
+
+
+def _slope(x: List[float], y: List[float]) -> float:
+    """Least-squares slope of log(y) on log(x)."""
+    return float(np.polyfit(np.log(x), np.log(y), 1)[0])
+
+
+def scaling_exponents(records: List[dict]) -> List[dict]:
+    """
+    Fit log-log scaling exponents per target and plot setting.
+
+    For each fixed p, time ∝ n^k over the n values run (and likewise for
+    peak memory); for each fixed n, time ∝ p^k. Fixed per-call overhead
+    flattens the fit at small sizes, so exponents are most telling on grids
+    reaching 1e5 rows or more.
+
+    Args:
+        records (List[dict]): Records from run_suite().
+
+    Returns:
+        List[dict]: One entry per (target, plots, axis, fixed value) with at
+            least two points: 'time_exponent' and 'memory_exponent'.
+    """
+    groups: Dict[tuple, List[dict]] = {}
+    for record in records:
+        base = (record["target"], record["plots"])
+        groups.setdefault((*base, "n", "p", record["p"]), []).append(record)
+        groups.setdefault((*base, "p", "n", record["n"]), []).append(record)
+
+    exponents = []
+    for (target, plots, axis, fixed_axis, fixed), group in groups.items():
+        sizes = [record[axis] for record in group]
+        if len(set(sizes)) < 2:
+            continue
+        exponents.append(
+            {
+                "target": target,
+                "plots": plots,
+                "axis": axis,
+                fixed_axis: fixed,
+                "points": len(group),
+                "time_exponent": _slope(sizes, [max(r["wall_s"], 1e-9) for r in group]),
+                "memory_exponent": _slope(
+                    sizes, [max(r["peak_bytes"], 1) for r in group]
+                ),
+            }
+        )
+    return exponents
+
+
+def compare_to_baseline(
+    report: dict,
+    baseline: dict,
+    tolerance: float = 0.25,
+    min_seconds: float = MIN_COMPARABLE_SECONDS,
+) -> List[dict]:
+    """
+    List the cells that regressed against a baseline report.
+
+    Args:
+        report (dict): Current run_suite() report.
+        baseline (dict): Earlier report covering some of the same cells.
+        tolerance (float, optional): Allowed relative increase, e.g. 0.25 for
+            25%. Defaults to 0.25.
+        min_seconds (float, optional): Baseline wall times below this are
+            not compared (timer noise). Defaults to MIN_COMPARABLE_SECONDS.
+
+    Returns:
+        List[dict]: Cell, metric, baseline and current values and their
+            ratio, for each regression.
+    """
+
+    def key(record):
+        return record["target"], record["n"], record["p"], record["plots"]
+
+    previous = {key(record): record for record in baseline["records"]}
+    regressions = []
+    for record in report["records"]:
+        old = previous.get(key(record))
+        if old is None:
+            continue
+        for metric in ("wall_s", "peak_bytes"):
+            if metric == "wall_s" and old[metric] < min_seconds:
+                continue
+            ratio = record[metric] / old[metric] if old[metric] else float("inf")
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    {
+                        "target": record["target"],
+                        "n": record["n"],
+                        "p": record["p"],
+                        "plots": record["plots"],
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "current": record[metric],
+                        "ratio": ratio,
+                    }
+                )
+    return regressions
+
+
+def save_report(report: dict, path: str) -> None:
+    """Write a report as JSON (e.g. to keep as a baseline)."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: str) -> dict:
+    """Read a report written by save_report()."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _print_record(record: dict) -> None:
+    print(
+        f"{record['target']:<18} n={record['n']:<9} p={record['p']:<5} "
+        f"plots={str(record['plots']):<5} {record['wall_s'] * 1e3:10.1f} ms "
+        f"{record['peak_bytes'] / 2**20:10.1f} MiB",
+        flush=True,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the checks over n × p.")
+    parser.add_argument("--grid", choices=GRIDS.keys(), default="quick")
+    parser.add_argument("--n", type=int, nargs="+", help="Override the grid's n")
+    parser.add_argument("--p", type=int, nargs="+", help="Override the grid's p")
+    parser.add_argument("--targets", nargs="+", help="Checks and/or run_all_checks")
+    parser.add_argument("--no-plots", action="store_true", help="Skip plotted runs")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-elements", type=int, default=MAX_ELEMENTS)
+    parser.add_argument("--save", help="Write the report to this JSON file")
+    parser.add_argument("--compare", help="Baseline report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    grid = GRIDS[args.grid]
+    report = run_suite(
+        n_values=args.n or grid["n"],
+        p_values=args.p or grid["p"],
+        plots=(False,) if args.no_plots else (False, True),
+        targets=args.targets,
+        repeats=args.repeats,
+        max_elements=args.max_elements,
+        progress=_print_record,
+    )
+
+    print("\nScaling exponents (time ∝ n^k):")
+    for entry in report["scaling"]:
+        if entry["axis"] == "n":
+            print(
+                f"  {entry['target']:<18} p={entry['p']:<5} "
+                f"plots={str(entry['plots']):<5} time k={entry['time_exponent']:.2f} "
+                f"memory k={entry['memory_exponent']:.2f}"
+            )
+
+    if args.save:
+        save_report(report, args.save)
+        print(f"\nSaved report to {args.save}")
+
+    if args.compare:
+        regressions = compare_to_baseline(
+            report, load_report(args.compare), tolerance=args.tolerance
+        )
+        for item in regressions:
+            print(
+                f"REGRESSION {item['target']} n={item['n']} p={item['p']} "
+                f"plots={item['plots']} {item['metric']}: "
+                f"{item['baseline']:.4g} -> {item['current']:.4g} "
+                f"(×{item['ratio']:.2f})"
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of {args.compare}")
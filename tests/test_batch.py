@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.batch import run_batch_checks
+from app.core.dispatcher import run_all_checks
+
+
+def _data(n=300, k=4, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 2)), columns=["a", "b"])
+    noise = rng.normal(size=(n, k))
+    noise[:, 0] *= 1 + 2 * np.abs(X["a"].to_numpy())  # Heteroscedastic target
+    noise[:, 1] = rng.exponential(size=n)  # Skewed target
+    Y = pd.DataFrame(X.to_numpy() @ rng.normal(size=(2, k)) + noise)
+    Y.columns = [f"t{j}" for j in range(k)]
+    return X, Y
+
+
+def test_batch_matches_run_all_checks_per_target():
+    """
+    Every target's statistics and verdicts equal a separate run_all_checks.
+    """
+    X, Y = _data()
+    table = run_batch_checks(X, Y)
+    assert list(table.index) == list(Y.columns)
+
+    for target in Y.columns:
+        results, wrapper = run_all_checks(X, Y[target], model_type="linear")
+        row = table.loc[target]
+        assert row["r_squared"] == pytest.approx(wrapper.summary()["r_squared"])
+        for key in ("shapiro_pval", "dagostino_pval", "anderson_stat"):
+            assert row[key] == pytest.approx(results["normality"].statistics[key])
+        assert row["breusch_pagan_pval"] == pytest.approx(
+            results["homoscedasticity"].statistics["breusch_pagan_pval"]
+        )
+        for key in ("durbin_watson", "ljung_box_pval"):
+            assert row[key] == pytest.approx(results["independence"].statistics[key])
+        for name in results:
+            if results[name].statistics is not None:
+                assert row[f"{name}_passed"] == results[name].passed
+
+
+def test_pairs_share_fits_by_x_and_keep_their_labels():
+    """
+    (X, y) pairs come back in input order; pairs sharing X match the 2-D form.
+    """
+    X, Y = _data()
+    x1 = X[["a"]]
+    table = run_batch_checks({"p": (X, Y["t0"]), "q": (x1, Y["t1"]), "r": (X, Y["t2"])})
+    assert list(table.index) == ["p", "q", "r"]
+    assert pd.isna(table.loc["q", "multicollinearity_passed"])
+    assert "linearity_passed" in table.columns
+
+    shared = run_batch_checks(X, Y[["t0", "t2"]])
+    np.testing.assert_allclose(
+        table.loc[["p", "r"], "breusch_pagan_pval"], shared["breusch_pagan_pval"]
+    )
+
+
+def test_rank_deficient_design_matches_least_squares():
+    """
+    Collinear predictors give the same residual-based R² as lstsq.
+    """
+    X, Y = _data()
+    X["c"] = X["a"] + X["b"]
+    table = run_batch_checks(X, Y.to_numpy())
+    A = np.column_stack([np.ones(len(X)), X.to_numpy()])
+    resid = Y.to_numpy() - A @ np.linalg.lstsq(A, Y.to_numpy(), rcond=None)[0]
+    centered = Y.to_numpy() - Y.to_numpy().mean(axis=0)
+    expected = 1 - (resid**2).sum(axis=0) / (centered**2).sum(axis=0)
+    np.testing.assert_allclose(table["r_squared"], expected)
+
+
+def test_missing_values_and_misaligned_rows_are_rejected():
+    """
+    NaNs and a row-count mismatch raise ValueError.
+    """
+    X, Y = _data()
+    Y.iloc[0, 0] = np.nan
+    with pytest.raises(ValueError):
+        run_batch_checks(X, Y)
+    with pytest.raises(ValueError):
+        run_batch_checks(X, Y.iloc[:10].fillna(0))
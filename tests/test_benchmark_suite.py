@@ -0,0 +1,57 @@
+from benchmarks.suite import compare_to_baseline, run_suite, scaling_exponents
+
+
+def _record(target, n, wall_s, peak_bytes=1000, p=1, plots=False):
+    return dict(
+        target=target, n=n, p=p, plots=plots, wall_s=wall_s, peak_bytes=peak_bytes
+    )
+
+
+def test_run_suite_records_every_cell():
+    """
+    A tiny grid yields one record per target and cell, skipping p >= n cells.
+    """
+    report = run_suite(
+        n_values=(10, 60, 200),
+        p_values=(1, 10),
+        plots=(False,),
+        targets=["normality", "run_all_checks"],
+        repeats=1,
+    )
+    cells = {(r["target"], r["n"], r["p"]) for r in report["records"]}
+    assert len(cells) == len(report["records"]) == 10
+    assert {(s["n"], s["p"]) for s in report["skipped"]} == {(10, 10)}
+    assert all(r["wall_s"] > 0 and r["peak_bytes"] > 0 for r in report["records"])
+    assert report["meta"]["n_values"] == [10, 60, 200]
+
+
+def test_scaling_exponents_recover_power_law():
+    """
+    Log-log fits recover the exponent of synthetic quadratic timings.
+    """
+    records = [
+        _record("normality", n, 1e-6 * n**2, peak_bytes=8 * n) for n in (10, 100, 1000)
+    ]
+    (entry,) = [e for e in scaling_exponents(records) if e["axis"] == "n"]
+    assert abs(entry["time_exponent"] - 2) < 1e-9
+    assert abs(entry["memory_exponent"] - 1) < 1e-9
+
+
+def test_compare_flags_only_regressions_beyond_tolerance():
+    """
+    Cells slower than the baseline by more than the tolerance are reported;
+    noisy sub-millisecond baselines are ignored.
+    """
+    baseline = {
+        "records": [_record("normality", 1000, 0.1), _record("normality", 10, 1e-4)]
+    }
+    report = {
+        "records": [
+            _record("normality", 1000, 0.2),
+            _record("normality", 10, 1e-2),
+            _record("linearity", 1000, 5.0),  # Not in the baseline
+        ]
+    }
+    regressions = compare_to_baseline(report, baseline, tolerance=0.25)
+    assert [(r["n"], r["metric"]) for r in regressions] == [(1000, "wall_s")]
+    assert regressions[0]["ratio"] == 2.0
@@ -0,0 +1,113 @@
+import pytest
+
+from app import config
+from app.core import dispatcher
+from app.core.cache import ResultCache, make_cache_key
+from app.data import simulated_data
+
+
+@pytest.fixture
+def data():
+    df = simulated_data.generate_linear_data(n_samples=200, seed=7)
+    return df[["x"]], df["y"]
+
+
+def test_key_is_content_addressed(data):
+    """
+    Equal inputs hash equally; changing data, versions or thresholds misses.
+    """
+    X, y = data
+    key = make_cache_key(X, y, "linear", {"linearity": 1})
+
+    assert make_cache_key(X.copy(), y.copy(), "linear", {"linearity": 1}) == key
+    assert make_cache_key(X, y * 2, "linear", {"linearity": 1}) != key
+    assert make_cache_key(X, y, "linear", {"linearity": 2}) != key
+    assert make_cache_key(X, y, "linear", {"linearity": 1}, True) != key
+
+
+def test_thresholds_rejudge_cached_results(data, monkeypatch):
+    """
+    Thresholds are not part of the key; hits are re-judged against them.
+    """
+    X, y = data
+    key = make_cache_key(X, y, "linear", {"linearity": 1})
+    monkeypatch.setattr(config, "LINEARITY_R2_THRESHOLD", 0.99)
+    assert make_cache_key(X, y, "linear", {"linearity": 1}) == key
+    monkeypatch.undo()
+
+    cache = ResultCache()
+    strict = config.get_thresholds(linearity_r2=0.99)
+    first = dispatcher.check_assumption("linearity", X, y, cache=cache)
+    second = dispatcher.check_assumption(
+        "linearity", X, y, cache=cache, thresholds=strict
+    )
+
+    assert cache.stats.hits == 1
+    assert first.passed is True
+    assert second.passed is False
+    assert second.details["r2_threshold"] == 0.99
+
+
+def test_statistics_settings_are_part_of_the_key(data, monkeypatch):
+    """
+    Changing a setting the statistics depend on misses instead of going stale.
+    """
+    X, y = data
+    cache = ResultCache()
+    monkeypatch.setattr(config, "NORMALITY_LARGE_N", 100)
+    first, _ = dispatcher.run_all_checks(X, y, model_type="linear", cache=cache)
+    assert first["normality"].statistics["method"] == "subsample"
+
+    monkeypatch.setattr(config, "NORMALITY_LARGE_N", 1000)
+    second, _ = dispatcher.run_all_checks(X, y, model_type="linear", cache=cache)
+    assert second["normality"].statistics["method"] == "full"
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+    monkeypatch.setattr(config, "LINEAR_ENGINE", "statsmodels")
+    _, wrapper = dispatcher.run_all_checks(X, y, model_type="linear", cache=cache)
+    assert hasattr(wrapper.model, "bse")
+    assert cache.stats.misses == 3
+
+    monkeypatch.setattr(config, "INDEPENDENCE_MAX_LAGS", 5)
+    third, _ = dispatcher.run_all_checks(X, y, model_type="linear", cache=cache)
+    assert third["independence"].statistics["ljung_box_lags"] == 5
+    assert cache.stats.misses == 4
+
+
+def test_run_all_checks_hits_memory_tier(data):
+    X, y = data
+    cache = ResultCache()
+
+    first, _ = dispatcher.run_all_checks(X, y, model_type="linear", cache=cache)
+    second, _ = dispatcher.run_all_checks(X, y, model_type="linear", cache=cache)
+
+    assert second["linearity"].statistics is first["linearity"].statistics
+    assert cache.stats.misses == 1
+    assert cache.stats.memory_hits == 1
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_disk_tier_survives_new_instance(data, tmp_path):
+    X, y = data
+    dispatcher.check_assumption(
+        "linearity", X, y, cache=ResultCache(directory=str(tmp_path))
+    )
+
+    cache = ResultCache(directory=str(tmp_path))
+    result = dispatcher.check_assumption("linearity", X, y, cache=cache)
+
+    assert result.passed
+    assert cache.stats.disk_hits == 1
+    assert cache.stats.misses == 0
+
+
+def test_lru_and_disk_eviction(tmp_path):
+    cache = ResultCache(maxsize=2, directory=str(tmp_path), max_disk_bytes=200)
+    for i in range(4):
+        cache.put(f"k{i}", b"x" * 100)
+
+    assert list(cache._memory) == ["k2", "k3"]
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    assert cache.get("k3") == b"x" * 100
+    assert cache.get("k0") is None
+    assert cache.stats.misses == 1
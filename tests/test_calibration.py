@@ -0,0 +1,91 @@
+import json
+
+import pandas as pd
+import pytest
+
+from app.config import get_thresholds
+from app.core.calibration import (
+    CalibrationCell,
+    calibration_grid,
+    run_calibration,
+    summarize_calibration,
+)
+
+CELLS = [CalibrationCell("linear", 60), CalibrationCell("multivariate", 60, 3)]
+
+
+def _run(path, **kwargs):
+    options = dict(replicates=5, chunk_size=2, seed=7, n_jobs=1)
+    options.update(kwargs)
+    return run_calibration(CELLS, str(path), **options)
+
+
+def test_calibration_grid_applies_features_only_where_supported():
+    """Feature counts multiply only the generators that take n_features."""
+    cells = calibration_grid(["linear", "multivariate"], [50, 100], [2, 4])
+    assert CalibrationCell("linear", 50) in cells
+    assert CalibrationCell("multivariate", 100, 4) in cells
+    assert len(cells) == 2 + 4
+    with pytest.raises(ValueError):
+        calibration_grid(["nope"], [50])
+
+
+def test_run_calibration_tallies_every_replicate(tmp_path):
+    """Each cell reports runs and pass rates over all applicable replicates."""
+    summary = _run(tmp_path / "calib.ndjson")
+    linear = summary[summary["generator"] == "linear"].set_index("check")
+    # One predictor: multicollinearity does not apply
+    assert set(linear.index) == {
+        "homoscedasticity",
+        "independence",
+        "linearity",
+        "normality",
+    }
+    assert (linear["runs"] == 5).all()
+    multi = summary[summary["generator"] == "multivariate"].set_index("check")
+    assert "multicollinearity" in multi.index and "linearity" not in multi.index
+    assert ((summary["pass_rate"] + summary["fail_rate"]) == 1).all()
+    assert summary["std_error"].between(0, 0.5).all()
+
+
+def test_run_calibration_resumes_without_changing_results(tmp_path):
+    """An interrupted sweep resumes from its file and matches a fresh run."""
+    fresh = _run(tmp_path / "fresh.ndjson")
+
+    path = tmp_path / "resumed.ndjson"
+    _run(path)
+    lines = path.read_text().splitlines(keepends=True)
+    # Keep the header and two chunks, then a line cut short mid-write
+    path.write_text("".join(lines[:3]) + lines[3][:10])
+    resumed = _run(path, n_jobs=2)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(records) == 1 + 2 * 3  # header + 3 chunks per cell
+    pd.testing.assert_frame_equal(resumed, fresh)
+    pd.testing.assert_frame_equal(summarize_calibration(str(path)), fresh)
+
+
+def test_run_calibration_rejects_mismatched_settings(tmp_path):
+    """Resuming with a different seed or chunking would mix streams."""
+    path = tmp_path / "calib.ndjson"
+    _run(path, replicates=2)
+    with pytest.raises(ValueError):
+        _run(path, replicates=2, seed=8)
+    with pytest.raises(ValueError):
+        _run(path, replicates=2, thresholds=get_thresholds(normality_pval=0.01))
+    with pytest.raises(ValueError):
+        run_calibration([CalibrationCell("linear", 60, 3)], str(path), n_jobs=1)
+
+
+def test_cell_results_do_not_depend_on_other_cells(tmp_path):
+    """A cell's streams come from its contents, not its place in the sweep."""
+    alone = run_calibration(
+        [CELLS[1]], str(tmp_path / "alone.ndjson"), replicates=4, seed=7, n_jobs=1
+    )
+    extra = [CalibrationCell("skewed", 60), *CELLS[::-1]]
+    mixed = run_calibration(
+        extra, str(tmp_path / "mixed.ndjson"), replicates=4, seed=7, n_jobs=1
+    )
+    assert (alone["runs"] == 4).all()
+    mixed = mixed[mixed["generator"] == "multivariate"].reset_index(drop=True)
+    pd.testing.assert_frame_equal(alone, mixed)
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.context import FitContext, plan_intermediates
+from app.core.homoscedasticity import check_homoscedasticity
+from app.core.multicollinearity import check_multicollinearity
+from app.data import simulated_data
+from app.models.linear_model_wrapper import LinearModelWrapper
+
+
+def test_design_matrix_is_reused_from_wrapper():
+    """
+    The context should hand out the wrapper's design matrix rather than a copy.
+    """
+    df = simulated_data.generate_linear_data(seed=123)
+    wrapper = LinearModelWrapper(df[["x"]], df["y"]).fit()
+    context = FitContext(df[["x"]], df["y"], model_wrapper=wrapper)
+
+    assert context.design_matrix is wrapper.design
+    assert context.residuals is context.residuals
+
+
+def test_factorizations_and_leverage():
+    """
+    QR/Cholesky factors reproduce X'X and leverage sums to the column count.
+    """
+    df = simulated_data.generate_multicollinear_data(seed=42)
+    X, y = df.drop(columns="y"), df["y"]
+    context = FitContext(X, y)
+    design = np.asarray(context.design_matrix, dtype=float)
+
+    L = context.cholesky
+    np.testing.assert_allclose(L @ L.T, design.T @ design, rtol=1e-8)
+    assert np.allclose(np.triu(L, 1), 0)
+    assert np.all(np.diag(L) > 0)
+    np.testing.assert_allclose(context.leverage.sum(), design.shape[1])
+
+
+def test_context_is_lazy():
+    """
+    Checks that only need the correlation matrix should not trigger a model fit.
+    """
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({"x1": rng.normal(size=50), "x2": rng.normal(size=50)})
+    y = X["x1"] + rng.normal(size=50)
+    context = FitContext(X, y)
+
+    check_multicollinearity(X, y, return_plot=True, context=context)
+
+    assert "correlation" in context.__dict__
+    assert "model_wrapper" not in context.__dict__
+    pd.testing.assert_frame_equal(context.correlation, X.corr())
+
+
+def test_plan_intermediates_orders_dependencies():
+    """
+    Requested intermediates expand to their dependencies, each listed once.
+    """
+    plan = plan_intermediates(["leverage", "sorted_residuals", "qr"])
+    assert plan == [
+        "model_wrapper",
+        "design_matrix",
+        "qr",
+        "leverage",
+        "residuals",
+        "sorted_residuals",
+    ]
+    assert plan_intermediates(["correlation"]) == ["correlation"]
+
+
+def test_plan_intermediates_rejects_unknown():
+    with pytest.raises(ValueError, match="Unknown intermediate"):
+        plan_intermediates(["banana"])
+
+
+def test_basis_spans_the_design_and_is_shared():
+    """
+    The basis is Q for full-rank designs, falls back to the SVD for dependent
+    columns, and the homoscedasticity check reuses it.
+    """
+    df = simulated_data.generate_multicollinear_data(seed=42)
+    X, y = df.drop(columns="y"), df["y"]
+    context = FitContext(X, y)
+    check_homoscedasticity(X, y, context=context)
+    assert "basis" in context.__dict__
+    assert context.basis is context.qr[0]
+
+    X_dup = X.assign(x3=X["x1"])
+    basis = FitContext(X_dup, y).basis
+    design = np.column_stack([np.ones(len(X_dup)), X_dup])
+    assert basis.shape[1] == 3
+    np.testing.assert_allclose(basis @ (basis.T @ design), design, atol=1e-8)
@@ -34,3 +34,77 @@ def test_unknown_assumption_raises():
     df = simulated_data.generate_linear_data(n_samples=300, seed=42)
     with pytest.raises(ValueError):
         dispatcher.check_assumption("banana", df["x"], df["y"])
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_all_checks_parallel_matches_serial(executor):
+    """
+    Test that pooled executors return the same results, in registry order.
+    """
+    df = simulated_data.generate_multicollinear_data(n_samples=300, seed=42)
+    X, y = df.drop(columns="y"), df["y"]
+    serial, _ = dispatcher.run_all_checks(X, y, model_type="linear")
+    parallel, _ = dispatcher.run_all_checks(
+        X, y, model_type="linear", executor=executor, max_workers=2
+    )
+    assert list(parallel) == list(serial)
+    for name, result in serial.items():
+        assert parallel[name].passed == result.passed
+        assert parallel[name].summary == result.summary
+
+
+def test_unknown_executor_raises():
+    """
+    Test an unknown executor as input to run_all_checks().
+    """
+    df = simulated_data.generate_linear_data(n_samples=300, seed=42)
+    with pytest.raises(ValueError, match="Unsupported executor"):
+        dispatcher.run_all_checks(df["x"], df["y"], model_type="linear", executor="gpu")
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_run_all_checks_subset(executor):
+    """
+    Test that only the requested checks run, still in registry order.
+    """
+    df = simulated_data.generate_linear_data(n_samples=300, seed=42)
+    results, _ = dispatcher.run_all_checks(
+        df["x"],
+        df["y"],
+        model_type="linear",
+        executor=executor,
+        checks=["normality", "linearity"],
+    )
+    assert list(results) == ["linearity", "normality"]
+
+
+def test_run_all_checks_unknown_subset_raises():
+    df = simulated_data.generate_linear_data(n_samples=300, seed=42)
+    with pytest.raises(ValueError, match="Unknown assumption"):
+        dispatcher.run_all_checks(
+            df["x"], df["y"], model_type="linear", checks=["banana"]
+        )
+
+
+def test_register_assumption_rejects_unknown_intermediate():
+    """
+    Test that checks can only declare intermediates FitContext provides.
+    """
+    from app.core.registry import register_assumption
+
+    with pytest.raises(ValueError, match="Unknown intermediates"):
+        register_assumption("banana", requires=["not_an_intermediate"])
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_shared_residual_plot_rendered_once(executor):
+    """
+    Linearity and homoscedasticity reference one residuals-vs-fitted image.
+    """
+    df = simulated_data.generate_linear_data(n_samples=200, seed=3)
+    results, _ = dispatcher.run_all_checks(
+        df["x"], df["y"], model_type="linear", return_plot=True, executor=executor
+    )
+    image = results["linearity"].plot_base64
+    assert image.startswith("iVBOR")
+    assert results["homoscedasticity"].plot_base64 is image
@@ -0,0 +1,50 @@
+import pytest
+
+from app.config import get_thresholds
+from app.core import dispatcher
+from app.core.evaluation import evaluate, rethreshold
+from app.data import simulated_data
+
+
+def test_get_thresholds_reads_config_and_overrides():
+    """
+    Profiles snapshot app.config and accept per-run overrides.
+    """
+    profile = get_thresholds(vif=10)
+    assert profile.vif == 10
+    assert profile.linearity_r2 == get_thresholds().linearity_r2
+
+
+def test_rethreshold_matches_fresh_run():
+    """
+    Re-judging cached statistics gives the same verdicts as recomputing.
+    """
+    df = simulated_data.generate_multicollinear_data(n_samples=200, seed=1)
+    X, y = df.drop(columns="y"), df["y"]
+    lenient = get_thresholds(vif=1e9, normality_pval=0.0)
+
+    results, _ = dispatcher.run_all_checks(X, y, model_type="linear")
+    fresh, _ = dispatcher.run_all_checks(X, y, model_type="linear", thresholds=lenient)
+    rejudged = rethreshold(results, lenient)
+
+    assert results["multicollinearity"].passed is False
+    assert rejudged["multicollinearity"].passed is True
+    for name in results:
+        assert rejudged[name].passed == fresh[name].passed
+        assert rejudged[name].severity == fresh[name].severity
+        assert rejudged[name].details == fresh[name].details
+    assert rejudged["normality"].residuals is results["normality"].residuals
+
+
+def test_rethreshold_keeps_skipped_results():
+    df = simulated_data.generate_multicollinear_data(n_samples=200, seed=1)
+    results, _ = dispatcher.run_all_checks(
+        df.drop(columns="y"), df["y"], model_type="linear"
+    )
+    rejudged = rethreshold(results, get_thresholds(linearity_r2=0.0))
+    assert rejudged["linearity"] is results["linearity"]
+
+
+def test_evaluate_unknown_assumption_raises():
+    with pytest.raises(ValueError, match="No evaluator"):
+        evaluate("banana", {})
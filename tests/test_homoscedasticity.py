@@ -1,4 +1,8 @@
 # tests/test_homoscedasticity.py
+import numpy as np
+import pytest
+from statsmodels.stats.diagnostic import het_breuschpagan
+
 from app.core import homoscedasticity
 from app.data import simulated_data
 from app.models.linear_model_wrapper import LinearModelWrapper
@@ -35,3 +39,22 @@ def test_homoscedasticity_with_model_wrapper():
         df["x"], df["y"], model_wrapper=wrapper
     )
     assert "breusch_pagan_pval" in result.details
+
+
+def test_breusch_pagan_batch_matches_statsmodels_per_column():
+    """
+    Test that the batched kernel equals het_breuschpagan on every column,
+    including a rank-deficient design.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(400, 2))
+    design = np.column_stack([np.ones(400), x, x[:, 0] + x[:, 1]])
+    residuals = rng.normal(size=(400, 3)) * np.column_stack(
+        [np.ones(400), 1 + np.abs(x[:, 0]), np.exp(x[:, 1])]
+    )
+
+    lm, pvals = homoscedasticity.breusch_pagan_batch(residuals, design)
+    for j in range(3):
+        expected_lm, expected_pval, _, _ = het_breuschpagan(residuals[:, j], design)
+        assert lm[j] == pytest.approx(expected_lm, rel=1e-8)
+        assert pvals[j] == pytest.approx(expected_pval, rel=1e-8, abs=1e-300)
@@ -0,0 +1,25 @@
+import pytest
+
+from benchmarks.import_time import loaded_heavy_modules
+
+
+@pytest.mark.parametrize("module", ["app.core.dispatcher", "app.report"])
+def test_import_loads_no_heavy_libraries(module):
+    """
+    Importing the library or CLI entry point defers plotting/statistics stacks.
+    """
+    assert loaded_heavy_modules(f"import {module}") == []
+
+
+def test_checks_without_plots_skip_plotting_libraries():
+    """
+    Running every check without plots never imports matplotlib or seaborn.
+    """
+    loaded = loaded_heavy_modules(
+        "from app.core.dispatcher import run_all_checks\n"
+        "from app.data.simulated_data import generate_multicollinear_data\n"
+        "df = generate_multicollinear_data(seed=0)\n"
+        "run_all_checks(df.drop(columns='y'), df['y'], model_type='linear')"
+    )
+    assert "matplotlib" not in loaded
+    assert "seaborn" not in loaded
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from scipy.stats import jarque_bera, normaltest
+from statsmodels.stats.diagnostic import het_breuschpagan
+
+from app.core.evaluation import results_from_statistics
+from app.data import simulated_data
+from app.models.incremental_model_wrapper import IncrementalLinearModelWrapper
+from app.models.linear_model_wrapper import LinearModelWrapper
+
+
+def test_append_and_remove_match_refit():
+    """
+    Appending and expiring batches gives the same statistics as a full refit.
+    """
+    df = simulated_data.generate_multicollinear_data(n_samples=1200, seed=11)
+    X, y = df.drop(columns="y") + 50, df["y"]
+
+    model = IncrementalLinearModelWrapper(
+        X[:400], y[:400], track_residual_moments=True
+    ).fit()
+    model.append(X[400:800], y[400:800])
+    model.append(X[800:], y[800:])
+    model.remove(X[:400], y[:400])
+
+    reference = LinearModelWrapper(X[400:], y[400:]).fit()
+    residuals = reference.residuals()
+    statistics = model.diagnostics()
+
+    np.testing.assert_allclose(model.coefficients, reference.model.params)
+    assert model.r_squared == pytest.approx(reference.model.rsquared)
+    assert model.n_obs == 800
+    assert statistics["homoscedasticity"]["breusch_pagan_pval"] == pytest.approx(
+        het_breuschpagan(residuals, reference.design)[1], rel=1e-6
+    )
+    assert statistics["normality"]["dagostino_pval"] == pytest.approx(
+        normaltest(residuals).pvalue, rel=1e-6
+    )
+    assert statistics["normality"]["jarque_bera_pval"] == pytest.approx(
+        jarque_bera(residuals).pvalue, rel=1e-6
+    )
+
+
+def test_residuals_refer_to_latest_batch():
+    df = simulated_data.generate_linear_data(n_samples=300, seed=2)
+    model = IncrementalLinearModelWrapper(df["x"][:200], df["y"][:200]).fit()
+    model.append(df["x"][200:], df["y"][200:])
+
+    np.testing.assert_allclose(model.residuals() + model.fitted(), df["y"][200:].values)
+    results = results_from_statistics(model.diagnostics())
+    assert results["linearity"].passed
+
+
+def test_default_keeps_only_second_moments():
+    """
+    By default only the (p + 2)² Gram matrix is kept and residual checks
+    that need fourth moments are skipped.
+    """
+    df = simulated_data.generate_multivariate_data(n_samples=300, n_features=20)
+    model = IncrementalLinearModelWrapper(df.drop(columns="y"), df["y"]).fit()
+    assert model.accumulator.order == 2
+    assert model.accumulator._moments.shape == (22, 22)
+    assert set(model.diagnostics()) == {"multicollinearity"}
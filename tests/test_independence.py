@@ -0,0 +1,81 @@
+# tests/test_independence.py
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.stats.diagnostic import acorr_ljungbox
+from statsmodels.stats.stattools import durbin_watson
+from statsmodels.tsa.stattools import acf
+
+from app.config import get_thresholds
+from app.core import independence
+from app.core.evaluation import rethreshold_result
+from app.data import simulated_data
+
+
+def _ar1_data(n: int, phi: float, seed: int = 0) -> pd.DataFrame:
+    """Linear data whose errors follow an AR(1) process."""
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=n)
+    shocks = rng.normal(size=n)
+    errors = np.empty(n)
+    errors[0] = shocks[0]
+    for t in range(1, n):
+        errors[t] = phi * errors[t - 1] + shocks[t]
+    return pd.DataFrame({"x": x, "y": 3 * x + errors})
+
+
+def test_independence_check_passes_on_linear_data():
+    """
+    Test that independent errors pass both Ljung-Box and Durbin-Watson.
+    """
+    df = simulated_data.generate_linear_data(n_samples=500, seed=42)
+    result = independence.check_independence(df["x"], df["y"])
+    assert result.passed
+    assert 1.5 <= result.details["durbin_watson"] <= 2.5
+    assert result.statistics["ljung_box_lags"] == 40
+
+
+def test_independence_check_fails_on_autocorrelated_errors():
+    """
+    Test that AR(1) errors fail the check and the result carries a plot.
+    """
+    df = _ar1_data(500, phi=0.7)
+    result = independence.check_independence(df["x"], df["y"], return_plot=True)
+    assert not result.passed
+    assert result.details["durbin_watson"] < 1.5
+    assert result.statistics["acf_lag1"] > 0.5
+    assert result.plot_base64.startswith("iVBOR")
+
+
+@pytest.mark.parametrize("n", [7, 101, 3000])
+def test_fft_statistics_match_statsmodels(n):
+    """
+    Test that the one-pass FFT statistics equal statsmodels' per-lag versions,
+    including residuals with a non-zero mean.
+    """
+    rng = np.random.default_rng(n)
+    residuals = np.convolve(rng.normal(size=n) + 0.3, [1.0, 0.5], "same")
+    lags = max(1, min(40, n // 5))
+
+    statistics = independence.independence_statistics(residuals)
+    expected = acorr_ljungbox(residuals, lags=[lags])
+    np.testing.assert_allclose(
+        independence.acf_fft(residuals, lags),
+        acf(residuals, nlags=lags, fft=False),
+        atol=1e-12,
+    )
+    assert statistics["durbin_watson"] == pytest.approx(durbin_watson(residuals))
+    assert statistics["ljung_box_stat"] == pytest.approx(expected["lb_stat"].iloc[0])
+    assert statistics["ljung_box_pval"] == pytest.approx(expected["lb_pvalue"].iloc[0])
+
+
+def test_independence_rethresholds_durbin_watson_bounds():
+    """
+    Test that widening the Durbin-Watson bounds and lowering the p-value
+    threshold re-judges a result without recomputing it.
+    """
+    df = _ar1_data(300, phi=0.3, seed=1)
+    result = independence.check_independence(df["x"], df["y"])
+    assert not result.passed
+    lenient = get_thresholds(durbin_watson_bounds=(0.5, 3.5), independence_pval=0.0)
+    assert rethreshold_result(result, lenient).passed
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from app.models.linear_model_wrapper import LinearModelWrapper
 
@@ -48,3 +49,34 @@ def test_linear_wrapper_summary():
     assert "model_type" in summary
     assert summary["model_type"].lower() == "linear regression"
     assert 0 <= summary["r_squared"] <= 1
+
+
+@pytest.mark.parametrize("with_constant", [False, True])
+def test_numpy_engine_matches_statsmodels(with_constant):
+    """
+    The default NumPy engine reproduces statsmodels' OLS numbers.
+    """
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, 3)), columns=["a", "b", "c"])
+    y = pd.Series(X @ [1.0, -2.0, 0.5] + rng.normal(size=200), name="y")
+    if with_constant:
+        X.insert(0, "intercept", 1.0)
+
+    lean = LinearModelWrapper(X, y).fit()
+    full = LinearModelWrapper(X, y, engine="statsmodels").fit()
+
+    assert lean.engine == "numpy"
+    assert list(lean.design.columns) == list(full.design.columns)
+    pd.testing.assert_series_equal(lean.model.params, full.model.params)
+    np.testing.assert_allclose(lean.residuals(), full.residuals(), atol=1e-10)
+    np.testing.assert_allclose(lean.predict(), full.predict(), atol=1e-10)
+    assert lean.model.rsquared == pytest.approx(full.model.rsquared)
+    assert lean.fitted().index.equals(y.index)
+
+
+def test_unknown_engine_raises():
+    """
+    Unknown engines are rejected up front.
+    """
+    with pytest.raises(ValueError, match="Unsupported engine"):
+        LinearModelWrapper(pd.DataFrame({"x": [1.0, 2.0]}), pd.Series([1, 2]), "R")
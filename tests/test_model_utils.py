@@ -28,3 +28,15 @@ def test_get_model_wrapper_invalid_type():
 
     with pytest.raises(ValueError, match="Unsupported model type"):
         get_model_wrapper("invalid_type", X, y)
+
+
+def test_get_model_wrapper_engine():
+    """
+    get_model_wrapper passes the engine through to the linear wrapper.
+    """
+    X = pd.DataFrame({"x1": np.random.randn(30)})
+    y = 2 * X["x1"] + np.random.randn(30)
+
+    wrapper = get_model_wrapper("linear", X, y, engine="statsmodels")
+    assert wrapper.engine == "statsmodels"
+    assert hasattr(wrapper.model, "bse")
@@ -1,8 +1,14 @@
 import numpy as np
 import pandas as pd
+import pytest
 
-from app.config import VIF_THRESHOLD
-from app.core.multicollinearity import check_multicollinearity
+from app.config import VIF_THRESHOLD, get_thresholds
+from app.core.multicollinearity import (
+    check_multicollinearity,
+    compute_vif,
+    evaluate_multicollinearity,
+    max_vif,
+)
 
 
 def test_single_feature_skips_check():
@@ -79,3 +85,46 @@ def test_plot_is_returned():
 
     result = check_multicollinearity(X, y, return_plot=True)
     assert result.plot_base64 is not None
+
+
+def test_compute_vif_matches_auxiliary_regressions():
+    import statsmodels.api as sm
+    from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, 5)), columns=list("abcde"))
+    X["e"] = X["a"] + 0.3 * X["b"] + rng.normal(0, 0.2, size=200)
+
+    design = sm.add_constant(X).values
+    expected = [variance_inflation_factor(design, i + 1) for i in range(5)]
+    np.testing.assert_allclose(compute_vif(X.corr().values), expected, rtol=1e-8)
+
+
+def test_compute_vif_handles_singular_and_constant_columns():
+    rng = np.random.default_rng(0)
+    x1, x3 = rng.normal(size=100), rng.normal(size=100)
+    X = pd.DataFrame({"x1": x1, "x2": 2 * x1, "x3": x3, "c": np.ones(100)})
+
+    vif = compute_vif(X.corr().values)
+
+    assert np.isinf(vif[0]) and np.isinf(vif[1])
+    assert vif[2] == pytest.approx(1.0, abs=0.1)
+    assert np.isnan(vif[3])
+
+
+def test_constant_feature_verdict_is_order_independent():
+    """
+    A NaN VIF from a constant column neither hides nor becomes the maximum.
+    """
+    thresholds = get_thresholds()
+    forward = {"a": 1.2, "const": float("nan"), "b": 7.5}
+    backward = dict(reversed(list(forward.items())))
+    verdicts = [
+        evaluate_multicollinearity({"vif": vifs}, thresholds)
+        for vifs in (forward, backward)
+    ]
+    for verdict in verdicts:
+        assert verdict["details"]["max_variance_inflation_factor"] == 7.5
+        assert verdict["details"]["constant_features"] == ["const"]
+        assert not verdict["passed"] and verdict["severity"] == "high"
+    assert np.isnan(max_vif({"const": float("nan")}))
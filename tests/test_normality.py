@@ -1,3 +1,8 @@
+import numpy as np
+import pytest
+from scipy.stats import anderson, jarque_bera, normaltest
+
+from app import config
 from app.core import normality
 from app.data import simulated_data
 from app.models.linear_model_wrapper import LinearModelWrapper
@@ -46,3 +51,58 @@ def test_normality_with_model_wrapper():
 
     result = normality.check_normality(df["x"], df["y"], model_wrapper=wrapper)
     assert "shapiro_pval" in result.details
+
+
+def test_normality_large_sample_mode(monkeypatch):
+    """
+    Above NORMALITY_LARGE_N the check subsamples, and reports the method used.
+    """
+    monkeypatch.setattr(config, "NORMALITY_LARGE_N", 500)
+    monkeypatch.setattr(config, "NORMALITY_SUBSAMPLE_SIZE", 200)
+    df = simulated_data.generate_linear_data(n_samples=2000, seed=42)
+    result = normality.check_normality(df["x"], df["y"], return_plot=True)
+
+    assert result.passed
+    assert result.details["method"] == "subsample"
+    assert result.details["sample_size"] == 2000
+    assert result.details["subsample_size"] == 200
+    assert result.details["dagostino_pval"] == pytest.approx(
+        normaltest(result.residuals).pvalue, rel=1e-6
+    )
+    assert all(plot["image"].startswith("iVBOR") for plot in result.plots)
+
+    small = normality.check_normality(df["x"][:400], df["y"][:400])
+    assert small.details["method"] == "full"
+
+
+def test_batched_normality_kernels_match_scipy_per_column():
+    """
+    Test that the (n, k) kernels equal scipy's per-column tests.
+    """
+    rng = np.random.default_rng(1)
+    residuals = np.column_stack(
+        [
+            rng.normal(size=300),
+            rng.exponential(size=300),
+            rng.standard_t(4, size=300),
+        ]
+    )
+
+    statistic, critical = normality.anderson_darling_batch(residuals)
+    moments = normality.dagostino_jarque_bera_batch(residuals)
+    for j in range(3):
+        reference = anderson(residuals[:, j], dist="norm")
+        assert statistic[j] == pytest.approx(reference.statistic, rel=1e-10)
+        assert critical == reference.critical_values[2]
+        assert moments["dagostino_pval"][j] == pytest.approx(
+            normaltest(residuals[:, j]).pvalue, rel=1e-8, abs=1e-300
+        )
+        assert moments["jarque_bera_stat"][j] == pytest.approx(
+            jarque_bera(residuals[:, j]).statistic, rel=1e-10
+        )
+
+    # A matrix gives per-column arrays; a vector gives plain floats
+    batched = normality.normality_statistics(residuals)
+    single = normality.normality_statistics(residuals[:, 1])
+    assert batched["shapiro_pval"][1] == pytest.approx(single["shapiro_pval"])
+    assert isinstance(single["anderson_stat"], float)
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from app.core.cache import ResultCache
+from app.core.dispatcher import check_assumption, run_all_checks
+from app.core.profiling import RUN_PROFILE, Profiler, phase
+from app.data.simulated_data import generate_linear_data
+
+
+def test_nested_phases_report_exclusive_times():
+    """
+    Time spent in a nested phase is counted under that phase only.
+    """
+    profiler = Profiler()
+    with profiler.activate(), profiler.phase("statistics"):
+        time.sleep(0.02)
+        with phase("fit"):
+            time.sleep(0.05)
+
+    profile = profiler.to_dict()
+    assert 0.04 <= profile["fit"]["wall_s"] < profile["total"]["wall_s"]
+    assert profile["statistics"]["wall_s"] < 0.045
+    total = profile["fit"]["wall_s"] + profile["statistics"]["wall_s"]
+    assert total == pytest.approx(profile["total"]["wall_s"])
+
+
+def test_check_assumption_profiles_every_phase():
+    """
+    A standalone check fits, computes, draws and encodes, and reports each
+    phase with CPU time and peak memory to the result and to callbacks.
+    """
+    df = generate_linear_data(n_samples=200, seed=0)
+    seen = []
+    result = check_assumption(
+        "normality",
+        df[["x"]],
+        df["y"],
+        return_plot=True,
+        profile=True,
+        callbacks=[lambda name, profile: seen.append((name, profile))],
+    )
+
+    assert {"fit", "statistics", "plotting", "encoding"} <= set(result.profile)
+    assert all(entry["peak_bytes"] > 0 for entry in result.profile.values())
+    assert result.profile["encoding"]["calls"] == 2  # Q-Q plot and histogram
+    assert seen == [("normality", result.profile)]
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_run_all_checks_reports_shared_fit_separately(executor):
+    """
+    Shared intermediates are profiled once at run level; 'time' mode skips
+    memory tracing.
+    """
+    df = generate_linear_data(n_samples=200, seed=0)
+    seen = {}
+    results, _ = run_all_checks(
+        df[["x"]],
+        df["y"],
+        model_type="linear",
+        executor=executor,
+        profile="time",
+        callbacks=[seen.__setitem__],
+    )
+
+    assert list(seen) == [*results, RUN_PROFILE]
+    assert "fit" in seen[RUN_PROFILE]
+    for result in results.values():
+        assert "fit" not in result.profile
+        assert result.profile["statistics"]["peak_bytes"] is None
+
+
+def test_profiles_are_not_cached_and_mode_is_validated():
+    """
+    Cache hits carry no stale profile, and unknown modes are rejected.
+    """
+    df = generate_linear_data(n_samples=100, seed=0)
+    cache = ResultCache()
+    args = (df[["x"]], df["y"])
+    first, _ = run_all_checks(*args, model_type="linear", cache=cache, profile=True)
+    again, _ = run_all_checks(*args, model_type="linear", cache=cache, profile=True)
+
+    assert first["normality"].profile is not None
+    assert again["normality"].profile is None
+    with pytest.raises(ValueError):
+        run_all_checks(*args, model_type="linear", profile="gpu")
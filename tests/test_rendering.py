@@ -0,0 +1,83 @@
+import base64
+import os
+
+import numpy as np
+import pytest
+
+from app.core import dispatcher
+from app.core.linearity import check_linearity
+from app.core.rendering import PlotRenderer, PlotSpec, RenderOptions, render_spec
+from app.data import simulated_data
+
+
+def _spec():
+    rng = np.random.default_rng(0)
+    return PlotSpec(
+        "residuals_vs_fitted",
+        (rng.normal(size=100), rng.normal(size=100)),
+        title="Residuals vs Fitted",
+    )
+
+
+@pytest.mark.parametrize(
+    "fmt, magic", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("webp", b"RIFF")]
+)
+def test_render_spec_formats(fmt, magic):
+    """
+    Each supported format renders to bytes with the right file signature.
+    """
+    data = render_spec(_spec(), RenderOptions(format=fmt, dpi=50, target="bytes"))
+    assert data.startswith(magic)
+
+
+def test_render_spec_targets(tmp_path):
+    """
+    Base64 decodes to the raw bytes; the directory target is content-addressed.
+    """
+    spec = _spec()
+    raw = render_spec(spec, RenderOptions(target="bytes"))
+    assert base64.b64decode(render_spec(spec)) == raw
+
+    options = RenderOptions(target="directory", directory=str(tmp_path))
+    path = render_spec(spec, options)
+    assert render_spec(spec, options) == path
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+    with open(path, "rb") as f:
+        assert f.read() == raw
+
+    with pytest.raises(ValueError):
+        RenderOptions(format="gif")
+
+
+def test_renderer_pool_matches_inline_render():
+    """
+    Figures rendered on the worker pool equal synchronous renders.
+    """
+    spec = _spec()
+    with PlotRenderer(RenderOptions(target="bytes"), max_workers=1) as renderer:
+        assert renderer.render(spec) == render_spec(spec, renderer.options)
+
+
+def test_run_all_checks_resolves_pooled_plots():
+    """
+    Pooled runs return images, not specs, and share one residual figure.
+    """
+    df = simulated_data.generate_linear_data(n_samples=200, seed=1)
+    options = RenderOptions(format="svg", target="bytes")
+    results, _ = dispatcher.run_all_checks(
+        df["x"],
+        df["y"],
+        model_type="linear",
+        return_plot=True,
+        executor="process",
+        max_workers=1,
+        render_options=options,
+    )
+    image = results["linearity"].plot_base64
+    assert isinstance(image, bytes) and image.startswith(b"<?xml")
+    assert results["homoscedasticity"].plot_base64 == image
+    assert all(isinstance(plot["image"], bytes) for plot in results["normality"].plots)
+
+    # Standalone calls render synchronously with the configured defaults
+    standalone = check_linearity(df["x"], df["y"], return_plot=True)
+    assert standalone.plot_base64.startswith("iVBOR")
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import jarque_bera, normaltest
+from statsmodels.stats.diagnostic import het_breuschpagan
+
+from app.core.dispatcher import run_all_checks
+from app.core.rolling import rolling_checks
+from app.data import simulated_data
+from app.models.linear_model_wrapper import LinearModelWrapper
+
+
+def _series(n=600, seed=5):
+    df = simulated_data.generate_multicollinear_data(n_samples=n, seed=seed)
+    index = pd.date_range("2024-01-01", periods=n, freq="h")
+    return df.drop(columns="y").set_index(index), df["y"].set_axis(index)
+
+
+def test_rolling_window_matches_refit():
+    """
+    Every sliding window matches a from-scratch fit of the same rows,
+    including windows after the accumulator has been reseeded.
+    """
+    X, y = _series()
+    table = rolling_checks(X, y, window=150, step=40)
+
+    assert list(table.index) == list(X.index[149::40])
+    for label in table.index[[0, 4, -1]]:
+        end = X.index.get_loc(label) + 1
+        Xw, yw = X.iloc[end - 150 : end], y.iloc[end - 150 : end]  # noqa: E203
+        reference = LinearModelWrapper(Xw, yw).fit()
+        residuals = reference.residuals()
+        row = table.loc[label]
+
+        assert row["r_squared"] == pytest.approx(reference.model.rsquared)
+        assert row["breusch_pagan_pval"] == pytest.approx(
+            het_breuschpagan(residuals, reference.design)[1], rel=1e-6
+        )
+        assert row["dagostino_pval"] == pytest.approx(
+            normaltest(residuals).pvalue, rel=1e-6
+        )
+        assert row["jarque_bera_pval"] == pytest.approx(
+            jarque_bera(residuals).pvalue, rel=1e-6
+        )
+
+
+def test_expanding_window_agrees_with_run_all_checks():
+    """
+    The last expanding window covers all rows and agrees with run_all_checks.
+    """
+    X, y = _series(n=300)
+    table = rolling_checks(X, y, window=100, step=50, expanding=True)
+    by_name, _ = run_all_checks(X, y, model_type="linear")
+
+    last = table.iloc[-1]
+    assert len(table) == 5
+    assert last["breusch_pagan_pval"] == pytest.approx(
+        by_name["homoscedasticity"].details["breusch_pagan_pval"], rel=1e-6
+    )
+    assert last["max_variance_inflation_factor"] == pytest.approx(
+        max(by_name["multicollinearity"].statistics["vif"].values())
+    )
+    for name in ("homoscedasticity", "multicollinearity"):
+        assert last[f"{name}_passed"] == by_name[name].passed
+
+
+def test_parallel_segments_match_serial():
+    """
+    Splitting the windows across worker processes gives the same table.
+    """
+    X, y = _series(n=400)
+    serial = rolling_checks(X, y, window=100, step=25)
+    parallel = rolling_checks(X, y, window=100, step=25, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_invalid_window():
+    """
+    Windows larger than the data or non-positive steps are rejected.
+    """
+    X, y = _series(n=50)
+    with pytest.raises(ValueError):
+        rolling_checks(X, y, window=51)
+    with pytest.raises(ValueError):
+        rolling_checks(X, y, window=10, step=0)
+    assert np.isfinite(rolling_checks(X, y, window=50)["r_squared"]).all()
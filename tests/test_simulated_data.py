@@ -1,5 +1,7 @@
 # tests/test_simulated_data.py
 import numpy as np
+import pandas as pd
+import pytest
 import statsmodels.api as sm
 
 from app.data import simulated_data
@@ -54,3 +56,114 @@ def test_generate_nonlinear_data_range():
     """
     df = simulated_data.generate_nonlinear_data()
     assert df["x"].between(-3, 3).all()
+
+
+def test_generate_multivariate_data_recovers_shape():
+    """
+    Test that multivariate data has one column per feature plus 'y'.
+    """
+    df = simulated_data.generate_multivariate_data(n_samples=50, n_features=4, seed=1)
+    assert list(df.columns) == ["x0", "x1", "x2", "x3", "y"]
+    assert len(df) == 50
+
+
+def test_generators_accept_seed_sequences_and_do_not_touch_global_state():
+    """
+    Test that SeedSequence/Generator seeds reproduce data without using np.random.
+    """
+    np.random.seed(0)
+    state = np.random.get_state()[1].copy()
+    seq = np.random.SeedSequence(5)
+    for name, generate in simulated_data.list_simulations().items():
+        a = generate(n_samples=20, seed=seq)
+        b = generate(n_samples=20, seed=np.random.default_rng(seq))
+        pd.testing.assert_frame_equal(a, b)
+    assert (np.random.get_state()[1] == state).all()
+
+
+def test_float32_output():
+    """
+    Test that dtype=float32 applies to every column.
+    """
+    df = simulated_data.generate_multivariate_data(n_samples=30, dtype=np.float32)
+    assert (df.dtypes == np.float32).all()
+    with pytest.raises(ValueError):
+        simulated_data.generate_linear_data(dtype=np.int64)
+
+
+def test_iter_simulated_data_chunks_are_reproducible():
+    """
+    Test that chunks cover every row once and repeat for the same seed.
+    """
+    chunks = list(
+        simulated_data.iter_simulated_data(
+            "multivariate", 2500, chunk_size=1000, seed=3, n_features=3
+        )
+    )
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+    full = pd.concat(chunks)
+    assert list(full.index) == list(range(2500))
+    again = pd.concat(
+        simulated_data.iter_simulated_data(
+            "multivariate", 2500, chunk_size=1000, seed=3, n_features=3
+        )
+    )
+    pd.testing.assert_frame_equal(full, again)
+    # Coefficients are shared: one regression fits every chunk
+    X = np.column_stack([np.ones(2500), full[["x0", "x1", "x2"]]])
+    residuals = full["y"] - X @ np.linalg.lstsq(X, full["y"], rcond=None)[0]
+    assert residuals.std() < 1.1
+
+
+def test_write_simulated_data_npy_matches_chunks(tmp_path):
+    """
+    Test that the memory-mapped .npy file holds the streamed chunks.
+    """
+    path = str(tmp_path / "data.npy")
+    columns = simulated_data.write_simulated_data(
+        "skewed", path, 1234, chunk_size=500, seed=9, dtype=np.float32
+    )
+    stored = np.load(path, mmap_mode="r")
+    expected = pd.concat(
+        simulated_data.iter_simulated_data(
+            "skewed", 1234, chunk_size=500, seed=9, dtype=np.float32
+        )
+    )
+    assert columns == ["x", "y"] and stored.dtype == np.float32
+    np.testing.assert_array_equal(stored, expected.to_numpy())
+    with pytest.raises(ValueError):
+        simulated_data.write_simulated_data("linear", str(tmp_path / "d.csv"), 10)
+
+
+def test_write_simulated_data_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    """
+    Test that Parquet output round-trips with pyarrow and explains itself without.
+    """
+    path = str(tmp_path / "data.parquet")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="pyarrow"):
+            simulated_data.write_simulated_data("linear", path, 100)
+        return
+    simulated_data.write_simulated_data("linear", path, 2500, chunk_size=1000, seed=1)
+    expected = pd.concat(
+        simulated_data.iter_simulated_data("linear", 2500, chunk_size=1000, seed=1)
+    )
+    np.testing.assert_array_equal(pd.read_parquet(path).to_numpy(), expected.to_numpy())
+
+
+def test_iter_simulated_data_accepts_generator_seed():
+    """
+    Test that a Generator seed yields independent, reproducible chunk streams.
+    """
+
+    def chunks():
+        rng = np.random.default_rng(4)
+        return pd.concat(
+            simulated_data.iter_simulated_data("linear", 300, chunk_size=100, seed=rng)
+        )
+
+    first, second = chunks(), chunks()
+    pd.testing.assert_frame_equal(first, second)
+    assert not np.allclose(first["x"].iloc[:100], first["x"].iloc[100:200])
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core import dispatcher
+from app.data import simulated_data
+from app.report import generate_report
+from app.store import _SCHEMA, ResultStore
+
+
+@pytest.fixture(scope="module")
+def runs():
+    linear = simulated_data.generate_linear_data(n_samples=200, seed=1)
+    skewed = simulated_data.generate_skewed_data(n_samples=200, seed=1)
+    return {
+        name: dispatcher.run_all_checks(df["x"], df["y"], model_type="linear")[0]
+        for name, df in (("linear", linear), ("skewed", skewed))
+    }
+
+
+def test_bulk_insert_and_filtered_queries(tmp_path, runs):
+    """
+    Bulk-inserted runs can be filtered by dataset, check, verdict and time.
+    """
+    last_month = datetime(2026, 9, 15, tzinfo=timezone.utc)
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        store.add_runs(
+            [
+                (runs["linear"], "linear", "linear"),
+                (runs["skewed"], "skewed", "linear"),
+            ],
+            created_at=last_month,
+        )
+        store.add_run(runs["linear"], "linear", "linear")
+
+        assert len(store.query()) == 3 * len(runs["linear"])
+        assert len(store.query(dataset_id="linear")) == 2 * len(runs["linear"])
+
+        failed = store.query(check="normality", passed=False)
+        assert set(failed["dataset_id"]) == {"skewed"}
+        assert not failed["passed"].any()
+
+        september = store.query(
+            since=last_month - timedelta(days=15), until=last_month + timedelta(days=15)
+        )
+        assert set(september["dataset_id"]) == {"linear", "skewed"}
+        assert len(september) == 2 * len(runs["linear"])
+
+
+def test_key_statistics_columns(runs):
+    """
+    Key raw statistics are stored as numeric columns, NULL where not applicable.
+    """
+    store = ResultStore()
+    store.add_run(runs["linear"], "linear", "linear")
+    rows = store.query().set_index("check_name")
+
+    expected = runs["linear"]["homoscedasticity"].statistics["breusch_pagan_pval"]
+    assert rows.loc["homoscedasticity", "breusch_pagan_pval"] == pytest.approx(expected)
+    assert rows.loc["linearity", "r_squared"] == pytest.approx(
+        runs["linear"]["linearity"].statistics["r_squared"]
+    )
+    assert rows["max_vif"].isna().all()
+
+
+def test_generate_report_appends_to_store(capsys):
+    """
+    generate_report records its run under the given dataset id.
+    """
+    df = simulated_data.generate_linear_data(n_samples=100, seed=3)
+    store = ResultStore()
+    generate_report(df["x"], df["y"], model_type="linear", store=store, dataset_id="d1")
+    assert set(store.query()["dataset_id"]) == {"d1"}
+
+
+def test_older_databases_gain_new_statistic_columns(tmp_path, runs):
+    """
+    Opening a database created before a key statistic existed adds its column.
+    """
+    import sqlite3
+
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA.replace("ljung_box_pval REAL,", ""))
+    conn.close()
+
+    with ResultStore(path) as store:
+        store.add_run(runs["linear"], "linear", "linear")
+        rows = store.query(check="independence")
+        assert rows["ljung_box_pval"].notna().all()
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import normaltest
+from statsmodels.stats.diagnostic import het_breuschpagan
+
+from app.core import dispatcher
+from app.core.streaming import run_streaming_checks
+from app.data import simulated_data
+from app.models.linear_model_wrapper import LinearModelWrapper
+from app.models.streaming_model_wrapper import StreamingLinearModelWrapper
+
+
+def _chunks(df, size):
+    return [chunk for _, chunk in df.groupby(np.arange(len(df)) // size)]
+
+
+def test_streaming_fit_matches_in_memory_ols():
+    """
+    Coefficients, R² and residuals match statsmodels, even with large offsets.
+    """
+    df = simulated_data.generate_heteroscedastic_data(n_samples=1000, seed=3)
+    df = df + 1e6
+    wrapper = StreamingLinearModelWrapper(_chunks(df, 128)).fit()
+    reference = LinearModelWrapper(df[["x"]], df["y"]).fit()
+
+    np.testing.assert_allclose(wrapper.coefficients, reference.model.params)
+    assert wrapper.r_squared == pytest.approx(reference.model.rsquared)
+    np.testing.assert_allclose(
+        wrapper.residuals(), reference.residuals(), rtol=1e-6, atol=1e-6
+    )
+
+
+def test_streaming_checks_match_in_memory_checks():
+    """
+    Streamed statistics reproduce the in-memory check statistics.
+    """
+    df = simulated_data.generate_multicollinear_data(n_samples=2000, seed=5)
+    X, y = df.drop(columns="y"), df["y"]
+
+    results, wrapper = run_streaming_checks(lambda: iter(_chunks(df, 300)))
+    expected, model = dispatcher.run_all_checks(X, y, model_type="linear")
+
+    residuals = model.residuals()
+    _, bp_pval, _, _ = het_breuschpagan(residuals, model.design)
+    assert list(results) == ["homoscedasticity", "multicollinearity", "normality"]
+    assert results["homoscedasticity"].details["breusch_pagan_pval"] == (
+        pytest.approx(bp_pval)
+    )
+    assert results["normality"].details["dagostino_pval"] == pytest.approx(
+        normaltest(residuals).pvalue
+    )
+    assert results["multicollinearity"].details["x1 (VIF)"] == pytest.approx(
+        expected["multicollinearity"].details["x1 (VIF)"], rel=1e-6
+    )
+    assert results["multicollinearity"].passed is False
+    assert wrapper.summary()["n_obs"] == 2000
+
+
+def test_streaming_linearity_for_single_predictor():
+    df = simulated_data.generate_linear_data(n_samples=500, seed=1)
+    results, _ = run_streaming_checks(_chunks(df, 64))
+    expected = dispatcher.check_assumption("linearity", df["x"], df["y"])
+    assert results["linearity"].details["r_squared"] == pytest.approx(
+        expected.details["r_squared"]
+    )
+    assert "multicollinearity" not in results
+
+
+def test_single_pass_iterator_is_rejected():
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0], "y": [1.0, 2.0, 4.0]})
+    with pytest.raises(ValueError, match="re-iterable"):
+        StreamingLinearModelWrapper(iter([df]))
@@ -0,0 +1,100 @@
+import dataclasses
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from app.core import dispatcher
+from app.data import simulated_data
+from app.report import export_to_json, export_to_ndjson, load_ndjson_report
+
+
+@pytest.mark.parametrize("executor", ["serial", "process"])
+def test_results_share_one_array_store(executor):
+    """
+    Every residual-based result points at the same RunArrays, even from workers.
+    """
+    df = simulated_data.generate_linear_data(n_samples=200, seed=7)
+    results, wrapper = dispatcher.run_all_checks(
+        df["x"], df["y"], model_type="linear", executor=executor, max_workers=2
+    )
+    arrays = {id(r.arrays) for r in results.values() if r.arrays is not None}
+    assert len(arrays) == 1
+    np.testing.assert_allclose(results["normality"].residuals, wrapper.residuals())
+    assert isinstance(results["linearity"].fitted, np.ndarray)
+
+
+def test_summary_only_results_are_frozen_and_small():
+    """
+    keep_arrays=False drops per-row arrays; results are immutable and picklable.
+    """
+    df = simulated_data.generate_linear_data(n_samples=500, seed=7)
+    full, _ = dispatcher.run_all_checks(df["x"], df["y"], model_type="linear")
+    summary, _ = dispatcher.run_all_checks(
+        df["x"], df["y"], model_type="linear", keep_arrays=False
+    )
+
+    assert all(r.arrays is None and r.residuals is None for r in summary.values())
+    assert summary["normality"].details == full["normality"].details
+    assert len(pickle.dumps(summary)) < len(pickle.dumps(full)) / 4
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        summary["normality"].passed = False
+    assert pickle.loads(pickle.dumps(full))["linearity"].summary == (
+        full["linearity"].summary
+    )
+
+
+def test_summary_only_runs_never_build_run_arrays(monkeypatch):
+    """
+    keep_arrays=False skips the shared RunArrays instead of dropping it later.
+    """
+    from app.core import context
+
+    def fail(*args, **kwargs):
+        raise AssertionError("RunArrays built for a summary-only run")
+
+    monkeypatch.setattr(context.RunArrays, "from_values", fail)
+    df = simulated_data.generate_linear_data(n_samples=200, seed=11)
+    results, _ = dispatcher.run_all_checks(
+        df["x"], df["y"], model_type="linear", keep_arrays=False
+    )
+    assert all(r.arrays is None for r in results.values())
+
+
+def test_export_to_json_without_dict(tmp_path):
+    """
+    JSON export works on slotted results and optionally includes arrays.
+    """
+    df = simulated_data.generate_linear_data(n_samples=50, seed=7)
+    results, _ = dispatcher.run_all_checks(df["x"], df["y"], model_type="linear")
+    path = tmp_path / "report.json"
+
+    export_to_json(results, filename=str(path), include_arrays=True)
+    payload = json.loads(path.read_text())
+    assert payload["linearity"]["passed"] == results["linearity"].passed
+    assert len(payload["normality"]["residuals"]) == 50
+
+
+def test_ndjson_export_round_trip(tmp_path):
+    """
+    NDJSON + .npy sidecars load back with memory-mapped, shared arrays.
+    """
+    df = simulated_data.generate_linear_data(n_samples=300, seed=7)
+    results, _ = dispatcher.run_all_checks(df["x"], df["y"], model_type="linear")
+    path = export_to_ndjson(results, filename=str(tmp_path / "run.ndjson"))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "run.fitted.npy",
+        "run.ndjson",
+        "run.residuals.npy",
+    ]
+    loaded = load_ndjson_report(path)
+    assert list(loaded) == list(results)
+    assert loaded["normality"].summary == results["normality"].summary
+    assert loaded["normality"].passed == results["normality"].passed
+    assert isinstance(loaded["normality"].residuals, np.memmap)
+    assert loaded["linearity"].arrays is loaded["normality"].arrays
+    np.testing.assert_array_equal(
+        loaded["normality"].fitted, results["normality"].fitted
+    )
@@ -1,4 +1,18 @@
-from app.utils import build_result
+import pickle
+
+import matplotlib.pyplot as plt
+import numpy as np
+from scipy.stats import norm
+
+from app import config
+from app.utils import (
+    PlotRegistry,
+    binned_quantiles,
+    build_result,
+    plot_qq,
+    plot_residuals_vs_fitted,
+    qq_quantiles,
+)
 
 
 def test_build_result_returns_valid_assumption_result():
@@ -20,3 +34,87 @@ def test_build_result_returns_valid_assumption_result():
     assert result.summary == "This is a test."
     assert result.details["mock_stat"] == 0.99
     assert result.plots[0]["title"] == "Sample Plot"
+
+
+def test_binned_quantiles_tracks_median():
+    """
+    Per-bin medians follow the conditional median of y given x.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 10, 20000)
+    y = 2 * x + rng.normal(size=x.size)
+    centers, bands = binned_quantiles(x, y, n_bins=10)
+    assert bands.shape == (10, 3)
+    np.testing.assert_allclose(bands[:, 1], 2 * centers, atol=0.2)
+    assert (bands[:, 0] < bands[:, 1]).all() and (bands[:, 1] < bands[:, 2]).all()
+
+
+def test_qq_quantiles_of_normal_sample():
+    """
+    Sample quantiles of a normal sample sit close to the theoretical ones.
+    """
+    sample = norm.ppf((np.arange(1, 100001) - 0.5) / 100000)
+    theoretical, observed = qq_quantiles(sample, 50)
+    assert len(theoretical) == 50
+    np.testing.assert_allclose(observed, theoretical, atol=1e-3)
+
+
+def test_density_plots_above_threshold(monkeypatch):
+    """
+    Above PLOT_DENSITY_THRESHOLD, scatters become hexbins and Q-Q plots thin out.
+    """
+    monkeypatch.setattr(config, "PLOT_DENSITY_THRESHOLD", 100)
+    rng = np.random.default_rng(1)
+    fitted, residuals = rng.normal(size=500), rng.normal(size=500)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    plot_residuals_vs_fitted(ax1, fitted, residuals)
+    plot_qq(ax2, residuals)
+    assert ax1.collections and not any(
+        c.get_offsets().shape[0] == 500 for c in ax1.collections
+    )
+    assert len(ax2.lines[0].get_xdata()) == config.PLOT_QQ_POINTS
+    plt.close(fig)
+
+    fig, ax = plt.subplots()
+    plot_residuals_vs_fitted(ax, fitted[:50], residuals[:50])
+    assert ax.collections[0].get_offsets().shape[0] == 50
+    plt.close(fig)
+
+
+def test_plot_registry_renders_each_figure_once():
+    """
+    Identical (kind, arrays) requests reuse the first encoded image.
+    """
+    registry = PlotRegistry()
+    fitted, residuals = np.arange(5.0), np.ones(5)
+    calls = []
+
+    def render():
+        calls.append(1)
+        return f"image-{len(calls)}"
+
+    first = registry.get_or_render("residuals_vs_fitted", (fitted, residuals), render)
+    again = registry.get_or_render("residuals_vs_fitted", (fitted, residuals), render)
+    other = registry.get_or_render("qq", (residuals,), render)
+    assert first is again and other != first
+    assert (registry.renders, registry.hits, len(registry)) == (2, 1, 2)
+
+    # Picklable for process pools; copies keep the rendered images
+    copy = pickle.loads(pickle.dumps(registry))
+    assert copy.get_or_render("qq", (residuals,), render) == other
+
+
+def test_plot_registry_keeps_specs_with_different_options_apart():
+    """
+    Specs differing only in options (e.g. histogram bins) render separately.
+    """
+    from app.core.rendering import PlotSpec
+
+    registry = PlotRegistry()
+    values = np.random.default_rng(0).normal(size=50)
+    coarse = registry.request(PlotSpec("histogram", (values,), options={"bins": 5}))
+    fine = registry.request(PlotSpec("histogram", (values,), options={"bins": 40}))
+    again = registry.request(PlotSpec("histogram", (values,), options={"bins": 5}))
+    assert coarse != fine and coarse == again
+    assert (registry.renders, registry.hits) == (2, 1)